@@ -0,0 +1,146 @@
+"""Builds the fixture pages used by the benchmarks.
+
+The pages reproduce the structure of the source websites around the elements the scrapers look for
+(CineMaterial, MoviePosterDB, IMP Awards, YouTube, TasteDive, the Wikipedia API), surrounded by the navigation,
+scripts and result lists that make up most of a real page. They are generated so that they can be rebuilt
+deterministically.
+
+Usage:
+    python benchmarks/fixtures/build_fixtures.py
+"""
+
+import json
+import random
+from pathlib import Path
+
+from PIL import Image
+
+FIXTURES: Path = Path(__file__).resolve().parent
+TITLES: tuple = ("The Matrix", "Heat", "Alien", "Ronin", "Collateral", "Thief", "Sicario", "Arrival", "Drive", "Memento")
+
+
+def page(title: str, body: str, seed: int) -> str:
+    """Wraps a body in a page with a header, menus, scripts and a footer.
+
+    Args:
+        title (str): Page title.
+        body (str): Main content.
+        seed (int): Seed of the filler content.
+
+    Returns:
+        str: Page.
+    """
+
+    generator = random.Random(seed)
+    menu: str = "".join(f'<li class="nav-item"><a class="nav-link" href="/section/{index}">Section {index}</a></li>'
+                        for index in range(60))
+    scripts: str = "".join(
+        f'<script type="text/javascript">var config{index} = {{"id": {generator.randint(0, 10 ** 9)}, '
+        f'"values": [{", ".join(str(generator.random()) for _ in range(40))}]}};</script>\n' for index in range(40))
+    paragraphs: str = "".join(
+        f'<p class="text-muted">{" ".join(generator.choice(TITLES) for _ in range(60))}</p>\n' for _ in range(30))
+    return (f'<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n<title>{title}</title>\n{scripts}'
+            f'</head>\n<body>\n<header><nav><ul class="navbar-nav">{menu}</ul></nav></header>\n'
+            f'<main class="container">\n{body}\n</main>\n<aside>{paragraphs}</aside>\n'
+            f'<footer><ul>{menu}</ul></footer>\n</body>\n</html>\n')
+
+
+def cinematerial_search() -> str:
+    """Returns a CineMaterial search results page."""
+
+    rows: str = "".join(
+        f'<tr><td><img src="/media/{index}.jpg" width="40"></td>'
+        f'<td><a href="/movies/{title.lower().replace(" ", "-")}-{index}">{title}</a></td><td>{1970 + index}</td></tr>\n'
+        for index, title in enumerate(TITLES))
+    body: str = f'<h1>Search results</h1>\n<div class="table-responsive"><table class="table">{rows}</table></div>'
+    return page("Search - CineMaterial", body, 1)
+
+
+def cinematerial_poster() -> str:
+    """Returns a CineMaterial movie page."""
+
+    thumbnails: str = "".join(f'<div class="col"><a href="/p/{index}"><img src="/media/p/{index}s.jpg"></a></div>\n'
+                              for index in range(80))
+    body: str = ('<h1>The Matrix (1999)</h1>\n<div class="row">'
+                 '<img class="lazy" data-src="https://www.cinematerial.com/media/posters/md/matrix.jpg" alt="poster">'
+                 f'</div>\n<div class="row">{thumbnails}</div>')
+    return page("The Matrix - CineMaterial", body, 2)
+
+
+def imp_awards() -> str:
+    """Returns an IMP Awards movie page."""
+
+    boxes: str = "".join(f'<div class="rightsidesmallbordered"><a href="/1999/poster_{index}.html">Poster {index}</a>'
+                         f'</div>\n' for index in range(30))
+    body: str = (f'<h3>The Matrix (1999)</h3>\n{boxes}<div class="rightsidesmallbordered">'
+                 '<a href="https://www.imdb.com/title/tt0133093" target="_blank">IMDb</a></div>')
+    return page("The Matrix Movie Poster - IMP Awards", body, 3)
+
+
+def movieposterdb_search() -> str:
+    """Returns a MoviePosterDB search results page."""
+
+    results: str = "".join(
+        f'<div class="col-md-2"><a href="/{title.lower().replace(" ", "-")}-i{index}">'
+        f'<img class="vertical-image img-responsive poster_img lazyload" '
+        f'data-src="https://www.movieposterdb.com/posters/{index}.jpg" alt="{title}"></a></div>\n'
+        for index, title in enumerate(TITLES))
+    return page("Search - MoviePosterDB", f'<div class="row">{results}</div>', 4)
+
+
+def tastedive() -> str:
+    """Returns a TasteDive recommendations page, the recommendations are embedded in a script."""
+
+    data: str = json.dumps({"title": "The Matrix", "recommendations": "Dark City, Inception, Equilibrium"},
+                           separators=(",", ":"))
+    return page("Movies like The Matrix - TasteDive", f'<script id="__NEXT_DATA__">{data}</script>', 5)
+
+
+def wikipedia_api() -> str:
+    """Returns the response to the Wikipedia API query sent by WikipediaClient."""
+
+    wikitext: str = ("{{Infobox film\n| name = The Matrix\n| starring = {{Plainlist|\n* [[Keanu Reeves]]\n"
+                     "* [[Laurence Fishburne]]\n* [[Carrie-Anne Moss]]\n* [[Hugo Weaving]]\n}}\n"
+                     "| music = [[Don Davis (composer)|Don Davis]]\n}}\n"
+                     + "The Matrix is a 1999 science fiction action film. " * 40)
+    extract: str = ("The Matrix is a 1999 science fiction action film written and directed by the Wachowskis. "
+                    "It stars Keanu Reeves. It depicts a dystopian future.")
+    return json.dumps({"batchcomplete": True, "query": {"pages": [
+        {"pageid": 30007, "ns": 0, "title": "The Matrix", "index": 1, "extract": extract,
+         "revisions": [{"slots": {"main": {"contentmodel": "wikitext", "content": wikitext}}}]}]}})
+
+
+def youtube_results() -> str:
+    """Returns a YouTube search results page, the video identifiers are embedded in a script."""
+
+    generator = random.Random(6)
+    alphabet: str = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+    videos: list = [{"url": "/watch?v=" + "".join(generator.choice(alphabet) for _ in range(11)),
+                     "title": f"The Matrix trailer {index}"} for index in range(20)]
+    return page("The Matrix trailer - YouTube", f"<script>var ytInitialData = {json.dumps(videos)};</script>", 6)
+
+
+PAGES: dict = {
+    "cinematerial_search.html": cinematerial_search,
+    "cinematerial_poster.html": cinematerial_poster,
+    "impawards_page.html": imp_awards,
+    "movieposterdb_search.html": movieposterdb_search,
+    "tastedive_like.html": tastedive,
+    "wikipedia_api.json": wikipedia_api,
+    "youtube_results.html": youtube_results
+}
+
+
+def main() -> None:
+    """Writes every fixture page and a poster."""
+
+    for filename, build in PAGES.items():
+        Path(FIXTURES / filename).write_text(build(), encoding="UTF-8")
+
+    poster = Image.new("RGB", (300, 444))
+    poster.putdata([((x * 7) % 256, (y * 3) % 256, (x * y) % 256) for y in range(444) for x in range(300)])
+    poster.save(FIXTURES / "poster.jpg", quality=85)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Measures the import time of the main window module.
+
+Runs ``python -X importtime -c "import run"`` in a fresh interpreter, summarizes the modules with the highest
+cumulative import time and reports any heavy module that is imported at start-up although it should be loaded lazily.
+The summary is written to benchmarks/results/import_time.json.
+
+Usage:
+    python benchmarks/import_time.py [--top N] [--output PATH]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+RESULTS: Path = ROOT / "benchmarks" / "results" / "import_time.json"
+HEAVY_MODULES: tuple = ("requests", "wikipedia", "bs4", "PySide6.QtWebEngineWidgets", "PySide6.QtWebEngineCore")
+
+
+def measure(module: str = "run") -> list[tuple[str, int, int, int]]:
+    """Imports the module in a subprocess and parses the -X importtime report.
+    The subprocess uses an empty temporary user's folder, so that the real library is not read.
+
+    Args:
+        module (str): Module to import.
+
+    Returns:
+        list[tuple[str, int, int, int]]: (module, nesting depth, self time, cumulative time) with times in
+            microseconds, the depth being 0 for the top level imports.
+    """
+
+    with tempfile.TemporaryDirectory() as folder:
+        env: dict = dict(os.environ, QT_QPA_PLATFORM="offscreen", PYMOMAN_HOME=folder)
+        process = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                                 cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    return parse(process.stderr)
+
+
+def parse(report: str) -> list[tuple[str, int, int, int]]:
+    """Parses a -X importtime report, where nested imports are indented by two spaces per level.
+
+    Args:
+        report (str): Standard error of the interpreter.
+
+    Returns:
+        list[tuple[str, int, int, int]]: See measure().
+    """
+
+    timings: list = []
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, cumulative, name = line[len("import time:"):].split("|")
+        depth: int = (len(name) - len(name.lstrip()) - 1) // 2
+        timings.append((name.strip(), depth, int(self_time), int(cumulative)))
+    return timings
+
+
+def summarize(timings: list[tuple[str, int, int, int]], top: int = 20) -> dict:
+    """Builds the report of an import time measurement.
+
+    Args:
+        timings (list[tuple[str, int, int, int]]): Output of measure().
+        top (int): Number of modules to list.
+
+    Returns:
+        dict: Report.
+    """
+
+    imported: set = {name for name, _, _, _ in timings}
+    # Only the top level imports are counted, their cumulative time already includes the nested ones.
+    total: int = sum(cumulative for _, depth, _, cumulative in timings if depth == 0)
+    slowest: list = sorted(timings, key=lambda timing: timing[3], reverse=True)[:top]
+    return {"total_ms": round(total / 1000, 1),
+            "heavy_modules_at_startup": [module for module in HEAVY_MODULES if module in imported],
+            "slowest": [{"module": name, "self_ms": round(self_time / 1000, 1),
+                         "cumulative_ms": round(cumulative / 1000, 1)} for name, _, self_time, cumulative in slowest]}
+
+
+def main() -> int:
+    """Runs the benchmark and writes its report.
+
+    Returns:
+        int: 1 if a heavy module is imported at start-up, 0 otherwise.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=20, help="number of modules to report")
+    parser.add_argument("--output", type=Path, default=RESULTS, help="where to write the JSON report")
+    args = parser.parse_args()
+
+    report: dict = summarize(measure(), args.top)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=4) + "\n", encoding="utf-8")
+
+    print(f"Total import time: {report['total_ms']} ms")
+    for entry in report["slowest"]:
+        print(f"{entry['cumulative_ms']:>10} ms  {entry['module']}")
+    for module in report["heavy_modules_at_startup"]:
+        print(f"Warning: {module} is imported at start-up.")
+    return 1 if report["heavy_modules_at_startup"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,202 @@
+"""Benchmark of the hot paths of packages.logic on synthetic libraries, with a regression gate.
+
+For every library size (1k, 10k and 100k movies by default), a library is generated in a temporary folder
+by benchmarks/synthetic_library.py, and constants.PATHS are pointed to it.
+Every hot path is timed, the best of a few runs is kept, and the report is written to
+benchmarks/results/logic.json. '--save-baseline' also stores it as benchmarks/results/logic_baseline.json;
+'--check' compares it with that baseline and exits with 1 if a hot path slowed down by more than the threshold.
+The baseline is only meaningful on the machine where it was recorded.
+
+Usage:
+    python benchmarks/logic.py [--sizes 1000 10000 100000] [--repeat 3] [--save-baseline | --check]
+                               [--threshold 1.0]
+"""
+
+import argparse
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from PIL import Image
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+RESULTS: Path = ROOT / "benchmarks" / "results" / "logic.json"
+BASELINE: Path = ROOT / "benchmarks" / "results" / "logic_baseline.json"
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.synthetic_library import generate_library, write_cache_folder  # noqa: E402
+from packages.constants import constants  # noqa: E402
+from packages.logic import data_import, data_process  # noqa: E402
+from packages.logic.collection import Collection  # noqa: E402
+from packages.logic.movie import Movie  # noqa: E402
+
+SIZES: tuple = (1000, 10000, 100000)
+COLLECTIONS: int = 10  # The movies of a library are spread over this many collections.
+ADDED_MOVIES: int = 10  # Movies added to a full collection by the 'Collection.add_movie' benchmark.
+ORPHANS: float = 0.1  # Share of cache folders not belonging to a collection, removed by 'clear_cache'.
+POSTERS: int = 20  # Posters processed by the 'modify_raw_poster' benchmark.
+NOISE: float = 1.0  # Milliseconds, slowdowns below it are ignored by the regression gate.
+MIN_DURATION: float = 0.5  # Seconds, fast hot paths are run more times than asked, up to MAX_RUNS, to fill it.
+MAX_RUNS: int = 50
+
+
+def best_time(function, repeat: int, setup=None) -> float:
+    """Runs a function several times and returns its shortest duration.
+
+    Args:
+        function: Callable without arguments.
+        repeat (int): Minimal number of runs.
+        setup: Callable run before every run, not timed.
+
+    Returns:
+        float: Duration in milliseconds.
+    """
+
+    durations: list[float] = []
+    while len(durations) < repeat or (sum(durations) < MIN_DURATION and len(durations) < MAX_RUNS):
+        if setup is not None:
+            setup()
+        start: float = perf_counter()
+        function()
+        durations.append(perf_counter() - start)
+    return round(min(durations) * 1000, 3)
+
+
+def measure(size: int, repeat: int) -> dict[str, float]:
+    """Times the hot paths on a synthetic library.
+
+    Args:
+        size (int): Number of movies.
+        repeat (int): Number of runs per hot path.
+
+    Returns:
+        dict[str, float]: Duration in milliseconds by hot path.
+    """
+
+    original_root: Path = constants.APP_HIDDEN_FOLDER
+    with tempfile.TemporaryDirectory() as folder:
+        root = Path(folder)
+        summary: dict = generate_library(root, collections=COLLECTIONS, movies=size // COLLECTIONS, seed=size)
+        constants.set_root(root)
+        try:
+            return time_hot_paths(root, summary["videos"], size, repeat)
+        finally:
+            constants.set_root(original_root)
+
+
+def time_hot_paths(root: Path, videos: Path, size: int, repeat: int) -> dict[str, float]:
+    """Times the hot paths on the library of the user's folder.
+
+    Args:
+        root (Path): User's folder.
+        videos (Path): Folder of the video files.
+        size (int): Number of movies.
+        repeat (int): Number of runs per hot path.
+
+    Returns:
+        dict[str, float]: Duration in milliseconds by hot path.
+    """
+
+    timings: dict[str, float] = {}
+    entries: list[tuple] = [(data["title"], data["year"], data["path"], data["rating"])
+                            for file in sorted(constants.PATHS["collections"].glob("*.json"))
+                            for data in json.loads(file.read_text(encoding="UTF-8"))]
+    movies: list[Movie] = [Movie(*entry) for entry in entries]
+    thumb: Path = next(constants.PATHS["cache"].glob("*/thumb.jpg"))
+    Image.new("RGB", (600, 900), (40, 60, 80)).save(root / "poster.jpg")
+
+    timings["Movie"] = best_time(lambda: [Movie(*entry) for entry in entries], repeat)
+    timings["filter_name"] = best_time(lambda: [data_process.filter_name(entry[0], 60) for entry in entries],
+                                       repeat)
+
+    collection = Collection("Benchmark")
+    added: list[Movie] = [Movie(f"Added Movie {index}", 2000) for index in range(ADDED_MOVIES)]
+    timings["Collection.add_movie"] = best_time(lambda: [collection.add_movie(movie) for movie in added], repeat,
+                                                setup=lambda: setattr(collection, "movies", movies.copy()))
+    timings["Collection.save"] = best_time(collection.save, repeat)
+    collection.remove()
+
+    timings["Collection.retrieve_collections"] = best_time(Collection.retrieve_collections, repeat)
+    timings["load_all_movies"] = best_time(data_import.load_all_movies, repeat)
+    timings["load_all_actors"] = best_time(data_import.load_all_actors, repeat)
+    timings["find_movie_files"] = best_time(lambda: data_import.find_movie_files(videos), repeat)
+
+    def add_orphans() -> None:
+        for index in range(int(size * ORPHANS)):
+            write_cache_folder(constants.PATHS["cache"] / f"orphan_{index}", {"title": f"Orphan {index}"}, thumb)
+
+    timings["clear_cache"] = best_time(lambda: data_process.clear_cache(force=True, time_to_live=0), repeat,
+                                        setup=add_orphans)
+
+    posters: list[Path] = [root / f"poster_{index}.jpg" for index in range(POSTERS)]
+    timings["modify_raw_poster"] = best_time(
+        lambda: [data_process.modify_raw_poster(poster) for poster in posters], repeat,
+        setup=lambda: [shutil.copyfile(root / "poster.jpg", poster) for poster in posters])
+    return timings
+
+
+def regressions(baseline: dict, report: dict, threshold: float) -> list[str]:
+    """Compares a report with the baseline.
+
+    Args:
+        baseline (dict): Baseline report.
+        report (dict): New report.
+        threshold (float): Tolerated slowdown, e.g. 0.5 for 50 %.
+
+    Returns:
+        list[str]: Description of every hot path slower than the baseline by more than the threshold.
+    """
+
+    found: list[str] = []
+    for size, timings in report["sizes"].items():
+        for name, duration in timings.items():
+            reference: float | None = baseline.get("sizes", {}).get(size, {}).get(name)
+
+            if reference is not None and duration > reference * (1 + threshold) and duration - reference > NOISE:
+                found.append(f"{name} ({size} movies): {reference} ms -> {duration} ms (x{duration / reference:.2f})")
+    return found
+
+
+def main() -> int:
+    """Runs the benchmark, writes its report and applies the regression gate if asked.
+
+    Returns:
+        int: 1 if a regression was found, 0 otherwise.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="numbers of movies")
+    parser.add_argument("--repeat", type=int, default=3, help="minimal number of runs per hot path, the best is kept")
+    parser.add_argument("--output", type=Path, default=RESULTS, help="where to write the JSON report")
+    parser.add_argument("--baseline", type=Path, default=BASELINE, help="baseline report")
+    parser.add_argument("--threshold", type=float, default=1.0, help="tolerated slowdown, 1.0 = twice slower")
+    gate = parser.add_mutually_exclusive_group()
+    gate.add_argument("--save-baseline", action="store_true", help="store the report as the baseline")
+    gate.add_argument("--check", action="store_true", help="fail if a hot path is slower than the baseline")
+    args = parser.parse_args()
+
+    report: dict = {"repeat": args.repeat, "sizes": {}}
+    for size in args.sizes:
+        report["sizes"][str(size)] = measure(size, args.repeat)
+        print(f"{size} movies")
+        for name, duration in report["sizes"][str(size)].items():
+            print(f"    {name:<34}{duration:>12} ms")
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=4) + "\n", encoding="UTF-8")
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=4) + "\n", encoding="UTF-8")
+
+    if args.check:
+        found: list[str] = regressions(json.loads(args.baseline.read_text(encoding="UTF-8")), report, args.threshold)
+        for regression in found:
+            print(f"Regression: {regression}")
+        return 1 if found else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""Measures the parse time of the fixture pages, per source.
+
+Each page is parsed the way the scrapers used to (a full 'html.parser' tree, then a search) and with the
+extraction functions of packages.logic.html_parsing, which only build the relevant subtree.
+The summary is written to benchmarks/results/parse_time.json.
+
+Usage:
+    python benchmarks/parse_time.py [--repeat N] [--output PATH]
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+FIXTURES: Path = ROOT / "benchmarks" / "fixtures"
+RESULTS: Path = ROOT / "benchmarks" / "results" / "parse_time.json"
+sys.path.insert(0, str(ROOT))
+
+from packages.logic import html_parsing  # noqa: E402
+
+
+def full_tree(markup: str, *search) -> None:
+    """Parses a whole page with the standard library parser and searches an element, as the scrapers used to.
+
+    Args:
+        markup (str): Page's content.
+        *search: Arguments of find_all().
+
+    Returns:
+        None: None.
+    """
+
+    BeautifulSoup(markup, "html.parser").find_all(*search[:1], class_=search[1])
+
+
+SOURCES: dict = {
+    "CineMaterial search": ("cinematerial_search.html", html_parsing.cinematerial_result_link,
+                            ("div", "table-responsive")),
+    "CineMaterial poster": ("cinematerial_poster.html", html_parsing.cinematerial_poster, ("img", "lazy")),
+    "IMP Awards": ("impawards_page.html", html_parsing.imp_imdb_identifier, ("div", "rightsidesmallbordered")),
+    "MoviePosterDB": ("movieposterdb_search.html", html_parsing.movieposterdb_poster,
+                      (None, "vertical-image img-responsive poster_img lazyload"))
+}
+
+
+def measure(repeat: int) -> dict:
+    """Times both ways of parsing every fixture page.
+
+    Args:
+        repeat (int): Number of parses per page and method, the best run is kept.
+
+    Returns:
+        dict: Report.
+    """
+
+    report: dict = {"parser": html_parsing.PARSER, "sources": {}}
+
+    for source, (filename, extract, search) in SOURCES.items():
+        markup: str = Path(FIXTURES / filename).read_text(encoding="UTF-8")
+        if not extract(markup):
+            raise RuntimeError(f"Nothing was extracted from {filename}.")
+
+        full: float = min(timeit.repeat(lambda: full_tree(markup, *search), number=1, repeat=repeat))
+        targeted: float = min(timeit.repeat(lambda: extract(markup), number=1, repeat=repeat))
+        report["sources"][source] = {"bytes": len(markup.encode("UTF-8")), "full_tree_ms": round(full * 1000, 2),
+                                     "targeted_ms": round(targeted * 1000, 2), "speedup": round(full / targeted, 1)}
+    return report
+
+
+def main() -> int:
+    """Runs the benchmark and writes its report.
+
+    Returns:
+        int: 0.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="number of parses per page and method")
+    parser.add_argument("--output", type=Path, default=RESULTS, help="where to write the JSON report")
+    args = parser.parse_args()
+
+    report: dict = measure(args.repeat)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=4) + "\n", encoding="UTF-8")
+
+    print(f"Parser: {report['parser']}")
+    for source, timings in report["sources"].items():
+        print(f"{source:<22}{timings['full_tree_ms']:>9} ms  ->{timings['targeted_ms']:>9} ms  "
+              f"(x{timings['speedup']})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
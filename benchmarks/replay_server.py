@@ -0,0 +1,246 @@
+"""Local HTTP server replaying the fixture pages in place of the source websites.
+
+Each source is served under its own path prefix ('/SA/', '/SB/'... as in MovieScraper.sources_websites, and '/WP/'
+for the Wikipedia API). Absolute links to the real websites found in the fixtures are rewritten to point at the
+server, so that the scrapers never leave it. Latency, error rate and bandwidth can be configured to reproduce
+slow or unreliable networks.
+
+Usage:
+    python benchmarks/replay_server.py [--port 8000] [--latency 50] [--error-rate 0.05] [--bandwidth 500]
+"""
+
+import argparse
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+FIXTURES: Path = Path(__file__).resolve().parent / "fixtures"
+
+# Real base URLs, by source key, as found in the fixtures.
+REAL_WEBSITES: dict = {
+    "SA": "http://www.impawards.com/",
+    "SB": "https://www.movieposterdb.com/",
+    "SC": "https://www.cinematerial.com/",
+    "SD": "https://www.youtube.com/",
+    "SE": "https://tastedive.com/"
+}
+
+# (source, path pattern, fixture, content type), the first match wins.
+ROUTES: tuple = (
+    # Like most movies on IMP Awards, only the main poster exists, in a single large version.
+    ("SA", r"(?!.*_(xxlg|ver\d+)\.).*\.jpg", "poster.jpg", "image/jpeg"),
+    ("SA", r"(?!.*_(xxlg|xlg|ver\d+)\.).*\.html", "impawards_page.html", "text/html"),
+    ("SB", r"search.*", "movieposterdb_search.html", "text/html"),
+    ("SB", r".*\.jpg", "poster.jpg", "image/jpeg"),
+    ("SC", r"search.*", "cinematerial_search.html", "text/html"),
+    ("SC", r"movies/.+", "cinematerial_poster.html", "text/html"),
+    ("SC", r".*\.jpg", "poster.jpg", "image/jpeg"),
+    ("SD", r"results.*", "youtube_results.html", "text/html"),
+    ("SE", r"movies/like/.+", "tastedive_like.html", "text/html"),
+    ("WP", r"w/api\.php.*", "wikipedia_api.json", "application/json")
+)
+
+
+class ReplayServer:
+
+    def __init__(self, port: int = 0, latency: float = 0.0, error_rate: float = 0.0, bandwidth: float = 0.0,
+                 seed: int = None):
+
+        self.latency: float = latency  # Seconds added to every response.
+        self.error_rate: float = error_rate  # Share of requests answered with a 503 error.
+        self.bandwidth: float = bandwidth  # Bytes per second and per response, unlimited if 0.
+        self.random = random.Random(seed)
+        self.requests: int = 0
+        self._lock = threading.Lock()
+        self._fixtures: dict = {}
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self):
+
+        return self.start()
+
+    def __exit__(self, *_):
+
+        self.stop()
+
+    def __repr__(self):
+
+        return f"ReplayServer -> {self.base_url}"
+
+    @property
+    def base_url(self) -> str:
+        """Returns the server's URL.
+
+        Returns:
+            str: URL, ending with a slash.
+        """
+
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    @property
+    def sources(self) -> dict:
+        """Returns the base URLs to assign to MovieScraper.sources_websites.
+
+        Returns:
+            dict: Base URL by source key.
+        """
+
+        return {key: f"{self.base_url}{key}/" for key in REAL_WEBSITES}
+
+    @property
+    def wikipedia_api(self) -> str:
+        """Returns the URL to assign to WikipediaClient.api_url.
+
+        Returns:
+            str: URL.
+        """
+
+        return f"{self.base_url}WP/w/api.php"
+
+    def fixture(self, filename: str) -> bytes:
+        """Loads a fixture, with the links to the real websites rewritten.
+
+        Args:
+            filename (str): Fixture's filename.
+
+        Returns:
+            bytes: Content.
+        """
+
+        with self._lock:
+            if filename not in self._fixtures:
+                content: bytes = Path(FIXTURES / filename).read_bytes()
+                if not filename.endswith(".jpg"):
+                    for key, website in REAL_WEBSITES.items():
+                        content = content.replace(website.encode("UTF-8"), self.sources[key].encode("UTF-8"))
+                self._fixtures[filename] = content
+            return self._fixtures[filename]
+
+    def route(self, path: str) -> tuple[str, str] | None:
+        """Finds the fixture answering a request.
+
+        Args:
+            path (str): Request path.
+
+        Returns:
+            tuple[str, str] | None: Fixture's filename and content type, None if no route matches.
+        """
+
+        source, _, rest = path.lstrip("/").partition("/")
+        for route_source, pattern, filename, content_type in ROUTES:
+            if route_source == source and re.fullmatch(pattern, rest):
+                return filename, content_type
+        return None
+
+    def start(self) -> "ReplayServer":
+        """Serves requests in a background thread.
+
+        Returns:
+            ReplayServer: The server itself.
+        """
+
+        self._thread = threading.Thread(target=self._server.serve_forever, name="replay-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops serving requests.
+
+        Returns:
+            None: None.
+        """
+
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self) -> type:
+        """Builds the request handler class bound to this server.
+
+        Returns:
+            type: BaseHTTPRequestHandler subclass.
+        """
+
+        server: ReplayServer = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                server.answer(self, with_body=True)
+
+            def do_HEAD(self):
+                server.answer(self, with_body=False)
+
+            def log_message(self, *_):
+                pass
+
+        return Handler
+
+    def answer(self, handler: BaseHTTPRequestHandler, with_body: bool) -> None:
+        """Answers a request after the configured latency, failing it at the configured rate.
+
+        Args:
+            handler (BaseHTTPRequestHandler): Request handler.
+            with_body (bool): False for HEAD requests.
+
+        Returns:
+            None: None.
+        """
+
+        with self._lock:
+            self.requests += 1
+            failed: bool = self.random.random() < self.error_rate
+        time.sleep(self.latency)
+        route = self.route(handler.path)
+
+        if failed or route is None:
+            handler.send_response(503 if failed else 404)
+            handler.send_header("Content-Length", "0")
+            handler.end_headers()
+            return
+
+        content: bytes = self.fixture(route[0])
+        handler.send_response(200)
+        handler.send_header("Content-Type", route[1])
+        handler.send_header("Content-Length", str(len(content)))
+        handler.end_headers()
+
+        if not with_body:
+            return
+        chunk_size: int = 16 * 1024
+        for start in range(0, len(content), chunk_size):
+            handler.wfile.write(content[start:start + chunk_size])
+            if self.bandwidth:
+                time.sleep(min(chunk_size, len(content) - start) / self.bandwidth)
+
+
+def main() -> None:
+    """Runs the server until interrupted."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0, help="milliseconds added to every response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests failing with a 503 error")
+    parser.add_argument("--bandwidth", type=float, default=0.0, help="kilobytes per second per response, 0 = unlimited")
+    args = parser.parse_args()
+
+    server = ReplayServer(args.port, args.latency / 1000, args.error_rate, args.bandwidth * 1024)
+    print(f"Serving the fixtures on {server.base_url}")
+    for key, url in server.sources.items():
+        print(f"    {key}: {url}")
+    print(f"    Wikipedia API: {server.wikipedia_api}")
+    server.start()
+
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
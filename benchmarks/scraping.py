@@ -0,0 +1,146 @@
+"""Offline benchmark of the scrapers, against the local replay server.
+
+A bulk run scrapes synthetic movies in parallel, the way the 'prefetch' command does, with every source website
+replaced by benchmarks/replay_server.py. The cache lives in a temporary folder, so every run starts cold.
+The report gives the latency percentiles of each MovieScraper method and the throughput in movies per minute;
+it is written to benchmarks/results/scraping.json.
+
+Usage:
+    python benchmarks/scraping.py [--movies 20] [--jobs 4] [--latency 50] [--error-rate 0.05] [--bandwidth 500]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+RESULTS: Path = ROOT / "benchmarks" / "results" / "scraping.json"
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.replay_server import ReplayServer  # noqa: E402
+from packages.constants import constants  # noqa: E402
+from packages.logic.movie import Movie  # noqa: E402
+
+METHODS: tuple = ("download_info", "download_poster", "get_recommendations")
+
+
+def percentile(values: list[float], share: float) -> float:
+    """Returns a percentile with the nearest-rank method.
+
+    Args:
+        values (list[float]): Sorted values.
+        share (float): Percentile between 0 and 1.
+
+    Returns:
+        float: Value.
+    """
+
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, max(0, round(share * len(values)) - 1))]
+
+
+def scrape(movie: Movie, methods: tuple) -> dict:
+    """Runs the scraper methods on a movie and times them.
+
+    Args:
+        movie (Movie): Movie to scrape.
+        methods (tuple): Names of the MovieScraper methods to run, in order.
+
+    Returns:
+        dict: Duration in seconds by method, None for the methods that raised an exception.
+    """
+
+    from packages.logic.data_retrieve import MovieScraper
+
+    scraper = MovieScraper(movie)
+    durations: dict = {}
+    for method in methods:
+        start: float = time.perf_counter()
+        try:
+            getattr(scraper, method)()
+        except Exception:  # The benchmark reports failures instead of stopping.
+            durations[method] = None
+        else:
+            durations[method] = time.perf_counter() - start
+    return durations
+
+
+def run(movies: int, jobs: int, methods: tuple, server: ReplayServer) -> dict:
+    """Scrapes synthetic movies against the replay server.
+
+    Args:
+        movies (int): Number of movies.
+        jobs (int): Number of parallel workers.
+        methods (tuple): Names of the MovieScraper methods to run.
+        server (ReplayServer): Started server.
+
+    Returns:
+        dict: Report.
+    """
+
+    from packages.logic.data_retrieve import MovieScraper
+    from packages.logic.wikipedia_client import WikipediaClient
+
+    MovieScraper.sources_websites = server.sources
+    WikipediaClient.api_url = server.wikipedia_api
+    library: list[Movie] = [Movie(f"Benchmark Movie {index:04d}", 1999) for index in range(movies)]
+
+    start: float = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        results: list[dict] = list(executor.map(lambda movie: scrape(movie, methods), library))
+    elapsed: float = time.perf_counter() - start
+
+    report: dict = {"movies": movies, "jobs": jobs, "seconds": round(elapsed, 2),
+                    "movies_per_minute": round(movies / elapsed * 60, 1), "requests": server.requests, "methods": {}}
+    for method in methods:
+        durations: list[float] = sorted(result[method] for result in results if result[method] is not None)
+        report["methods"][method] = {
+            "calls": len(results), "errors": len(results) - len(durations),
+            **{f"p{int(share * 100)}_ms": round(percentile(durations, share) * 1000, 1) for share in (0.5, 0.9, 0.99)}}
+    return report
+
+
+def main() -> int:
+    """Runs the benchmark and writes its report.
+
+    Returns:
+        int: 0.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--movies", type=int, default=20, help="number of synthetic movies")
+    parser.add_argument("--jobs", type=int, default=4, help="number of parallel workers")
+    parser.add_argument("--methods", nargs="+", choices=METHODS, default=list(METHODS))
+    parser.add_argument("--latency", type=float, default=50.0, help="milliseconds added to every response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests failing with a 503 error")
+    parser.add_argument("--bandwidth", type=float, default=0.0, help="kilobytes per second per response, 0 = unlimited")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the simulated errors")
+    parser.add_argument("--output", type=Path, default=RESULTS, help="where to write the JSON report")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        constants.set_root(folder)
+
+        with ReplayServer(latency=args.latency / 1000, error_rate=args.error_rate, bandwidth=args.bandwidth * 1024,
+                          seed=args.seed) as server:
+            report: dict = run(args.movies, args.jobs, tuple(args.methods), server)
+
+    report["network"] = {"latency_ms": args.latency, "error_rate": args.error_rate, "bandwidth_kbps": args.bandwidth}
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=4) + "\n", encoding="UTF-8")
+
+    print(f"{report['movies']} movies in {report['seconds']} s: {report['movies_per_minute']} movies/minute, "
+          f"{report['requests']} requests")
+    for method, timings in report["methods"].items():
+        print(f"{method:<22}p50 {timings['p50_ms']:>8} ms   p90 {timings['p90_ms']:>8} ms   "
+              f"p99 {timings['p99_ms']:>8} ms   errors {timings['errors']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
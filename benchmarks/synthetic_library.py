@@ -0,0 +1,255 @@
+"""Generates a synthetic library, shaped like a real user's folder, for scale tests and benchmarks.
+
+The user's folder written in ROOT holds N collection files of M movies, and for every movie a cache folder with
+a data.json (summary, actors, genres) and a placeholder thumb.jpg. Titles, years, ratings, genres and actors are
+drawn from skewed distributions: recent years, unrated movies and a few famous actors are the most frequent.
+The video files of the collections are empty sparse files, written in ROOT/videos with a few subtitles and
+other files for find_movie_files() to skip. Generating the same library twice with the same seed gives the same
+content. Point the application to it with PYMOMAN_HOME or constants.set_root():
+    python benchmarks/synthetic_library.py /tmp/library --collections 10 --movies 1000
+    PYMOMAN_HOME=/tmp/library python run.py
+
+Usage:
+    python benchmarks/synthetic_library.py ROOT [--collections 10] [--movies 100] [--orphans 0.0] [--seed 0]
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import string
+import sys
+from pathlib import Path
+
+from PIL import Image
+
+ROOT: Path = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from packages.constants import constants  # noqa: E402
+from packages.logic.data_process import cache_folder_name, filter_name  # noqa: E402
+
+WORDS: tuple = ("night", "return", "city", "dark", "last", "star", "love", "war", "blue", "ghost", "king", "road",
+                "summer", "island", "storm", "secret", "silver", "shadow", "empire", "river", "winter", "fire",
+                "dream", "house", "heart", "game", "iron", "lost", "wild", "moon", "angel", "edge", "code", "hunter")
+FIRST_NAMES: tuple = ("James", "Mary", "John", "Emma", "Robert", "Olivia", "Michael", "Ava", "David", "Sophia",
+                      "Daniel", "Mia", "Thomas", "Chloe", "Samuel", "Lucy", "Hugo", "Ines", "Kenji", "Amara")
+LAST_NAMES: tuple = ("Smith", "Johnson", "Brown", "Garcia", "Miller", "Davis", "Martin", "Lee", "Walker", "Hall",
+                     "Young", "King", "Wright", "Lopez", "Hill", "Scott", "Green", "Adams", "Baker", "Nelson")
+# Weights of the ratings: most movies of a library are not rated.
+RATINGS: dict = {"-": 50, "1": 3, "2": 7, "3": 15, "4": 17, "5": 8}
+VIDEO_EXTENSIONS: dict = {".mkv": 60, ".mp4": 30, ".avi": 8, ".mov": 2}
+VIDEO_SIZE: int = 1024 ** 3  # Bytes, apparent size of the sparse video files.
+ACTORS_POOL: int = 5000
+
+
+def weighted(generator: random.Random, weights: dict):
+    """Draws a key of a dictionary of weights.
+
+    Args:
+        generator (random.Random): Random generator.
+        weights (dict): Weight by key.
+
+    Returns:
+        A key.
+    """
+
+    return generator.choices(list(weights), weights=list(weights.values()))[0]
+
+
+def movie_title(generator: random.Random, index: int) -> str:
+    """Draws a movie title, made unique by the movie's number.
+
+    Args:
+        generator (random.Random): Random generator.
+        index (int): Movie's number.
+
+    Returns:
+        str: Title.
+    """
+
+    title: str = " ".join(generator.sample(WORDS, generator.choice((1, 2, 2, 3)))).title()
+    if generator.random() < 0.25:
+        title = f"The {title}"
+    if generator.random() < 0.1:
+        title = f"{title} {generator.randint(2, 4)}"
+    return f"{title} {index}"
+
+
+def movie_year(generator: random.Random) -> int:
+    """Draws a release year, recent years being more frequent.
+
+    Args:
+        generator (random.Random): Random generator.
+
+    Returns:
+        int: Year.
+    """
+
+    return int(generator.triangular(1930, 2024, 2020))
+
+
+def movie_data(generator: random.Random, title: str, year: int, actors: list[str]) -> dict:
+    """Draws the cached data of a movie, as written by MovieScraper.download_info().
+
+    Args:
+        generator (random.Random): Random generator.
+        title (str): Title.
+        year (int): Year.
+        actors (list[str]): Actors pool, the first ones are the most frequent.
+
+    Returns:
+        dict: Data.
+    """
+
+    genres: list[str] = generator.sample(list(constants.MOVIE_GENRES), generator.choice((1, 1, 2, 2, 3)))
+    cast: list[str] = []
+    while len(cast) < generator.randint(3, 8):
+        actor: str = actors[min(int(generator.paretovariate(1.2)) - 1, len(actors) - 1)]
+        if generator.random() < 0.5:
+            actor = generator.choice(actors)
+        if actor not in cast:
+            cast.append(actor)
+
+    kind: str = " ".join(constants.MOVIE_GENRES[genre] for genre in genres)
+    sentences: list[str] = [f"{title} is a {year} American {kind} film directed by {generator.choice(actors)}."]
+    for _ in range(generator.randint(1, 4)):
+        sentences.append(f"It {generator.choice(('follows', 'tells the story of', 'stars'))} "
+                         f"{' and '.join(cast[:2])} in a tale of {' and '.join(generator.sample(WORDS, 2))}.")
+    return {
+        "title": f"{title} ({year})",
+        "summary": " ".join(sentences),
+        "actors": cast,
+        "genre": [genre.title() for genre in genres],
+        "trailer": f"https://www.youtube.com/embed/{''.join(generator.choices(string.ascii_letters + '-_', k=11))}",
+        "imdb": f"https://www.imdb.com/title/tt{generator.randint(100000, 9999999):07d}/"
+    }
+
+
+def write_cache_folder(folder: Path, data: dict, placeholder: Path | None) -> Path:
+    """Writes the cached data and the poster of a movie.
+
+    Args:
+        folder (Path): Movie's cache folder.
+        data (dict): Data.
+        placeholder (Path | None): Poster hard linked, when possible, to save space; a new one is drawn if None.
+
+    Returns:
+        Path: Poster to use as placeholder for the next movies.
+    """
+
+    folder.mkdir(parents=True, exist_ok=True)
+    with open(folder / "data.json", "w", encoding="UTF-8") as file:
+        json.dump(data, file, indent=4)
+    thumb: Path = folder / "thumb.jpg"
+
+    if placeholder is None:
+        Image.new("RGB", (185, 275), (40, 60, 80)).save(thumb)
+        return thumb
+    try:
+        os.link(placeholder, thumb)
+    except OSError:  # Another file system, or too many links.
+        shutil.copyfile(placeholder, thumb)
+        return thumb
+    return placeholder
+
+
+def write_video(path: Path, size: int) -> None:
+    """Writes an empty video file with an apparent size, which is sparse on most file systems.
+
+    Args:
+        path (Path): File's path.
+        size (int): Apparent size in bytes.
+
+    Returns:
+        None: None.
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as file:
+        file.truncate(size)
+
+
+def generate_library(root: Path, collections: int = 10, movies: int = 100, orphans: float = 0.0, seed: int = 0,
+                     video_size: int = VIDEO_SIZE) -> dict:
+    """Writes a synthetic user's folder. The paths are those of constants.PATHS once constants.set_root(root)
+    is called, the real user's folder is never touched.
+
+    Args:
+        root (Path): User's folder to create.
+        collections (int): Number of collections.
+        movies (int): Number of movies per collection.
+        orphans (float): Number of cache folders of movies in no collection, relative to the number of movies.
+        seed (int): Seed of the random generator.
+        video_size (int): Apparent size of the video files in bytes.
+
+    Returns:
+        dict: Summary: number of collections, movies, cache folders and video files, and the videos' folder.
+    """
+
+    root = Path(root)
+    paths: dict = {key: root / name for key, name in constants.USER_FILES.items()}
+    videos: Path = root / "videos"
+    generator = random.Random(seed)
+    actors: list[str] = [f"{generator.choice(FIRST_NAMES)} {generator.choice(LAST_NAMES)} {index}"
+                         for index in range(ACTORS_POOL)]
+
+    paths["collections"].mkdir(parents=True, exist_ok=True)
+    paths["cache"].mkdir(parents=True, exist_ok=True)
+    thumb: Path | None = None
+    summary: dict = {"collections": collections, "movies": 0, "cache folders": 0, "video files": 0, "videos": videos}
+
+    for number in range(collections):
+        name: str = f"Collection {number + 1}"
+        entries: list[dict] = []
+
+        for _ in range(movies):
+            title: str = movie_title(generator, summary["movies"])
+            year: int = movie_year(generator)
+            video: Path = videos / name / f"{title} ({year}){weighted(generator, VIDEO_EXTENSIONS)}"
+            write_video(video, video_size)
+            if generator.random() < 0.2:
+                (video.with_suffix(".srt")).write_text("1\n00:00:01,000 --> 00:00:02,000\n...\n", encoding="UTF-8")
+
+            entries.append({"title": title, "year": year, "path": str(video), "rating": weighted(generator, RATINGS)})
+            folder: Path = paths["cache"] / cache_folder_name(filter_name(name=title, limit=60))
+            thumb = write_cache_folder(folder, movie_data(generator, title, year, actors), thumb)
+            summary["movies"] += 1
+            summary["cache folders"] += 1
+            summary["video files"] += 1
+
+        with open(paths["collections"] / f"{name.replace(' ', '_')}.json", "w", encoding="UTF-8") as file:
+            json.dump(entries, file, indent=4)
+
+    for index in range(int(summary["movies"] * orphans)):
+        title: str = f"Orphan {movie_title(generator, index)}"
+        data: dict = movie_data(generator, title, 2000, actors)
+        thumb = write_cache_folder(paths["cache"] / cache_folder_name(title), data, thumb)
+        summary["cache folders"] += 1
+    return summary
+
+
+def main() -> int:
+    """Generates a library.
+
+    Returns:
+        int: 0.
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("root", type=Path, help="user's folder to create")
+    parser.add_argument("--collections", type=int, default=10, help="number of collections")
+    parser.add_argument("--movies", type=int, default=100, help="number of movies per collection")
+    parser.add_argument("--orphans", type=float, default=0.0, help="cache folders in no collection, per movie")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random generator")
+    args = parser.parse_args()
+
+    summary: dict = generate_library(args.root, args.collections, args.movies, args.orphans, args.seed)
+    print(f"{summary['collections']} collections, {summary['movies']} movies, {summary['cache folders']} cache "
+          f"folders and {summary['video files']} video files written in {args.root}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,328 @@
+"""Headless command-line entry point.
+
+It gives access to batch library operations (imports, metadata prefetch, poster regeneration,
+cache cleanup and exports) without a display: no Qt module is ever imported here.
+Progress is written to stdout as JSON lines, one event per line.
+
+Examples:
+    python cli.py import ~/Videos --collection "My movies"
+    python cli.py prefetch --jobs 4
+    python cli.py posters --collection "My movies" --jobs 2
+    python cli.py clean-cache
+    python cli.py cache-stats --enforce
+    python cli.py source-stats
+    python cli.py --metrics metrics.json prefetch
+    python cli.py --profile cprofile,sample prefetch
+    python cli.py export --collection "My movies" --output movies.txt
+"""
+
+import argparse
+import json
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from packages.constants import constants
+from packages.logic import data_import, data_process
+from packages.logic.cache_manager import CacheManager, cache_manager
+from packages.logic.collection import Collection
+from packages.logic.metrics import metrics
+from packages.logic.movie import Movie
+from packages.logic.negative_cache import negative_cache
+from packages.logic.profiling import enable, profile
+from packages.logic.progress import ProgressReporter
+from packages.logic.source_stats import source_stats
+
+
+EXIT_OK: int = 0
+EXIT_PARTIAL_FAILURE: int = 1
+EXIT_USAGE: int = 2
+EXIT_NOT_FOUND: int = 3
+
+
+def emit(event: str, **fields) -> None:
+    """Writes an event as a JSON line on stdout.
+
+    Args:
+        event (str): Event name.
+        **fields: Event data.
+
+    Returns:
+        None: None.
+    """
+
+    sys.stdout.write(json.dumps({"event": event, **fields}, ensure_ascii=False) + "\n")
+    sys.stdout.flush()
+
+
+def find_collections(names: list[str] | None) -> list[Collection] | None:
+    """Returns the saved collections to work on.
+
+    Args:
+        names (list[str] | None): Collection names, None for every collection.
+
+    Returns:
+        list[Collection] | None: Collections, None if one of the names does not exist.
+    """
+
+    errors: list[dict] = []
+    collections: list[Collection] = Collection.retrieve_collections(errors)
+
+    for error in errors:
+        emit("malformed", **error)
+    if not names:
+        return collections
+
+    selected: list[Collection] = [collection for collection in collections if collection.name in names]
+    missing: set[str] = set(names) - {collection.name for collection in selected}
+
+    for name in missing:
+        emit("error", message=f"Collection '{name}' does not exist.")
+    return None if missing else selected
+
+
+def run_jobs(movies: list[Movie], job, jobs: int) -> int:
+    """Runs a job on every movie with a pool of workers and reports progress.
+
+    Args:
+        movies (list[Movie]): Movies to process.
+        job: Callable receiving a Movie.
+        jobs (int): Number of parallel workers.
+
+    Returns:
+        int: Exit code.
+    """
+
+    progress = ProgressReporter(total=len(movies))
+    failures: int = 0
+
+    metrics().set_gauge("jobs.queued", progress.total)
+    with ThreadPoolExecutor(max_workers=max(jobs, 1)) as executor:
+        futures: dict = {executor.submit(job, movie): movie for movie in movies}
+
+        for future in as_completed(futures):
+            movie: Movie = futures[future]
+            progress.advance()
+            metrics().set_gauge("jobs.queued", progress.total - progress.done)
+
+            if future.exception() is None:
+                emit("progress", done=progress.done, total=progress.total, movie=movie.title, status="ok")
+            else:
+                failures += 1
+                emit("progress", done=progress.done, total=progress.total, movie=movie.title, status="error",
+                     error=str(future.exception()))
+
+    negative_cache().save()
+    emit("done", total=progress.total, failed=failures)
+    return EXIT_PARTIAL_FAILURE if failures else EXIT_OK
+
+
+def command_clean_cache(arguments: argparse.Namespace) -> int:
+    """Removes cached data of movies that no longer belong to a collection and were not used for a while."""
+
+    report: dict = data_process.clear_cache(budget=arguments.budget, force=arguments.force)
+    emit("done", **report)
+    return EXIT_OK
+
+
+def command_cache_stats(arguments: argparse.Namespace) -> int:
+    """Reports the cache statistics, after trimming the cache to its budget if asked."""
+
+    manager: CacheManager = cache_manager()
+
+    if arguments.enforce:
+        emit("evicted", **manager.enforce())
+    emit("stats", **manager.stats(), known_misses=len(negative_cache()))
+    manager.save()
+    return EXIT_OK
+
+
+def command_source_stats(_arguments: argparse.Namespace) -> int:
+    """Reports the statistics of the poster sources, in the order they are tried."""
+
+    for source, stats in source_stats().snapshot().items():
+        emit("source", source=source, **stats)
+    return EXIT_OK
+
+
+def command_export(arguments: argparse.Namespace) -> int:
+    """Exports a collection as text or JSON."""
+
+    collections: list[Collection] | None = find_collections([arguments.collection])
+
+    if not collections:
+        return EXIT_NOT_FOUND
+    collection: Collection = collections[0]
+    output: Path = Path(arguments.output)
+
+    if arguments.format == "txt":
+        collection.export_as_txt(output)
+
+    else:
+        with open(output, "w", encoding="UTF-8") as file:
+            # Scraped data is nested, its 'title' (e.g. 'Heat (1995)') must not replace the movie's one.
+            json.dump([{"title": movie.title, "year": movie.year, "path": movie.path, "rating": movie.rating,
+                        "data": movie.load_data_file()} for movie in collection.movies], file, indent=4)
+
+    emit("done", collection=collection.name, movies=len(collection.movies), output=str(output))
+    return EXIT_OK
+
+
+def command_import(arguments: argparse.Namespace) -> int:
+    """Imports the video files of a directory into a collection.
+    Titles come from the filenames, years are looked for in the filenames too.
+    """
+
+    directory: Path = Path(arguments.directory).expanduser().resolve()
+
+    if not directory.is_dir():
+        emit("error", message=f"'{directory}' is not a directory.")
+        return EXIT_NOT_FOUND
+
+    name: str = arguments.collection
+    existing: list[Collection] = [item for item in Collection.retrieve_collections() if item.name == name]
+
+    try:
+        collection: Collection = existing[0] if existing else Collection(name=name)
+    except ValueError as error:
+        emit("error", message=str(error))
+        return EXIT_USAGE
+    files: list[Path] = data_import.find_movie_files(directory)
+    year_pattern = re.compile(r"\b(19\d{2}|20\d{2})\b")
+    skipped: int = 0
+
+    for file in files:
+        match = year_pattern.search(file.stem)
+        title: str = year_pattern.sub("", file.stem).replace(".", " ").replace("_", " ").strip(" ()[]-").title()
+        year: str | None = match[1] if match else arguments.default_year
+        movie: Movie | None = Movie.no_errors(title, year, str(file)) if year else None
+
+        if movie is None:
+            skipped += 1
+            emit("skipped", file=str(file), reason="no valid title or year")
+            continue
+        collection.add_movie(movie)
+
+    collection.save()
+    emit("done", collection=collection.name, movies=len(collection.movies), skipped=skipped)
+    return EXIT_PARTIAL_FAILURE if skipped else EXIT_OK
+
+
+def command_posters(arguments: argparse.Namespace) -> int:
+    """Downloads new posters for the movies of the given collections."""
+
+    from packages.logic.data_retrieve import MovieScraper
+
+    collections: list[Collection] | None = find_collections(arguments.collection)
+
+    if collections is None:
+        return EXIT_NOT_FOUND
+    movies: list[Movie] = [movie for collection in collections for movie in collection.movies]
+    return run_jobs(movies, lambda movie: MovieScraper(movie).download_poster(override=True), arguments.jobs)
+
+
+def command_prefetch(arguments: argparse.Namespace) -> int:
+    """Downloads missing information and posters for the movies of the given collections."""
+
+    from packages.logic.data_retrieve import MovieScraper
+
+    collections: list[Collection] | None = find_collections(arguments.collection)
+
+    if collections is None:
+        return EXIT_NOT_FOUND
+    movies: list[Movie] = [movie for collection in collections for movie in collection.movies]
+
+    def prefetch(movie: Movie) -> None:
+        scraper = MovieScraper(movie)
+        if not arguments.no_info:
+            scraper.download_info()
+        if not arguments.no_posters:
+            scraper.download_poster()
+
+    return run_jobs(movies, prefetch, arguments.jobs)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the command-line parser.
+
+    Returns:
+        argparse.ArgumentParser: Parser.
+    """
+
+    parser = argparse.ArgumentParser(prog="pymoman", description="Python Movie Manager, headless mode.")
+    parser.add_argument("--metrics", type=Path, help="write the metrics as JSON to this file when the command ends")
+    parser.add_argument("--profile", help="profile the command: 'cprofile', 'sample' or 'cprofile,sample', "
+                                          "written to ~/.pymoman/profiles (default: $PYMOMAN_PROFILE)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    importer = commands.add_parser("import", help="import the video files of a directory into a collection")
+    importer.add_argument("directory")
+    importer.add_argument("--collection", required=True, help="collection name (created if needed)")
+    importer.add_argument("--default-year", help="year used when a filename contains none")
+    importer.set_defaults(function=command_import)
+
+    prefetch = commands.add_parser("prefetch", help="download missing information and posters")
+    prefetch.add_argument("--collection", action="append", help="collection name, can be repeated (default: all)")
+    prefetch.add_argument("--jobs", type=int, default=4, help="number of parallel workers")
+    prefetch.add_argument("--no-info", action="store_true", help="do not download information")
+    prefetch.add_argument("--no-posters", action="store_true", help="do not download posters")
+    prefetch.set_defaults(function=command_prefetch)
+
+    posters = commands.add_parser("posters", help="download new posters, replacing the current ones")
+    posters.add_argument("--collection", action="append", help="collection name, can be repeated (default: all)")
+    posters.add_argument("--jobs", type=int, default=2, help="number of parallel workers")
+    posters.set_defaults(function=command_posters)
+
+    clean = commands.add_parser("clean-cache", help="remove old cached data of movies that are not in a collection")
+    clean.add_argument("--budget", type=float, help="maximal duration in seconds, the next run resumes the work")
+    clean.add_argument("--force", action="store_true", help="clean even if nothing changed since the last run")
+    clean.set_defaults(function=command_clean_cache)
+
+    stats = commands.add_parser("cache-stats", help="show the cache size and hit rate")
+    stats.add_argument("--enforce", action="store_true", help="evict unsaved entries until the budget is met")
+    stats.set_defaults(function=command_cache_stats)
+
+    sources = commands.add_parser("source-stats", help="show the hit rate and latency of the poster sources")
+    sources.set_defaults(function=command_source_stats)
+
+    export = commands.add_parser("export", help="export a collection")
+    export.add_argument("--collection", required=True)
+    export.add_argument("--output", required=True)
+    export.add_argument("--format", choices=("txt", "json"), default="txt")
+    export.set_defaults(function=command_export)
+
+    return parser
+
+
+def main(argv: list[str] = None) -> int:
+    """Parses the arguments and runs the requested command.
+
+    Args:
+        argv (list[str]): Arguments, defaults to sys.argv[1:].
+
+    Returns:
+        int: Exit code.
+    """
+
+    parser: argparse.ArgumentParser = build_parser()
+
+    try:
+        arguments: argparse.Namespace = parser.parse_args(argv)
+    except SystemExit as error:
+        return EXIT_USAGE if error.code else EXIT_OK
+
+    constants.APP_HIDDEN_FOLDER.mkdir(parents=True, exist_ok=True)
+    if arguments.profile is not None:
+        enable(arguments.profile)
+
+    with profile(f"cli-{arguments.command}"):
+        exit_code: int = arguments.function(arguments)
+
+    if arguments.metrics is not None:
+        metrics().dump(arguments.metrics)
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
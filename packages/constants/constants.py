@@ -4,18 +4,33 @@ These constants can be imported and used throughout the project to maintain
 consistency and ease of updates.
 """
 
+import os
 from typing import final
 from pathlib import Path
 
 
 BASE: final(Path) = Path(__file__).resolve().parent.parent.parent
-APP_HIDDEN_FOLDER: final(Path) = Path.joinpath(Path.home(), ".pymoman")
+# PYMOMAN_HOME replaces the user's folder, e.g. with a synthetic library, see also set_root().
+APP_HIDDEN_FOLDER: final(Path) = Path(os.environ.get("PYMOMAN_HOME") or Path.joinpath(Path.home(), ".pymoman"))
+
+# Files and folders of the user's folder.
+USER_FILES: final(dict) = {
+    "settings": "settings.json",
+    "cache": "cache",
+    "cache index": "cache_index.json",
+    "cache marker": "cache_gc.json",
+    "metrics": "metrics.json",
+    "collections": "collections",
+    "negative cache": "negative_cache.json",
+    "profiles": "profiles",
+    "recommendations": "recommendations",
+    "source stats": "source_stats.json",
+    "web engine": "webengine",
+    "wikipedia": "wikipedia"
+}
 
 PATHS: final(dict) = {
-    "settings": Path(APP_HIDDEN_FOLDER / "settings.json"),
-    "cache": Path(APP_HIDDEN_FOLDER / "cache"),
-    "collections": Path(APP_HIDDEN_FOLDER / "collections"),
-    "recommendations": Path(APP_HIDDEN_FOLDER / "recommendations"),
+    **{key: Path(APP_HIDDEN_FOLDER / name) for key, name in USER_FILES.items()},
     "resources": Path(BASE / "resources"),
     "default font": Path(BASE / "resources" / "fonts" / "default.ttf"),
     "cyber font": Path(BASE / "resources" / "fonts" / "cyber.ttf"),
@@ -27,8 +42,9 @@ PATHS: final(dict) = {
 }
 STR_PATHS: final(dict) = {key: str(value) for key, value in PATHS.items()}
 
-ICONS: final(dict) = {icon_path.stem: icon_path for icon_path in PATHS["icons"].iterdir()}
-STR_ICONS: final(dict) = {key: str(value) for key, value in ICONS.items()}
+ICONS: final(dict)  # Built on first access, see __getattr__ at the end of this module.
+STR_ICONS: final(dict)
+
 
 MOVIE_GENRES: final(dict) = {
     "action": "action",
@@ -71,3 +87,34 @@ IMPORT_INFO: final(str) = """
 In order to import a file as a movie, you must tag it first.
 You can assign a title, a year and a rating in this window.
 """
+
+
+def set_root(root: Path | str) -> None:
+    """Moves the user's folder, updating PATHS and STR_PATHS in place, so that benchmarks and tests never touch
+    the real one. It must be called before the cache, the statistics and the other shared objects are created.
+
+    Args:
+        root (Path | str): New user's folder.
+
+    Returns:
+        None: None.
+    """
+
+    global APP_HIDDEN_FOLDER
+    APP_HIDDEN_FOLDER = Path(root)
+    PATHS.update({key: Path(APP_HIDDEN_FOLDER / name) for key, name in USER_FILES.items()})
+    STR_PATHS.update({key: str(PATHS[key]) for key in USER_FILES})
+
+
+def __getattr__(name: str):
+    """ICONS and STR_ICONS are only built on first access, the icons directory is not listed at import."""
+
+    if name == "ICONS":
+        globals()["ICONS"] = {icon_path.stem: icon_path for icon_path in PATHS["icons"].iterdir()}
+        return globals()["ICONS"]
+
+    elif name == "STR_ICONS":
+        globals()["STR_ICONS"] = {key: str(value) for key, value in __getattr__("ICONS").items()}
+        return globals()["STR_ICONS"]
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -0,0 +1,194 @@
+"""
+This module contains the CacheManager class which keeps the movie cache within a byte budget.
+
+Every access of the user to a movie's cached data is recorded in a compact index ({folder: [last access, bytes]})
+stored next to the cache. When the cache exceeds its budget, the least recently used folders that do
+not belong to a saved collection are evicted first. Hits and misses are counted to report a hit rate.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from shutil import rmtree
+from time import time
+
+from packages.constants import constants
+from packages.logic import data_process
+from packages.logic.data_import import load_file_content
+from packages.logic.metrics import metrics
+
+DEFAULT_BUDGET: int = 512 * 1024 * 1024  # Bytes, can be changed with the 'cache_budget_mb' setting.
+
+
+class CacheManager:
+
+    def __init__(self, folder: Path = None, index: Path = None, budget: int = None):
+
+        self.folder: Path = constants.PATHS["cache"] if folder is None else Path(folder)
+        self.index_path: Path = constants.PATHS["cache index"] if index is None else Path(index)
+        self.budget: int = self.configured_budget() if budget is None else budget
+        self._lock = threading.Lock()
+        self._dirty: bool = False
+
+        content = load_file_content(self.index_path)
+        content = content if isinstance(content, dict) else {}
+        self._entries: dict[str, list] = content.get("entries", {})
+        self.hits: int = content.get("hits", 0)
+        self.misses: int = content.get("misses", 0)
+
+    def __repr__(self):
+
+        return f"CacheManager -> '{self.folder}', {len(self._entries)} entries"
+
+    @property
+    def hit_rate(self) -> float:
+        """Returns the share of accesses that found cached data.
+
+        Returns:
+            float: Hit rate between 0 and 1.
+        """
+
+        accesses: int = self.hits + self.misses
+        return self.hits / accesses if accesses else 0.0
+
+    @staticmethod
+    def configured_budget() -> int:
+        """Reads the cache budget from the settings.
+
+        Returns:
+            int: Budget in bytes.
+        """
+
+        settings = load_file_content(constants.PATHS["settings"])
+        megabytes = settings.get("cache_budget_mb") if isinstance(settings, dict) else None
+        return int(megabytes * 1024 * 1024) if isinstance(megabytes, (int, float)) else DEFAULT_BUDGET
+
+    def enforce(self) -> dict:
+        """Refreshes the sizes of the cached folders and evicts the least recently used unsaved ones
+        until the cache fits in its budget.
+
+        Returns:
+            dict: Number of evicted folders and reclaimed bytes.
+        """
+
+        report: dict = {"evicted": 0, "reclaimed": 0}
+
+        if not self.folder.exists():
+            return report
+        folders: dict[str, tuple[float, int]] = {path.name: (path.stat().st_mtime, data_process.folder_size(path))
+                                                 for path in self.folder.iterdir() if path.is_dir()}
+        started_at: float = time()
+
+        with self._lock:
+            for name in set(self._entries) - set(folders):
+                del self._entries[name]
+            for name, (modified, size) in folders.items():
+                # Folders never accessed since the index exists are considered as old as their last modification.
+                self._entries.setdefault(name, [modified, 0])[1] = size
+            self._dirty = True
+            total: int = sum(size for _, size in folders.values())
+
+            if total <= self.budget:
+                return report
+            saved_folders: set[str] = data_process.saved_cache_folders()
+            candidates: list = sorted((entry[0], name) for name, entry in self._entries.items()
+                                      if name not in saved_folders and entry[0] < started_at)
+
+            for _, name in candidates:
+                if total <= self.budget:
+                    break
+                size: int = self._entries.pop(name)[1]
+                rmtree(Path(self.folder / name), ignore_errors=True)
+                total -= size
+                report["evicted"] += 1
+                report["reclaimed"] += size
+        return report
+
+    def record(self, folder: Path, hit: bool) -> None:
+        """Records an access to a movie's cached data.
+
+        Args:
+            folder (Path): Movie's storage folder.
+            hit (bool): Whether cached data was found.
+
+        Returns:
+            None: None.
+        """
+
+        metrics().increment("cache.hits" if hit else "cache.misses")
+        with self._lock:
+            if hit:
+                self.hits += 1
+                self._entries.setdefault(folder.name, [0, 0])[0] = time()
+            else:
+                self.misses += 1
+            self._dirty = True
+
+    def save(self) -> None:
+        """Atomically writes the index if it changed.
+
+        Returns:
+            None: None.
+        """
+
+        with self._lock:
+            if not self._dirty:
+                return
+            content: dict = {"hits": self.hits, "misses": self.misses, "entries": self._entries}
+            self._dirty = False
+
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_file: Path = self.index_path.with_suffix(".tmp")
+
+        with open(temporary_file, "w", encoding="UTF-8") as file:
+            json.dump(content, file, separators=(",", ":"))
+        os.replace(temporary_file, self.index_path)
+
+    def stats(self) -> dict:
+        """Returns the cache statistics, as of the last enforce() for the sizes.
+
+        Returns:
+            dict: Entries, bytes, budget, hits, misses and hit rate.
+        """
+
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": sum(entry[1] for entry in self._entries.values()),
+                    "budget": self.budget, "hits": self.hits, "misses": self.misses,
+                    "hit_rate": round(self.hit_rate, 3)}
+
+
+_manager: CacheManager | None = None
+_manager_lock = threading.Lock()
+
+
+def cache_manager() -> CacheManager:
+    """Returns the cache manager shared by the whole application.
+
+    Returns:
+        CacheManager: Manager.
+    """
+
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = CacheManager()
+    return _manager
+
+
+def start_maintenance(budget: float | None = None) -> threading.Thread:
+    """Cleans and trims the cache in a daemon thread.
+
+    Args:
+        budget (float | None): Maximal duration of the cleaning in seconds, no limit if None.
+
+    Returns:
+        threading.Thread: Started thread.
+    """
+
+    def trim() -> None:
+        manager: CacheManager = cache_manager()
+        manager.enforce()
+        manager.save()
+
+    return data_process.clear_cache_in_background(budget=budget, then=trim)
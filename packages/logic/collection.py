@@ -10,6 +10,7 @@ from packages.constants import constants
 from packages.logic.data_import import load_collection_movies
 from packages.logic.data_process import filter_name
 from packages.logic.movie import Movie
+from packages.logic.profiling import profile
 
 
 class Collection:
@@ -111,16 +112,20 @@ class Collection:
             old_path.unlink()
 
     @classmethod
-    def retrieve_collections(cls) -> list[Self]:
+    @profile("retrieve_collections")
+    def retrieve_collections(cls, errors: list[dict] | None = None) -> list[Self]:
         """Recovers all collections saved on the disk.
 
+        Args:
+            errors (list[dict] | None): If given, malformed entries of the files are appended to it.
+
         Returns:
             list[self]: List of all saved collections.
         """
 
         collections = []
         for file in constants.PATHS.get('collections').glob('*.json'):
-            movies = load_collection_movies(file)
+            movies = load_collection_movies(file, errors)
             name = Path(file).stem.replace('_', ' ')
             collections.append(Collection(name=name, movies=movies))
         return collections
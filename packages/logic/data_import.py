@@ -4,9 +4,16 @@ It provides functions and utilities to parse, structure, and categorize informat
 """
 
 import json
+import re
 from pathlib import Path
+from typing import Iterator, TextIO
 
 from packages.constants import constants
+from packages.logic.metrics import metrics
+
+CHUNK_SIZE: int = 64 * 1024  # Characters read at once by iter_json_array().
+MAX_ENTRY_SIZE: int = 1024 * 1024  # Characters, longer entries that cannot be decoded are reported as malformed.
+SEPARATORS = re.compile(r"[\s,]*")
 
 
 def find_movie_files(directory: Path) -> list[Path]:
@@ -41,9 +48,12 @@ def load_all_actors() -> list[str]:
     return sorted(full_list, key=lambda x: str.casefold(x))
 
 
-def load_all_movies() -> list:
+def load_all_movies(errors: list[dict] | None = None) -> list:
     """Returns a list of Movie objects from all saved collections.
 
+    Args:
+        errors (list[dict] | None): If given, malformed entries are appended to it, see iter_collection_movies().
+
     Returns:
         list[Movie]: Movies.
     """
@@ -51,27 +61,129 @@ def load_all_movies() -> list:
     full_list = []
 
     for file_path in constants.PATHS["collections"].glob("*.json"):
-        full_list.extend(load_collection_movies(file_path))
+        full_list.extend(load_collection_movies(file_path, errors))
     return full_list
 
 
-def load_collection_movies(collection_path) -> list:
+def load_collection_movies(collection_path, errors: list[dict] | None = None) -> list:
     """Returns a list of Movie objects from a collection's path.
 
     Args:
         collection_path: Collection's file's path.
+        errors (list[dict] | None): If given, malformed entries are appended to it, see iter_collection_movies().
 
     Returns
         list[Movie]: Collection's movies.
     """
 
-    content: list[dict] = load_file_content(collection_path)
+    return list(iter_collection_movies(collection_path, errors))
 
-    if content:
-        from packages.logic.movie import Movie
-        movies = [Movie.no_errors(data["title"], data["year"], data["path"], data["rating"]) for data in content]
-        return [movie for movie in movies if movie]
-    return []
+
+def iter_collection_movies(collection_path, errors: list[dict] | None = None) -> Iterator:
+    """Yields the Movie objects of a collection's file as soon as each one is read, so that the first ones can be
+    displayed before the whole file is parsed.
+    Malformed entries are skipped and reported with their character offset in the file: invalid JSON, entries
+    which are not objects or lack a title or a year, and movies refused by Movie's checks.
+
+    Args:
+        collection_path: Collection's file's path.
+        errors (list[dict] | None): If given, a {"file", "offset", "error"} dictionary is appended to it
+            for every malformed entry, once the file is read or the iteration stopped.
+
+    Returns:
+        Iterator[Movie]: Collection's movies.
+    """
+
+    from packages.logic.movie import Movie
+
+    found: list[dict] = []
+    try:
+        with open(collection_path, "r", encoding="UTF-8") as file:
+            for offset, data in iter_json_array(file, found):
+
+                if not isinstance(data, dict):
+                    found.append({"offset": offset, "error": f"Expecting an object, got {type(data).__name__}"})
+                    continue
+                if "title" not in data or "year" not in data:
+                    found.append({"offset": offset, "error": "Missing title or year"})
+                    continue
+
+                try:
+                    movie = Movie(data["title"], data["year"], data.get("path"), data.get("rating", "-"))
+                except (ValueError, FileNotFoundError) as error:
+                    found.append({"offset": offset, "error": str(error)})
+                    continue
+                yield movie
+
+    except FileNotFoundError:
+        return
+    finally:
+        if errors is not None:
+            errors.extend({"file": str(collection_path), **error} for error in found)
+
+
+def iter_json_array(file: TextIO, errors: list[dict] | None = None, chunk_size: int = CHUNK_SIZE) -> Iterator:
+    """Parses a JSON array incrementally, reading the file by chunks, and yields its elements one by one.
+    A malformed element is reported and skipped up to the next object, the following ones are still yielded.
+
+    Args:
+        file (TextIO): File opened in text mode.
+        errors (list[dict] | None): If given, an {"offset", "error"} dictionary is appended to it for every
+            malformed element, the offset being counted in characters from the start of the file.
+        chunk_size (int): Characters read at once.
+
+    Returns:
+        Iterator[tuple[int, object]]: Offset and value of every element.
+    """
+
+    decoder = json.JSONDecoder()
+    buffer: str = file.read(chunk_size)
+    start: int = 0  # Offset of the buffer in the file.
+    position: int = len(buffer) - len(buffer.lstrip())
+    end_of_file: bool = not buffer
+
+    def report(offset: int, error: str) -> None:
+        if errors is not None:
+            errors.append({"offset": offset, "error": error})
+
+    if buffer[position:position + 1] != "[":
+        report(position, "Expecting '['")
+        return
+    position += 1
+
+    while True:
+        position = SEPARATORS.match(buffer, position).end()
+
+        if position < len(buffer) and buffer[position] == "]":
+            return
+
+        if position < len(buffer):
+            try:
+                value, next_position = decoder.raw_decode(buffer, position)
+                following: str = buffer[next_position:next_position + 1]
+
+                # A number at the end of the buffer may go on in the next chunk.
+                if not (following in ",]" or following.isspace()) or (not following and not end_of_file):
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buffer, next_position)
+            except json.JSONDecodeError as error:
+                if end_of_file or len(buffer) - position >= MAX_ENTRY_SIZE:
+                    report(start + position, error.msg)
+                    resync: int = buffer.find("{", position + 1)
+                    if resync == -1 and end_of_file:
+                        return
+                    position = len(buffer) if resync == -1 else resync
+                    continue
+            else:
+                yield start + position, value
+                position = next_position
+                continue
+
+        if end_of_file:
+            report(start + position, "Expecting ']'")
+            return
+        chunk: str = file.read(chunk_size)
+        end_of_file = not chunk
+        buffer, start, position = buffer[position:] + chunk, start + position, 0
 
 
 def load_file_content(input_file) -> dict | list[dict]:
@@ -85,7 +197,7 @@ def load_file_content(input_file) -> dict | list[dict]:
     """
 
     try:
-        with open(input_file, "r", encoding="UTF-8") as file:
+        with metrics().timer("json.load"), open(input_file, "r", encoding="UTF-8") as file:
             return json.load(file)
 
     except (FileNotFoundError, json.JSONDecodeError):
@@ -2,7 +2,12 @@
 This module is designed for the processing of data.
 """
 
+import hashlib
+import json
+import os
 import re
+import threading
+import time
 from pathlib import Path
 from shutil import rmtree, copy
 
@@ -10,18 +15,194 @@ from PIL import Image
 
 from packages.constants import constants
 from packages.logic import data_import
+from packages.logic.metrics import metrics
 
+CACHE_GC_BUDGET: float = 0.5  # Seconds spent at most cleaning the cache when the application is closed.
+ORPHAN_TIME_TO_LIVE: int = 30 * 24 * 60 * 60  # Seconds an unused cache folder outside the collections is kept.
 
-def clear_cache() -> None:
-    """Clear unused cache data."""
+_cleaning_lock = threading.Lock()  # Held by the thread running clear_cache().
+
+
+def cache_fingerprint() -> str:
+    """Summarizes the state of the collections and of the cache folder without reading any file.
+
+    Returns:
+        str: Fingerprint; it changes whenever a collection is saved or a cache folder is added or removed.
+    """
+
+    digest = hashlib.sha1()
+    for file_path in sorted(constants.PATHS["collections"].glob("*.json")):
+        stat: os.stat_result = file_path.stat()
+        digest.update(f"{file_path.name}:{stat.st_mtime_ns}:{stat.st_size};".encode("UTF-8"))
+    digest.update(str(constants.PATHS["cache"].stat().st_mtime_ns).encode("UTF-8"))
+    return digest.hexdigest()
+
+
+def cache_folder_name(title: str) -> str:
+    """Returns the name of the cache folder of a movie, see Movie.storage.
+
+    Args:
+        title (str): Filtered movie title.
+
+    Returns:
+        str: Folder name.
+    """
+
+    folder_name: str = title.lower().replace(' ', '_')
+    return folder_name[4:] if folder_name.startswith("the_") else folder_name
+
+
+def clear_cache(budget: float | None = None, force: bool = False, time_to_live: float | None = None) -> dict:
+    """Clear unused cache data: the folders of movies outside the saved collections which were neither used
+    nor modified for 'time_to_live' seconds. The more recent ones are kept within the cache budget by
+    CacheManager.enforce(), least recently used first. Saved movies are read from the raw collection files,
+    so that video files are not checked, and the work stops once the time budget is spent. The last checked
+    folder is then kept in the cache marker, and the next call starts after it, going round to the first folders
+    afterwards.
+    A call made while another thread is cleaning the cache, e.g. at closing during the startup maintenance,
+    is skipped.
+
+    Args:
+        budget (float | None): Maximal duration in seconds, no limit if None.
+        force (bool): Whether to clean the cache even if nothing changed since the last complete cleaning.
+        time_to_live (float | None): Seconds an unused folder is kept, ORPHAN_TIME_TO_LIVE if None.
+
+    Returns:
+        dict: Number of removed folders, reclaimed bytes, and whether the cleaning was skipped or completed.
+    """
+
+    if not _cleaning_lock.acquire(blocking=False):
+        return {"removed": 0, "reclaimed": 0, "skipped": True, "complete": False}
+    try:
+        return _clear_cache(budget, force, ORPHAN_TIME_TO_LIVE if time_to_live is None else time_to_live)
+    finally:
+        _cleaning_lock.release()
+
+
+def _clear_cache(budget: float | None, force: bool, time_to_live: float) -> dict:
+
+    report: dict = {"removed": 0, "reclaimed": 0, "skipped": False, "complete": False}
 
     if not constants.PATHS["cache"].exists():
-        return
-    saved_movies_cache_paths = [movie.storage for movie in data_import.load_all_movies()]
+        report["complete"] = True
+        return report
+    start: float = time.monotonic()
+    started_at: float = time.time()
+    marker: Path = constants.PATHS["cache marker"]
+    marker_content: dict = data_import.load_file_content(marker)
+    fingerprint: str = cache_fingerprint()
+
+    # Nothing can be removed before the first kept folder expires, unless the collections or the cache changed.
+    if (not force and marker_content.get("fingerprint") == fingerprint and "cursor" not in marker_content
+            and started_at < (marker_content.get("expires") or float("inf"))):
+        report["skipped"] = report["complete"] = True
+        return report
+    saved_folders: set[str] = saved_cache_folders()
+    last_accesses: dict = cache_last_accesses()
+    expires: float | None = None
+
+    # Sorted so that an interrupted cleaning can go on after the last checked folder.
+    names: list[str] = sorted(path.name for path in constants.PATHS["cache"].iterdir())
+    cursor: str = marker_content.get("cursor", "")
+    resumed: int = len([name for name in names if name <= cursor])
+
+    for name in names[resumed:] + names[:resumed]:
+        if budget is not None and time.monotonic() - start > budget:
+            marker_content["cursor"] = cursor
+            with open(marker, "w", encoding="UTF-8") as marker_file:
+                json.dump(obj=marker_content, fp=marker_file)
+            return report
+        cursor = name
+        path: Path = constants.PATHS["cache"] / name
+
+        if name in saved_folders or not path.is_dir():
+            continue
+
+        # A recent folder may belong to a movie whose collection is not saved yet, or be browsed again soon.
+        last_used: float = max(path.stat().st_mtime, last_accesses.get(name, 0))
+        if last_used >= started_at - time_to_live:
+            expires = min(expires or float("inf"), last_used + time_to_live)
+            continue
+        size: int = folder_size(path)
+        rmtree(path, ignore_errors=True)
+        report["removed"] += 1
+        report["reclaimed"] += size
+
+    report["complete"] = True
+    marker_content = {"fingerprint": cache_fingerprint(), "timestamp": time.time(), "expires": expires}
+    with open(marker, "w", encoding="UTF-8") as marker_file:
+        json.dump(obj=marker_content, fp=marker_file)
+    return report
+
+
+def cache_last_accesses() -> dict[str, float]:
+    """Reads the last access of the user to every cache folder from the index saved by CacheManager.
+
+    Returns:
+        dict[str, float]: Timestamp by folder name.
+    """
+
+    content = data_import.load_file_content(constants.PATHS["cache index"])
+    entries = content.get("entries") if isinstance(content, dict) else None
+    return {name: entry[0] for name, entry in entries.items()} if isinstance(entries, dict) else {}
+
+
+def clear_cache_in_background(budget: float | None = None, then=None) -> threading.Thread:
+    """Runs clear_cache in a daemon thread.
+
+    Args:
+        budget (float | None): Maximal duration in seconds, no limit if None.
+        then: Callable without arguments run in the same thread once the cleaning is over.
+
+    Returns:
+        threading.Thread: Started thread.
+    """
+
+    def clean() -> None:
+        clear_cache(budget=budget)
+        if then is not None:
+            then()
+
+    thread = threading.Thread(target=clean, name="cache-cleaning", daemon=True)
+    thread.start()
+    return thread
+
+
+def folder_size(folder: Path) -> int:
+    """Returns the total size of the files within a folder and its subfolders.
+
+    Args:
+        folder (Path): Folder's path.
+
+    Returns:
+        int: Size in bytes.
+    """
+
+    size: int = 0
+    for root, _, files in os.walk(folder):
+        for file in files:
+            try:
+                size += os.stat(os.path.join(root, file)).st_size
+            except OSError:
+                continue
+    return size
+
+
+def saved_cache_folders() -> set[str]:
+    """Returns the names of the cache folders of every movie in a saved collection.
+
+    Returns:
+        set[str]: Folder names.
+    """
 
-    for path in constants.PATHS["cache"].iterdir():
-        if path not in saved_movies_cache_paths and path.is_dir():
-            rmtree(path)
+    folders: set[str] = set()
+    for file_path in constants.PATHS["collections"].glob("*.json"):
+        for data in data_import.load_file_content(file_path) or []:
+            try:
+                folders.add(cache_folder_name(filter_name(name=data["title"], limit=60)))
+            except (KeyError, TypeError, ValueError):
+                continue
+    return folders
 
 
 def filter_name(name: str, limit: int = 25) -> str:
@@ -64,9 +245,10 @@ def modify_raw_poster(poster: Path) -> None:
     """
 
     if poster.exists():
-        movie_poster = Image.open(poster)
-        movie_poster_resized = movie_poster.resize((185, 275))
-        movie_poster_resized.save(poster)
+        with metrics().timer("poster.process"):
+            movie_poster = Image.open(poster)
+            movie_poster_resized = movie_poster.resize((185, 275))
+            movie_poster_resized.save(poster)
 
 
 def set_local_poster(file, movie) -> None:
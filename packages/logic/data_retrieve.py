@@ -8,21 +8,26 @@ to respect the source websites by deliberately slowing down the program.
 import re
 import json
 from pathlib import Path
-from random import shuffle
-from time import sleep
+from functools import partial
+from time import monotonic, perf_counter, sleep
 
 import requests
-import wikipedia as wiki
-from bs4 import BeautifulSoup
 
 from packages.constants import constants
+from packages.logic import html_parsing
 from packages.logic.data_process import modify_raw_poster
 from packages.logic.movie import Movie
+from packages.logic.negative_cache import NegativeCache, negative_cache
+from packages.logic.network import HttpClient, fetch, probe
+from packages.logic.progress import ProgressReporter
+from packages.logic.source_stats import SourceStats, source_stats
+from packages.logic.wikipedia_client import wikipedia_client
 
 
 class MovieScraper(Movie):
     """MovieScraper object can process input and retrieve information"""
 
+    # Base URLs of the sources, every request is built from them so that they can be replaced (see benchmarks/).
     sources_websites: dict = {
         "SA": "http://www.impawards.com/",
         "SB": "https://www.movieposterdb.com/",
@@ -39,6 +44,7 @@ class MovieScraper(Movie):
                           'Chrome/114.0.0.0 Mobile Safari/537.36'
         }
 
+        self.progress: ProgressReporter | None = None
         self.storage.mkdir(exist_ok=True, parents=True)
 
     def download_info(self) -> None:
@@ -58,31 +64,18 @@ class MovieScraper(Movie):
         trailer: str = self.get_youtube_link()
         imdb: str = ''
 
-        wiki.set_lang("en")
-
-        search_query: str = f"{self.title} {self.year}"
-        page = None
-        for _ in range(2):
-            try:
-                page = wiki.page(search_query) if page is None else page
-                if summary == "The summary could not be retrieved.":
-                    summary = wiki.summary(search_query, 3)
-            except (wiki.exceptions.DisambiguationError, wiki.exceptions.PageError, wiki.exceptions.RedirectError):
-                search_query = f"{self.title} film"
-                continue
-            except wiki.exceptions.HTTPTimeoutError:
-                break
-            else:
-                title = page.title
-                actors = self.get_actors(page)
-                break
+        page: dict | None = wikipedia_client().lookup(f"{self.title} {self.year} film")
+        if page is not None:
+            title = page["title"] or title
+            summary = page["summary"] or summary
+            actors = page["actors"]
 
         sentence_containing_genres: str = summary.split('.')[0].casefold().replace(self.title.casefold(), '')
         for key, value in constants.MOVIE_GENRES.items():
             if key in sentence_containing_genres or value in sentence_containing_genres:
                 genre.append(key.title())
 
-        for link in self.generate_imp_links(end='html'):
+        for link in self.generate_imp_links(end='html', probing=True):
             imdb: str = self.get_imdb_page_link(link)
             if imdb:
                 sleep(1)
@@ -100,7 +93,8 @@ class MovieScraper(Movie):
         with open(self.data_file, 'w', encoding="UTF-8") as file:
             json.dump(data_to_store, file, indent=4)
 
-    def download_poster(self, override: bool = False, dir_path=None, filename="thumb.jpg", year: bool = True) -> None:
+    def download_poster(self, override: bool = False, dir_path=None, filename="thumb.jpg", year: bool = True,
+                        deadline: float | None = None) -> None:
         """Downloads movie poster.
 
         Args:
@@ -108,6 +102,8 @@ class MovieScraper(Movie):
             dir_path (Path): Allows specifying a destination path for the downloaded image.
             filename (str): Allows specifying a filename for the downloaded image.
             year (bool): Set to True to include the release year in the queries. If year is uncertain, set it to False.
+            deadline (float | None): Value of time.monotonic() after which no more poster is requested,
+                requests in flight are given the remaining time as timeout.
 
         Returns:
             None: None.
@@ -119,20 +115,42 @@ class MovieScraper(Movie):
         if path.exists() and not override:
             return
 
+        # Link generators by source; a source's links are only generated (which may cost requests) when it is tried.
+        generators: dict = {"SC": self.generate_cnm_link, "SB": self.generate_movie_pdb_link}
         if year:
-            links = self.generate_cnm_link() + self.generate_imp_links(end='jpg') + self.generate_movie_pdb_link()
-        else:
-            links = self.generate_cnm_link() + self.generate_movie_pdb_link()
-        shuffle(links)
+            generators["SA"] = partial(self.generate_imp_links, end='jpg', probing=True)
+        stats: SourceStats = source_stats()
 
-        for link in links:
-            response = requests.get(link, headers=self.headers, timeout=10)
-            if response.status_code == 200:
-                self._write_img_to_disk(url=response, path=path)
+        # Sources are tried by expected time to success, learned from previous downloads.
+        # Failed requests are retried with backoff, or skipped while their host is down, by the network layer.
+        for source in stats.order(list(generators)):
+            if deadline is not None and monotonic() >= deadline:
                 break
-            else:
-                sleep(3)
+            start: float = perf_counter()
+            poster = None
+            for link in generators[source]():
+                if deadline is None:
+                    response = fetch(link, headers=self.headers)
+                elif monotonic() < deadline:  # No retry, the request is bounded by the remaining time.
+                    response = fetch(link, headers=self.headers, retries=0,
+                                     timeout=max(min(deadline - monotonic(), HttpClient.timeout), 0.001))
+                else:
+                    break
+                if response is not None and response.status_code == 200:
+                    poster = response
+                    break
+
+            if poster is None and deadline is not None and monotonic() >= deadline:
+                break  # The source was not given its chance, it is not counted as a failure.
+            if poster is None:
+                stats.record(source, False, perf_counter() - start)
                 continue
+            stats.record(source, True, perf_counter() - start, len(poster.content))
+            self._write_img_to_disk(url=poster, path=path)
+            if self.progress is not None:
+                self.progress.add_bytes(len(poster.content))
+            break
+        stats.save()
 
     def generate_cnm_link(self) -> list[str]:
         """Generates CineMaterial download link.
@@ -143,46 +161,47 @@ class MovieScraper(Movie):
 
         sanitized_title: str = self.title.lower().replace(' ', '+')
         results_page_link: str = f"{self.sources_websites.get('SC')}search?q={sanitized_title}"
-        results_page = requests.get(results_page_link, headers=self.headers, timeout=10)
-
-        if results_page.status_code == 200:
-            cnm_soup = BeautifulSoup(results_page.text, 'html.parser')
-            div_element = cnm_soup.find('div', class_='table-responsive')
-            td_element = div_element.find_all('td')[1] if div_element and len(div_element.find_all('td')) >= 2 else None
-            page_link = td_element.find('a')['href'] if td_element and td_element.find('a') else ''
-            full_link: str = f"{self.sources_websites.get('SC')}{page_link[1:] if page_link else ''}"
-            posters_page = requests.get(full_link, headers=self.headers, timeout=10)
-
-            if full_link != self.sources_websites.get('SC') and posters_page.status_code == 200:
-                soup = BeautifulSoup(posters_page.text, 'html.parser')
-                cont_poster_link = soup.find('img', class_="lazy")
-                return [cont_poster_link.get('data-src')] if cont_poster_link else []
+        results_page = fetch(results_page_link, headers=self.headers)
+
+        if results_page is not None and results_page.status_code == 200:
+            page_link: str = html_parsing.cinematerial_result_link(results_page.text)
+            if not page_link:
+                negative_cache().add(results_page_link, NegativeCache.soft_time_to_live)  # The search has no result.
+                return []
+            full_link: str = f"{self.sources_websites.get('SC')}{page_link[1:]}"
+            posters_page = fetch(full_link, headers=self.headers)
+
+            if posters_page is not None and posters_page.status_code == 200:
+                poster_link: str = html_parsing.cinematerial_poster(posters_page.text)
+                return [poster_link] if poster_link else []
         return []
 
-    def generate_imp_links(self, end: str) -> list[str]:
-        """Generates IMP Awards links.
+    def generate_imp_links(self, end: str, probing: bool = False) -> list[str]:
+        """Generates IMP Awards links, best first.
 
         Args:
             end (str): End link extension, 'html' for web pages and 'jpg' for image links.
+            probing (bool): Set to True to keep only the best existing link, found with parallel HEAD requests.
 
         Returns:
             list[str]: Links in a list.
         """
 
-        imp_suffixes: set = {
-            "_ver2", "_ver3", "_ver4", "_ver5", "_ver6", "_ver7",
-            "_ver8", "_ver9", "_ver10", "_xlg", "_xxlg"
-        }
+        # Largest versions of the main poster first, but the main web page first since it holds the IMDb link.
+        imp_suffixes: tuple = ("_xxlg", "_xlg", "", "_ver2", "_ver3", "_ver4", "_ver5", "_ver6", "_ver7", "_ver8",
+                               "_ver9", "_ver10")
+        if end == 'html':
+            imp_suffixes = ("", "_xxlg", "_xlg") + imp_suffixes[3:]
 
         # Cached folder treats the movie title the same as http://www.impawards.com/ does.
         sanitized_title: str = self.storage.stem
 
-        def_imp_link: str = f"{MovieScraper.sources_websites.get('SA')}{self.year}/posters/{sanitized_title}.{end}"
-        links: list[str] = [f"{def_imp_link[:def_imp_link.index(end) - 1]}{suffix}.{end}" for suffix in imp_suffixes]
-        links.insert(0, def_imp_link)
+        folder: str = f"{self.sources_websites.get('SA')}{self.year}/{'posters/' if end == 'jpg' else ''}"
+        links: list[str] = [f"{folder}{sanitized_title}{suffix}.{end}" for suffix in imp_suffixes]
 
-        if end == 'html':
-            return [link.replace('posters/', '') for link in links]
+        if probing:
+            best_link: str | None = probe(links, headers=self.headers)
+            return [best_link] if best_link else []
         return links
 
     def generate_movie_pdb_link(self) -> list[str]:
@@ -193,41 +212,17 @@ class MovieScraper(Movie):
         """
 
         sanitized_title: str = self.title.lower().replace(' ', '%20')
-        url: str = f"{MovieScraper.sources_websites.get('SB')}search?q={sanitized_title}&imdb=0"
+        url: str = f"{self.sources_websites.get('SB')}search?q={sanitized_title}&imdb=0"
 
-        page = requests.get(url, headers=self.headers, timeout=10)
+        page = fetch(url, headers=self.headers)
 
-        if page.status_code == 200:
-            pdb_soup = BeautifulSoup(page.text, 'html.parser')
-            img_cont = pdb_soup.find(class_='vertical-image img-responsive poster_img lazyload')
-            return [img_cont.get('data-src')] if img_cont else []
+        if page is not None and page.status_code == 200:
+            poster_link: str = html_parsing.movieposterdb_poster(page.text)
+            if not poster_link:
+                negative_cache().add(url, NegativeCache.soft_time_to_live)
+            return [poster_link] if poster_link else []
         return []
 
-    @staticmethod
-    def get_actors(page: wiki.WikipediaPage) -> list[str]:
-        """Retrieves movie's actors from the wikipedia page.
-
-        Args:
-            page (wikipedia.WikipediaPage): Wikipedia page.
-
-        Returns:
-            list[str]: Actors in a list.
-        """
-
-        actors: list[str] = []
-        soup = BeautifulSoup(page.html(), 'html.parser')
-        starring_element = soup.find('th', string='Starring')
-
-        if starring_element:
-            starring_element_parent: str = str(starring_element.parent)
-            regex_pattern_a = r"title=\"[A-zÀ-ú -\.]+\">(.+?)<\/a>"
-            regex_pattern_b = r"<li>([A-zÀ-ú -\.]+)<\/li>"
-            regex = regex_pattern_a + '|' + regex_pattern_b
-            actors: list[tuple] = re.findall(regex, starring_element_parent)
-            actors: list[str] = ["".join(element) for element in actors]
-
-        return actors
-
     def get_imdb_page_link(self, imp_url: str) -> str:
         """Get the movie IMDb page using http://www.impawards.com/ URL.
         (Since IMDb does not allow scripts to browse its pages.)
@@ -241,24 +236,15 @@ class MovieScraper(Movie):
 
         imdb_base_url: str = "https://www.imdb.com/title/{}/"
 
-        response = requests.get(imp_url, headers=self.headers, timeout=10)
-        if response.status_code != 200:
+        response = fetch(imp_url, headers=self.headers)
+        if response is None or response.status_code != 200:
             return ""
 
-        soup = BeautifulSoup(response.text, 'html.parser')
-        div_elements = soup.find_all(name='div', class_="rightsidesmallbordered")
-        regex = r"title/(\w{9})\""
-
-        imdb_identifier = None
-        for element in div_elements:
-            element = str(element)
-            if "www.imdb.com" not in element:
-                continue
-
-            imdb_identifier = re.search(regex, element)
+        imdb_identifier: str = html_parsing.imp_imdb_identifier(response.text)
 
-        if imdb_identifier is not None:
-            return imdb_base_url.format(imdb_identifier[1])
+        if imdb_identifier:
+            return imdb_base_url.format(imdb_identifier)
+        negative_cache().add(imp_url, NegativeCache.soft_time_to_live)
         return ""
 
     def get_recommendations(self) -> list[str]:
@@ -272,19 +258,21 @@ class MovieScraper(Movie):
         sanitized_title: str = '-'.join([item.title() for item in sanitized_title])
         queries: list[str] = [f"{sanitized_title}-Movie", f"{sanitized_title}-{self.year}", sanitized_title]
 
-        response = ""
+        response = None
         for attempt in queries:
             url = f"{self.sources_websites.get('SE')}movies/like/{attempt}"
-            response = requests.get(url, headers=self.headers, timeout=10)
-            if response.status_code != 200:
+            response = fetch(url, headers=self.headers)
+            if response is None or response.status_code != 200:
                 continue
             else:
                 break
 
         regex = r'"recommendations":"(.*?), (.*?)?, (.*?)?"'
-        recommendations = re.search(regex, response.text)
+        recommendations = re.search(regex, response.text) if response is not None else None
 
         if recommendations is None:
+            if response is not None and response.status_code == 200:
+                negative_cache().add(url, NegativeCache.soft_time_to_live)
             return []
 
         valid_recommendations: list[str] = []
@@ -309,10 +297,12 @@ class MovieScraper(Movie):
         base_link: str = f"{self.sources_websites.get('SD')}embed/"
         page: str = f"{self.sources_websites.get('SD')}results?search_query={sanitized_query}+trailer"
 
-        response = requests.get(page, timeout=10)
-        if response.status_code == 200:
+        response = fetch(page)
+        if response is not None and response.status_code == 200:
             regex = r"watch\?v=(\S{11})"
             identifier = re.search(regex, response.text)
+            if identifier is None:
+                negative_cache().add(page, NegativeCache.soft_time_to_live)
         else:
             identifier = None
 
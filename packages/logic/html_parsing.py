@@ -0,0 +1,97 @@
+"""
+This module extracts the few elements the scrapers need from the pages of the source websites.
+
+Only the relevant part of a page is turned into a tree: a SoupStrainer tells BeautifulSoup which
+elements to keep, the rest of the document is skipped while parsing. lxml is used when it is installed,
+as it is much faster than the parser of the standard library.
+"""
+
+import re
+from importlib.util import find_spec
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+PARSER: str = "lxml" if find_spec("lxml") is not None else "html.parser"
+
+
+def parse(markup: str, name: str = None, **attributes) -> BeautifulSoup:
+    """Parses only the elements of a page matching a name and attributes.
+
+    Args:
+        markup (str): Page's content.
+        name (str): Tag name, any tag if None.
+        **attributes: Attributes filters, 'class_' for the class.
+
+    Returns:
+        BeautifulSoup: Tree containing the matching elements and their descendants.
+    """
+
+    return BeautifulSoup(markup, PARSER, parse_only=SoupStrainer(name, **attributes))
+
+
+def cinematerial_result_link(markup: str) -> str:
+    """Finds the link of the first result of a CineMaterial search.
+
+    Args:
+        markup (str): Search results page's content.
+
+    Returns:
+        str: Relative link, empty if there is no result.
+    """
+
+    div_element = parse(markup, "div", class_="table-responsive").find("div", class_="table-responsive")
+    td_elements: list = div_element.find_all("td") if div_element else []
+    td_element = td_elements[1] if len(td_elements) >= 2 else None
+    link = td_element.find("a") if td_element else None
+    return link["href"] if link else ""
+
+
+def cinematerial_poster(markup: str) -> str:
+    """Finds the poster link on a CineMaterial movie page.
+
+    Args:
+        markup (str): Movie page's content.
+
+    Returns:
+        str: Poster link, empty if there is none.
+    """
+
+    image = parse(markup, "img", class_="lazy").find("img")
+    return image.get("data-src", "") if image else ""
+
+
+def imp_imdb_identifier(markup: str) -> str:
+    """Finds the IMDb identifier linked from an IMP Awards movie page.
+
+    Args:
+        markup (str): Movie page's content.
+
+    Returns:
+        str: IMDb identifier, empty if there is none.
+    """
+
+    identifier: str = ""
+    soup: BeautifulSoup = parse(markup, "div", class_="rightsidesmallbordered")
+    for element in soup.find_all("div", class_="rightsidesmallbordered"):
+        element = str(element)
+        if "www.imdb.com" not in element:
+            continue
+
+        match = re.search(r"title/(\w{9})\"", element)
+        identifier = match[1] if match else identifier
+    return identifier
+
+
+def movieposterdb_poster(markup: str) -> str:
+    """Finds the poster link of the first result of a MoviePosterDB search.
+
+    Args:
+        markup (str): Search results page's content.
+
+    Returns:
+        str: Poster link, empty if there is none.
+    """
+
+    poster_class: str = "vertical-image img-responsive poster_img lazyload"
+    image = parse(markup, class_=poster_class).find(class_=poster_class)
+    return image.get("data-src", "") if image else ""
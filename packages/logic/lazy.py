@@ -0,0 +1,38 @@
+"""
+This module provides lazy imports, used to keep heavy dependencies (the scraping stack, QtWebEngine)
+out of the application start-up. A lazily imported module is only executed the first time one of
+its attributes is accessed.
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Returns a module that will be imported on first attribute access.
+
+    Args:
+        name (str): Absolute module name.
+
+    Returns:
+        ModuleType: The module (already imported if it was in sys.modules).
+
+    Raises:
+        ModuleNotFoundError: If the module cannot be found.
+    """
+
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module: ModuleType = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
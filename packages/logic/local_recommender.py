@@ -0,0 +1,228 @@
+"""
+This module contains an offline, content-based recommender working on the user's own library.
+
+Every movie is described by a sparse feature vector built from the genres and actors cached in its
+data.json file. The user's taste profile is the sum of the vectors of every rated movie, weighted by
+how far the rating is from a neutral rating. Candidates are ranked by the similarity between their
+vector and the profile, computed as a sparse matrix-vector product through an inverted index
+(feature -> movies), so only the features present in the profile are ever visited.
+
+The model is updated incrementally: rating, adding or removing a movie only touches that movie's row.
+Movies outside the library, e.g. the candidates of an online source, are scored against the same profile.
+"""
+
+import threading
+from math import sqrt
+
+from packages.logic.movie import Movie
+
+
+FEATURE_WEIGHTS: dict = {
+    "genre": 1.0,
+    "actor": 1.5
+}
+NEUTRAL_RATING: int = 3
+
+
+class LocalRecommender:
+
+    def __init__(self, movies: list[Movie] = None):
+
+        self._lock = threading.Lock()
+        self._movies: dict[str, Movie] = {}
+        self._rows: dict[str, dict[str, float]] = {}
+        self._weights: dict[str, int] = {}
+        self._index: dict[str, dict[str, float]] = {}
+        self._profile: dict[str, float] = {}
+
+        if movies:
+            self.fit(movies)
+
+    def __len__(self):
+
+        return len(self._rows)
+
+    def __repr__(self):
+
+        return f"LocalRecommender -> {len(self)} movie{'s' if len(self) > 1 else ''}, {len(self._index)} features"
+
+    @staticmethod
+    def features(movie: Movie) -> dict[str, float]:
+        """Builds the normalized feature vector of a movie from its data file.
+
+        Args:
+            movie (Movie): Movie to describe.
+
+        Returns:
+            dict[str, float]: Sparse vector, feature -> weight.
+        """
+
+        content: dict = movie.load_data_file()
+        vector: dict[str, float] = {}
+
+        for genre in content.get("genre", []):
+            vector[f"genre:{genre.casefold()}"] = FEATURE_WEIGHTS["genre"]
+
+        for actor in content.get("actors", []):
+            vector[f"actor:{actor.casefold()}"] = FEATURE_WEIGHTS["actor"]
+
+        norm: float = sqrt(sum(value * value for value in vector.values()))
+        return {feature: value / norm for feature, value in vector.items()} if norm else {}
+
+    @staticmethod
+    def key(movie: Movie) -> str:
+        """Returns the identifier of a movie in the model.
+
+        Args:
+            movie (Movie): Movie.
+
+        Returns:
+            str: Identifier.
+        """
+
+        return f"{movie.storage.name}:{movie.year}"
+
+    @staticmethod
+    def rating_weight(movie: Movie) -> int:
+        """Returns how much a movie contributes to the profile.
+
+        Args:
+            movie (Movie): Movie.
+
+        Returns:
+            int: Positive for liked movies, negative for disliked ones, 0 if not rated.
+        """
+
+        return int(movie.rating) - NEUTRAL_RATING if movie.rating.isdigit() else 0
+
+    def fit(self, movies: list[Movie]) -> None:
+        """Builds the model from scratch.
+
+        Args:
+            movies (list[Movie]): User's library.
+
+        Returns:
+            None: None.
+        """
+
+        with self._lock:
+            self._movies.clear()
+            self._rows.clear()
+            self._weights.clear()
+            self._index.clear()
+            self._profile.clear()
+
+            for movie in movies:
+                self._add(movie)
+
+    def recommend(self, limit: int = 3, exclude: set[str] = None) -> list[tuple[Movie, float]]:
+        """Ranks the unrated movies of the library against the user's profile.
+
+        Args:
+            limit (int): Maximal number of suggestions.
+            exclude (set[str]): Casefolded titles that must not be suggested.
+
+        Returns:
+            list[tuple[Movie, float]]: (movie, score) pairs, best first.
+        """
+
+        exclude = exclude or set()
+
+        with self._lock:
+            profile_norm: float = sqrt(sum(value * value for value in self._profile.values()))
+            if not profile_norm:
+                return []
+
+            scores: dict[str, float] = {}
+            for feature, profile_value in self._profile.items():
+                for key, value in self._index.get(feature, {}).items():
+                    scores[key] = scores.get(key, 0.0) + profile_value * value
+
+            ranking: list[tuple[Movie, float]] = [
+                (self._movies[key], score / profile_norm) for key, score in scores.items()
+                if score > 0 and not self._weights[key] and self._movies[key].title.casefold() not in exclude
+            ]
+
+        ranking.sort(key=lambda pair: pair[1], reverse=True)
+        return ranking[:limit]
+
+    def score(self, movie: Movie) -> float:
+        """Scores a movie, in the library or not, against the user's profile.
+
+        Args:
+            movie (Movie): Movie to score, described by its cached data.
+
+        Returns:
+            float: Cosine similarity between -1 and 1, 0 if the movie has no cached data or nothing is rated.
+        """
+
+        with self._lock:
+            row: dict[str, float] | None = self._rows.get(self.key(movie))
+        row = self.features(movie) if row is None else row
+
+        with self._lock:
+            profile_norm: float = sqrt(sum(value * value for value in self._profile.values()))
+            if not profile_norm:
+                return 0.0
+            return sum(self._profile.get(feature, 0.0) * value for feature, value in row.items()) / profile_norm
+
+    def remove(self, movie: Movie) -> None:
+        """Removes a movie from the model.
+
+        Args:
+            movie (Movie): Movie to remove.
+
+        Returns:
+            None: None.
+        """
+
+        with self._lock:
+            self._remove(self.key(movie))
+
+    def update(self, movie: Movie) -> None:
+        """Adds a movie to the model or refreshes it after its rating or data file changed.
+
+        Args:
+            movie (Movie): Movie to update.
+
+        Returns:
+            None: None.
+        """
+
+        with self._lock:
+            self._remove(self.key(movie))
+            self._add(movie)
+
+    def _add(self, movie: Movie) -> None:
+
+        key: str = self.key(movie)
+        row: dict[str, float] = self.features(movie)
+        weight: int = self.rating_weight(movie)
+
+        self._movies[key] = movie
+        self._rows[key] = row
+        self._weights[key] = weight
+
+        for feature, value in row.items():
+            self._index.setdefault(feature, {})[key] = value
+            if weight:
+                self._profile[feature] = self._profile.get(feature, 0.0) + weight * value
+
+    def _remove(self, key: str) -> None:
+
+        if key not in self._rows:
+            return
+        row: dict[str, float] = self._rows.pop(key)
+        weight: int = self._weights.pop(key)
+        del self._movies[key]
+
+        for feature, value in row.items():
+            postings: dict = self._index.get(feature, {})
+            postings.pop(key, None)
+            if not postings:
+                self._index.pop(feature, None)
+
+            if weight:
+                self._profile[feature] = self._profile.get(feature, 0.0) - weight * value
+                if abs(self._profile[feature]) < 1e-9:
+                    del self._profile[feature]
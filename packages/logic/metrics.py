@@ -0,0 +1,256 @@
+"""
+This module contains the MetricsRegistry class which measures where the time goes.
+
+Three kinds of metrics are kept in memory: counters (HTTP requests, cache hits), gauges (job queue depth)
+and latency histograms with fixed buckets (JSON loads, poster processing, list rebuilds).
+A metric may carry labels, e.g. the host of an HTTP request, which are part of its key: 'http.requests{host=...}'.
+The registry is shown by the '/stats' command and can be dumped as JSON for monitoring.
+"""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from time import perf_counter, time
+
+from packages.constants import constants
+
+
+def metric_key(name: str, labels: dict) -> str:
+    """Builds the key of a metric from its name and labels.
+
+    Args:
+        name (str): Metric name.
+        labels (dict): Labels, sorted by name in the key.
+
+    Returns:
+        str: Key, e.g. 'http.requests{host=www.impawards.com}'.
+    """
+
+    if not labels:
+        return name
+    return f"{name}{{{','.join(f'{label}={value}' for label, value in sorted(labels.items()))}}}"
+
+
+class Histogram:
+
+    # Upper bounds of the buckets in seconds, the last bucket holds the longer values.
+    bounds: tuple = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self):
+
+        self.buckets: list[int] = [0] * (len(Histogram.bounds) + 1)
+        self.count: int = 0
+        self.total: float = 0.0
+        self.minimum: float = float("inf")
+        self.maximum: float = 0.0
+
+    def __repr__(self):
+
+        return f"Histogram -> {self.count} value(s)"
+
+    def observe(self, value: float) -> None:
+        """Adds a value to the histogram.
+
+        Args:
+            value (float): Duration in seconds.
+
+        Returns:
+            None: None.
+        """
+
+        index: int = next((index for index, bound in enumerate(Histogram.bounds) if value <= bound),
+                          len(Histogram.bounds))
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def quantile(self, share: float) -> float:
+        """Estimates a quantile by linear interpolation within the bucket containing it, assuming its values are
+        evenly spread between its bounds, narrowed to the smallest and largest observed values.
+
+        Args:
+            share (float): Quantile between 0 and 1.
+
+        Returns:
+            float: Duration in seconds, between the smallest and the largest observed values.
+        """
+
+        if not self.count:
+            return 0.0
+        rank: float = share * self.count
+        cumulated: int = 0
+        lower: float = 0.0
+        for bound, number in zip([*Histogram.bounds, self.maximum], self.buckets):
+            if number and cumulated + number >= rank:
+                lower, upper = max(lower, self.minimum), min(bound, self.maximum)
+                return lower + (upper - lower) * max(rank - cumulated, 0) / number
+            cumulated += number
+            lower = bound
+        return self.maximum
+
+    def snapshot(self) -> dict:
+        """Returns a summary of the histogram.
+
+        Returns:
+            dict: Number of values, sum, mean, maximum and quantiles in seconds, and the bucket counts.
+        """
+
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "mean": round(self.total / self.count, 6) if self.count else 0.0,
+            "max": round(self.maximum, 6),
+            **{f"p{int(share * 100)}": round(self.quantile(share), 6) for share in (0.5, 0.9, 0.99)},
+            "buckets": dict(zip([*map(str, Histogram.bounds), "inf"], self.buckets))
+        }
+
+
+class MetricsRegistry:
+
+    def __init__(self):
+
+        self.counters: dict[str, float] = {}
+        self.gauges: dict[str, float] = {}
+        self.histograms: dict[str, Histogram] = {}
+        self.started_at: float = time()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+
+        return (f"MetricsRegistry -> {len(self.counters)} counter(s), {len(self.gauges)} gauge(s), "
+                f"{len(self.histograms)} histogram(s)")
+
+    def increment(self, name: str, value: float = 1, **labels) -> None:
+        """Increments a counter.
+
+        Args:
+            name (str): Metric name.
+            value (float): Increment.
+            **labels: Labels of the metric.
+
+        Returns:
+            None: None.
+        """
+
+        key: str = metric_key(name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels) -> None:
+        """Sets the current value of a gauge.
+
+        Args:
+            name (str): Metric name.
+            value (float): Value.
+            **labels: Labels of the metric.
+
+        Returns:
+            None: None.
+        """
+
+        key: str = metric_key(name, labels)
+        with self._lock:
+            self.gauges[key] = value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """Adds a duration to a latency histogram.
+
+        Args:
+            name (str): Metric name.
+            value (float): Duration in seconds.
+            **labels: Labels of the metric.
+
+        Returns:
+            None: None.
+        """
+
+        key: str = metric_key(name, labels)
+        with self._lock:
+            if key not in self.histograms:
+                self.histograms[key] = Histogram()
+            self.histograms[key].observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """Measures the duration of a block of code in a latency histogram.
+
+        Args:
+            name (str): Metric name.
+            **labels: Labels of the metric.
+        """
+
+        start: float = perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, perf_counter() - start, **labels)
+
+    def reset(self) -> None:
+        """Forgets every metric.
+
+        Returns:
+            None: None.
+        """
+
+        with self._lock:
+            self.counters.clear()
+            self.gauges.clear()
+            self.histograms.clear()
+            self.started_at = time()
+
+    def snapshot(self) -> dict:
+        """Returns the current value of every metric.
+
+        Returns:
+            dict: Counters, gauges and histograms by key, sorted by key.
+        """
+
+        with self._lock:
+            return {
+                "started_at": round(self.started_at, 3),
+                "uptime": round(time() - self.started_at, 3),
+                "counters": dict(sorted(self.counters.items())),
+                "gauges": dict(sorted(self.gauges.items())),
+                "histograms": {key: histogram.snapshot() for key, histogram in sorted(self.histograms.items())}
+            }
+
+    def dump(self, path: Path = None) -> Path:
+        """Atomically writes the current value of every metric as JSON.
+
+        Args:
+            path (Path): Destination file, PATHS["metrics"] if None.
+
+        Returns:
+            Path: Destination file.
+        """
+
+        path: Path = constants.PATHS["metrics"] if path is None else Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_file: Path = path.with_suffix(f".{threading.get_ident()}.tmp")
+
+        with open(temporary_file, "w", encoding="UTF-8") as file:
+            json.dump(self.snapshot(), file, indent=4)
+        os.replace(temporary_file, path)
+        return path
+
+
+_registry: MetricsRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def metrics() -> MetricsRegistry:
+    """Returns the registry shared by the whole application.
+
+    Returns:
+        MetricsRegistry: Registry.
+    """
+
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = MetricsRegistry()
+    return _registry
@@ -10,8 +10,9 @@ from pathlib import Path
 from typing import Any, Optional, Union
 
 from packages.constants import constants
+from packages.logic.cache_manager import cache_manager
 from packages.logic.data_import import load_file_content
-from packages.logic.data_process import filter_name
+from packages.logic.data_process import cache_folder_name, filter_name
 
 
 class Movie:
@@ -163,14 +164,21 @@ class Movie:
         content: dict = self.load_data_file()
         return content.get("genre", [])
 
-    def load_data_file(self) -> dict:
+    def load_data_file(self, record: bool = False) -> dict:
         """Loads data file and returns its content.
 
+        Args:
+            record (bool): Set to True when the data is shown to the user, the access then counts
+                in the cache's hit rate and least recently used order. Internal reads are not recorded.
+
         Returns:
             dict: Data file's content.
         """
 
-        return load_file_content(self.data_file)
+        content: dict = load_file_content(self.data_file)
+        if record:
+            cache_manager().record(self.storage, hit=bool(content))
+        return content
 
     @classmethod
     def no_errors(cls, *args) -> "Movie" | None:
@@ -261,9 +269,7 @@ class Movie:
             Path: Data storage folder's path.
         """
 
-        folder_name = self.title.lower().replace(' ', '_')
-        folder_name = folder_name[4:] if folder_name.startswith("the_") else folder_name
-        return Path(constants.PATHS["cache"] / folder_name)
+        return Path(constants.PATHS["cache"] / cache_folder_name(self.title))
 
     @property
     def thumb(self) -> Path:
@@ -0,0 +1,129 @@
+"""
+This module contains the NegativeCache class which remembers the lookups known to fail.
+
+Many requests fail deterministically for a given title: the IMP Awards URL variants that do not exist,
+TasteDive query variants, searches without results. They are stored, by normalized URL, with an expiry
+date, and the network layer does not send them again before it, so re-scraping a movie skips known misses.
+Definitive misses (404 and 410 answers) are kept for two weeks. Soft misses, pages answered normally but
+without the expected content, may be consent, bot-check or redesigned pages, so they are only kept for hours.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from time import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from packages.constants import constants
+from packages.logic.data_import import load_file_content
+
+
+def normalize_url(url: str) -> str:
+    """Normalizes a URL so that equivalent lookups share the same key: the scheme, the host and the query are
+    case-insensitive, the query parameters are sorted and the fragment is dropped.
+
+    Args:
+        url (str): URL.
+
+    Returns:
+        str: Normalized URL.
+    """
+
+    parts = urlsplit(url.strip())
+    query: str = urlencode(sorted((key, value.casefold()) for key, value in parse_qsl(parts.query)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/") or "/", query, ""))
+
+
+class NegativeCache:
+
+    time_to_live: float = 14 * 24 * 60 * 60  # Seconds.
+    soft_time_to_live: float = 6 * 60 * 60  # Seconds, for pages answered without the expected content.
+    save_interval: float = 10.0  # Seconds between two automatic saves.
+
+    def __init__(self, path: Path = None):
+
+        self.path: Path = constants.PATHS["negative cache"] if path is None else Path(path)
+        content = load_file_content(self.path)
+        now: float = time()
+        self._expiries: dict[str, float] = {
+            key: expiry for key, expiry in (content.items() if isinstance(content, dict) else []) if expiry > now}
+        self._saved_at: float = now
+        self._dirty: bool = False
+        self._lock = threading.Lock()
+
+    def __contains__(self, url: str) -> bool:
+
+        key: str = normalize_url(url)
+        with self._lock:
+            return self._expiries.get(key, 0) > time()
+
+    def __len__(self):
+
+        return len(self._expiries)
+
+    def __repr__(self):
+
+        return f"NegativeCache -> {len(self._expiries)} known miss(es)"
+
+    def add(self, url: str, time_to_live: float = None) -> None:
+        """Records a lookup known to fail, saving the cache from time to time.
+
+        Args:
+            url (str): URL.
+            time_to_live (float): Duration in seconds, 'time_to_live' if None.
+
+        Returns:
+            None: None.
+        """
+
+        now: float = time()
+        with self._lock:
+            self._expiries[normalize_url(url)] = now + (NegativeCache.time_to_live if time_to_live is None
+                                                        else time_to_live)
+            self._dirty = True
+            due: bool = now - self._saved_at > NegativeCache.save_interval
+
+        if due:
+            self.save()
+
+    def save(self) -> None:
+        """Atomically writes the unexpired entries if they changed.
+
+        Returns:
+            None: None.
+        """
+
+        with self._lock:
+            if not self._dirty:
+                return
+            now: float = time()
+            self._expiries = {key: expiry for key, expiry in self._expiries.items() if expiry > now}
+            content: str = json.dumps(self._expiries)
+            self._saved_at = now
+            self._dirty = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_file: Path = self.path.with_suffix(f".{threading.get_ident()}.tmp")
+
+        with open(temporary_file, "w", encoding="UTF-8") as file:
+            file.write(content)
+        os.replace(temporary_file, self.path)
+
+
+_cache: NegativeCache | None = None
+_cache_lock = threading.Lock()
+
+
+def negative_cache() -> NegativeCache:
+    """Returns the negative cache shared by every scraper.
+
+    Returns:
+        NegativeCache: Negative cache.
+    """
+
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = NegativeCache()
+    return _cache
@@ -0,0 +1,312 @@
+"""
+This module sends the HTTP requests of the scrapers.
+
+Every host has a circuit breaker: after a few consecutive failures (timeouts, connection errors, 403, 429
+or 5xx answers), requests to that host are refused at once instead of waiting for their timeout. After a
+cool-down, a single request is let through to probe the host; the circuit closes again if it succeeds.
+Retryable errors are retried with exponential backoff and full jitter, honoring the Retry-After header.
+URLs answered with 404 or 410 are stored in the negative cache and not requested again until they expire.
+At most 'host_concurrency' requests are sent to a host at the same time, which also bounds the parallel
+HEAD requests used to find the best of several candidate URLs before downloading it.
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from packages.logic.metrics import metrics
+from packages.logic.negative_cache import NegativeCache, negative_cache
+
+MISSING_STATUSES: frozenset = frozenset({404, 410})
+FAILURE_STATUSES: frozenset = frozenset({403, 429, 500, 502, 503, 504})
+RETRYABLE_STATUSES: frozenset = frozenset({429, 500, 502, 503, 504})
+UNSUPPORTED_STATUSES: frozenset = frozenset({405, 501})  # Answers of servers refusing HEAD requests.
+
+
+class CircuitBreaker:
+
+    closed: str = "closed"
+    open: str = "open"
+    half_open: str = "half-open"
+
+    def __init__(self, failure_threshold: int = 3, cool_down: float = 60.0):
+
+        self.failure_threshold: int = failure_threshold
+        self.cool_down: float = cool_down  # Seconds.
+        self.failures: int = 0
+        self.opened_at: float = 0.0
+        self._probing: bool = False
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+
+        return f"CircuitBreaker -> {self.state}, {self.failures} consecutive failure(s)"
+
+    @property
+    def state(self) -> str:
+        """Returns the state of the circuit.
+
+        Returns:
+            str: 'closed', 'open' or 'half-open'.
+        """
+
+        if self.failures < self.failure_threshold:
+            return CircuitBreaker.closed
+        if time.monotonic() - self.opened_at < self.cool_down:
+            return CircuitBreaker.open
+        return CircuitBreaker.half_open
+
+    def allow(self) -> bool:
+        """Tells whether a request may be sent; only one probe at a time is allowed when half-open.
+
+        Returns:
+            bool: True if the request may be sent.
+        """
+
+        with self._lock:
+            state: str = self.state
+
+            if state == CircuitBreaker.half_open and not self._probing:
+                self._probing = True
+                return True
+            return state == CircuitBreaker.closed
+
+    def record_failure(self) -> None:
+        """Records a failed request, opening the circuit once the threshold is reached.
+
+        Returns:
+            None: None.
+        """
+
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+    def record_success(self) -> None:
+        """Records a successful request, closing the circuit.
+
+        Returns:
+            None: None.
+        """
+
+        with self._lock:
+            self.failures = 0
+            self._probing = False
+
+
+class HttpClient:
+
+    max_retries: int = 2
+    backoff_base: float = 0.5  # Seconds.
+    backoff_cap: float = 8.0  # Seconds.
+    timeout: float = 10.0  # Seconds.
+    host_concurrency: int = 4  # Requests in flight per host.
+
+    def __init__(self, failure_threshold: int = 3, cool_down: float = 60.0, negative_cache: NegativeCache = None):
+
+        self.failure_threshold: int = failure_threshold
+        self.cool_down: float = cool_down
+        self.negative_cache: NegativeCache | None = negative_cache
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self.slots: dict[str, threading.BoundedSemaphore] = {}
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_maxsize=16))
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=16))
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+
+        return f"HttpClient -> {len(self.breakers)} host(s)"
+
+    def backoff(self, attempt: int, response: requests.Response | None = None) -> float:
+        """Returns the delay before a retry: a random duration up to an exponentially growing cap,
+        or the delay asked by the server.
+
+        Args:
+            attempt (int): Number of the failed attempt, starting at 0.
+            response (requests.Response | None): Failed response, if any.
+
+        Returns:
+            float: Delay in seconds.
+        """
+
+        retry_after: str = response.headers.get("Retry-After", "") if response is not None else ""
+
+        if retry_after.isdigit():
+            return min(float(retry_after), HttpClient.backoff_cap)
+        return random.uniform(0, min(HttpClient.backoff_cap, HttpClient.backoff_base * 2 ** attempt))
+
+    def breaker(self, url: str) -> CircuitBreaker:
+        """Returns the circuit breaker of the URL's host.
+
+        Args:
+            url (str): URL.
+
+        Returns:
+            CircuitBreaker: Circuit breaker.
+        """
+
+        host: str = urlsplit(url).netloc
+        with self._lock:
+            if host not in self.breakers:
+                self.breakers[host] = CircuitBreaker(self.failure_threshold, self.cool_down)
+            return self.breakers[host]
+
+    def slot(self, url: str) -> threading.BoundedSemaphore:
+        """Returns the semaphore limiting the number of requests in flight to the URL's host.
+
+        Args:
+            url (str): URL.
+
+        Returns:
+            threading.BoundedSemaphore: Semaphore.
+        """
+
+        host: str = urlsplit(url).netloc
+        with self._lock:
+            if host not in self.slots:
+                self.slots[host] = threading.BoundedSemaphore(HttpClient.host_concurrency)
+            return self.slots[host]
+
+    def fetch(self, url: str, method: str = "GET", retries: int = None, **kwargs) -> requests.Response | None:
+        """Sends a request through the circuit breaker of its host, retrying retryable errors.
+
+        Args:
+            url (str): URL.
+            method (str): HTTP method.
+            retries (int): Maximal number of retries, 'max_retries' if None.
+            **kwargs: Arguments of requests.Session.request().
+
+        Returns:
+            requests.Response | None: Last response, None if the URL is a known miss, if the circuit is open
+            or if no response was received.
+        """
+
+        host: str = urlsplit(url).netloc
+
+        if self.negative_cache is not None and url in self.negative_cache:
+            metrics().increment("http.skipped", host=host, reason="known miss")
+            return None
+        breaker: CircuitBreaker = self.breaker(url)
+        retries: int = HttpClient.max_retries if retries is None else retries
+        kwargs.setdefault("timeout", HttpClient.timeout)
+        response: requests.Response | None = None
+
+        for attempt in range(retries + 1):
+            if not breaker.allow():
+                metrics().increment("http.skipped", host=host, reason="open circuit")
+                return response
+            start: float = time.perf_counter()
+            try:
+                with self.slot(url):
+                    response = self.session.request(method, url, **kwargs)
+            except requests.RequestException:
+                response = None
+                metrics().increment("http.errors", host=host)
+            else:
+                metrics().increment("http.requests", host=host, method=method, status=response.status_code)
+                metrics().observe("http.latency", time.perf_counter() - start, host=host)
+                if response.status_code not in FAILURE_STATUSES:
+                    breaker.record_success()
+                    if self.negative_cache is not None and response.status_code in MISSING_STATUSES:
+                        self.negative_cache.add(url)
+                    return response
+
+            breaker.record_failure()
+            if (response is not None and response.status_code not in RETRYABLE_STATUSES) or attempt == retries:
+                break
+            time.sleep(self.backoff(attempt, response))
+        return response
+
+    def probe(self, urls: list[str], **kwargs) -> str | None:
+        """Sends HEAD requests to the URLs in parallel, within the hosts' concurrency limit, to find the first
+        one that exists without downloading them. Requests not sent yet are cancelled as soon as it is known.
+
+        Args:
+            urls (list[str]): URLs, best first.
+            **kwargs: Arguments of requests.Session.request().
+
+        Returns:
+            str | None: First URL that exists, or whose server refuses HEAD requests, None if there is none.
+        """
+
+        def exists(url: str) -> bool:
+            response: requests.Response | None = self.fetch(url, method="HEAD", retries=0, **kwargs)
+            return response is not None and (response.ok or response.status_code in UNSUPPORTED_STATUSES)
+
+        if not urls:
+            return None
+        executor = ThreadPoolExecutor(max_workers=min(len(urls), HttpClient.host_concurrency))
+        futures: list[Future] = [executor.submit(exists, url) for url in urls]
+
+        try:
+            # Waits for the candidates in order, a better one may still be pending when a worse one is found.
+            for url, future in zip(urls, futures):
+                if future.result():
+                    return url
+            return None
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def states(self) -> dict[str, str]:
+        """Returns the state of the circuit of every host contacted so far.
+
+        Returns:
+            dict[str, str]: State by host.
+        """
+
+        with self._lock:
+            return {host: breaker.state for host, breaker in self.breakers.items()}
+
+
+_client: HttpClient | None = None
+_client_lock = threading.Lock()
+
+
+def http_client() -> HttpClient:
+    """Returns the client shared by every scraper, so that hosts' states and connections are shared.
+
+    Returns:
+        HttpClient: Client.
+    """
+
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient(negative_cache=negative_cache())
+    return _client
+
+
+def fetch(url: str, **kwargs) -> requests.Response | None:
+    """Sends a request with the shared client, see HttpClient.fetch().
+
+    Args:
+        url (str): URL.
+        **kwargs: Arguments of HttpClient.fetch().
+
+    Returns:
+        requests.Response | None: Response, None if the host is unavailable.
+    """
+
+    return http_client().fetch(url, **kwargs)
+
+
+def probe(urls: list[str], **kwargs) -> str | None:
+    """Finds the first existing URL with the shared client, see HttpClient.probe().
+
+    Args:
+        urls (list[str]): URLs, best first.
+        **kwargs: Arguments of requests.Session.request().
+
+    Returns:
+        str | None: First existing URL, None if there is none.
+    """
+
+    return http_client().probe(urls, **kwargs)
@@ -0,0 +1,184 @@
+"""
+This module contains opt-in profiling hooks for the startup and the background jobs.
+
+Profiling is switched on with the PYMOMAN_PROFILE environment variable (or the '--profile' option of cli.py),
+set to 'cprofile', 'sample' or both separated by a comma:
+    PYMOMAN_PROFILE=cprofile,sample python run.py
+
+'cprofile' writes a pstats file per profiled block, to be read with pstats or snakeviz. 'sample' writes
+the stacks of the profiled thread, sampled every few milliseconds, in the collapsed format of flamegraph.pl
+and speedscope. Files are written to ~/.pymoman/profiles, only the most recent ones are kept.
+When profiling is off, a profiled block costs a single test.
+"""
+
+import os
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from time import time
+
+from packages.constants import constants
+
+MODES: frozenset = frozenset({"cprofile", "sample"})
+MAX_PROFILES: int = 50  # Files kept in the profiles folder.
+SAMPLE_INTERVAL: float = 0.005  # Seconds.
+
+_modes: frozenset = frozenset()
+_active = threading.local()  # Name of the block being profiled in the current thread, blocks do not nest.
+
+
+def enable(modes: str | None) -> frozenset:
+    """Switches profiling on or off.
+
+    Args:
+        modes (str | None): 'cprofile', 'sample' or both separated by a comma, profiling is off if empty.
+
+    Returns:
+        frozenset: Enabled modes, unknown ones are ignored.
+    """
+
+    global _modes
+    _modes = frozenset(mode.strip().casefold() for mode in (modes or "").split(",")) & MODES
+    return _modes
+
+
+def enabled() -> frozenset:
+    """Returns the enabled profiling modes.
+
+    Returns:
+        frozenset: Enabled modes, empty if profiling is off.
+    """
+
+    return _modes
+
+
+class StackSampler:
+
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL):
+
+        self.thread_id: int = thread_id
+        self.interval: float = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, name="StackSampler", daemon=True)
+
+    def __repr__(self):
+
+        return f"StackSampler -> {sum(self.stacks.values())} sample(s)"
+
+    def _sample(self) -> None:
+        """Records the stack of the sampled thread until stopped.
+
+        Returns:
+            None: None.
+        """
+
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)  # pylint: disable=protected-access
+            frames: list[str] = []
+
+            while frame is not None:
+                frames.append(f"{Path(frame.f_code.co_filename).stem}:{frame.f_code.co_name}")
+                frame = frame.f_back
+            if frames:
+                self.stacks[";".join(reversed(frames))] += 1
+
+    def start(self) -> None:
+        """Starts sampling in a daemon thread.
+
+        Returns:
+            None: None.
+        """
+
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops sampling.
+
+        Returns:
+            None: None.
+        """
+
+        self._stop.set()
+        self._thread.join()
+
+    def write(self, path: Path) -> None:
+        """Writes the sampled stacks in the collapsed format, one 'frame;frame;frame count' line per stack.
+
+        Args:
+            path (Path): Destination file.
+
+        Returns:
+            None: None.
+        """
+
+        with open(path, "w", encoding="UTF-8") as file:
+            file.writelines(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+def rotate(folder: Path, keep: int = MAX_PROFILES) -> None:
+    """Deletes the oldest profiles, keeping the most recent ones.
+
+    Args:
+        folder (Path): Profiles folder.
+        keep (int): Number of files kept.
+
+    Returns:
+        None: None.
+    """
+
+    files: list[Path] = sorted(folder.glob("*.*"), key=lambda file: file.stat().st_mtime, reverse=True)
+    for file in files[keep:]:
+        file.unlink(missing_ok=True)
+
+
+@contextmanager
+def profile(name: str):
+    """Profiles a block of code, or a function when used as a decorator, if profiling is on.
+    A block profiled inside another one of the same thread is part of the outer profile.
+
+    Args:
+        name (str): Name of the block, used in the files' names.
+    """
+
+    if not _modes or getattr(_active, "name", None) is not None:
+        yield
+        return
+
+    import cProfile
+
+    _active.name = name
+    profiler = cProfile.Profile() if "cprofile" in _modes else None
+    sampler = StackSampler(threading.get_ident()) if "sample" in _modes else None
+
+    if profiler is not None:
+        try:
+            profiler.enable()
+        except ValueError:  # Another thread is being profiled, on Python versions allowing a single profiler.
+            profiler = None
+    if sampler is not None:
+        sampler.start()
+
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        if sampler is not None:
+            sampler.stop()
+        _active.name = None
+
+        folder: Path = constants.PATHS["profiles"]
+        folder.mkdir(parents=True, exist_ok=True)
+        stem: str = f"{name}-{int(time() * 1000)}-{os.getpid()}-{threading.get_ident()}"
+
+        if profiler is not None:
+            profiler.dump_stats(folder / f"{stem}.pstats")
+        if sampler is not None:
+            sampler.write(folder / f"{stem}.collapsed")
+        rotate(folder, MAX_PROFILES)
+
+
+enable(os.environ.get("PYMOMAN_PROFILE"))
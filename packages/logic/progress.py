@@ -0,0 +1,82 @@
+"""
+This module contains the ProgressReporter class, used by workers to report their progress.
+
+A reporter counts items done out of a total and the number of bytes transferred. It is thread-safe and
+calls a listener after every update, so it can drive a progress bar (through a Qt signal) as well as
+a command-line output.
+"""
+
+import threading
+from typing import Callable
+
+
+class ProgressReporter:
+
+    def __init__(self, total: int = 0, listener: Callable[["ProgressReporter"], None] = None):
+
+        self._lock = threading.Lock()
+        self.listener: Callable[["ProgressReporter"], None] | None = listener
+        self.total: int = total
+        self.done: int = 0
+        self.bytes: int = 0
+
+    def __repr__(self):
+
+        return f"ProgressReporter -> {self.done}/{self.total} item{'s' if self.total > 1 else ''}, {self.bytes} bytes"
+
+    @property
+    def fraction(self) -> float:
+        """Returns the completed fraction.
+
+        Returns:
+            float: Value between 0 and 1.
+        """
+
+        return min(self.done / self.total, 1.0) if self.total else 0.0
+
+    def add_bytes(self, count: int) -> None:
+        """Records transferred bytes.
+
+        Args:
+            count (int): Number of bytes.
+
+        Returns:
+            None: None.
+        """
+
+        with self._lock:
+            self.bytes += count
+        self._notify()
+
+    def advance(self, items: int = 1) -> None:
+        """Records finished items.
+
+        Args:
+            items (int): Number of items finished.
+
+        Returns:
+            None: None.
+        """
+
+        with self._lock:
+            self.done += items
+        self._notify()
+
+    def set_total(self, total: int) -> None:
+        """Changes the number of items to process.
+
+        Args:
+            total (int): Number of items.
+
+        Returns:
+            None: None.
+        """
+
+        with self._lock:
+            self.total = total
+        self._notify()
+
+    def _notify(self) -> None:
+
+        if self.listener is not None:
+            self.listener(self)
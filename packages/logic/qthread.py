@@ -1,20 +1,26 @@
 """
 This module contains the definition of ScraperThread, a QThread subclass designed
 to execute methods on a MovieScraper object in a separate thread. The thread signals
-when it finishes or encounters an error.
+its progress (methods done, total, bytes downloaded), and when it finishes or encounters an error.
 """
 
 from typing import List, Tuple, Any
 
 from PySide6.QtCore import QThread, Signal
 
-from packages.logic.data_retrieve import MovieScraper
+from packages.logic.lazy import lazy_import
+from packages.logic.metrics import metrics
+from packages.logic.profiling import profile
+from packages.logic.progress import ProgressReporter
+
+data_retrieve = lazy_import("packages.logic.data_retrieve")
 
 
 class ScraperThread(QThread):
 
     thread_finished = Signal()
     thread_failed = Signal(str)
+    progress_changed = Signal(int, int, int)
 
     def __init__(self):
         super().__init__()
@@ -37,15 +43,16 @@ class ScraperThread(QThread):
         if len(args) < 2:
             raise ValueError("At least two arguments are required.")
 
-        elif not isinstance(args[0], MovieScraper):
+        elif not isinstance(args[0], data_retrieve.MovieScraper):
             raise TypeError("The first argument should be an instance of MovieScraper.")
 
         elif not all(isinstance(item, tuple) for item in args[1:]):
             raise TypeError("Subsequent arguments should be tuples (method_name, argument).")
 
-        self._movie_scraper_object: MovieScraper = args[0]
+        self._movie_scraper_object: data_retrieve.MovieScraper = args[0]
         self._methods_to_call = list(filter(lambda x: hasattr(self._movie_scraper_object, x[0]), args[1:]))
 
+    @profile("scraper")
     def run(self) -> None:
 
         if self._movie_scraper_object is None:
@@ -53,14 +60,25 @@ class ScraperThread(QThread):
             return
 
         processes: list = [(getattr(self._movie_scraper_object, method), arg) for method, arg in self._methods_to_call]
+        progress = ProgressReporter(len(processes), listener=self._emit_progress)
+        self._movie_scraper_object.progress = progress
 
-        for process, argument in processes:
+        for index, (process, argument) in enumerate(processes):
+            metrics().set_gauge("scraper.queued", len(processes) - index)
 
             try:
                 process(argument) if argument is not None else process()
 
             except Exception as error:
+                metrics().set_gauge("scraper.queued", 0)
                 self.thread_failed.emit(str(error))
                 return
 
+            progress.advance()
+
+        metrics().set_gauge("scraper.queued", 0)
         self.thread_finished.emit()
+
+    def _emit_progress(self, progress: ProgressReporter) -> None:
+
+        self.progress_changed.emit(progress.done, progress.total, progress.bytes)
@@ -0,0 +1,168 @@
+"""
+This module contains the RecommendationStore class which keeps track of movie recommendations.
+
+All the information about recommendations is kept in a small manifest file stored next to the posters:
+the current suggestions, and a history of every past suggestion (used to avoid suggesting the same
+movie twice). Poster filenames are derived from a hash of the title, so any title can be stored.
+"""
+
+import json
+import os
+import threading
+from hashlib import sha1
+from pathlib import Path
+from time import time
+
+from packages.constants import constants
+from packages.logic.data_import import load_file_content
+
+# Shared by every store: publications of different engines must not interleave their moves and deletions.
+_publish_lock = threading.Lock()
+
+
+class RecommendationStore:
+
+    manifest_name: str = "manifest.json"
+    history_limit: int = 500
+
+    def __init__(self, folder: Path = None):
+
+        self.folder: Path = constants.PATHS.get("recommendations") if folder is None else Path(folder)
+
+    def __repr__(self):
+
+        return f"RecommendationStore -> '{self.folder}'"
+
+    @property
+    def manifest(self) -> Path:
+        """Returns the manifest file's path.
+
+        Returns:
+            Path: Manifest file's path.
+        """
+
+        return Path(self.folder / RecommendationStore.manifest_name)
+
+    def current(self) -> list[dict]:
+        """Returns the current suggestions whose poster is available, best score first.
+
+        Returns:
+            list[dict]: Suggestions (title, trailer, poster, score, timestamp).
+        """
+
+        entries: list[dict] = self.load().get("current", [])
+        entries = [entry for entry in entries if self.poster_path(entry).exists()]
+        return sorted(entries, key=lambda entry: entry.get("score", 0), reverse=True)
+
+    def load(self) -> dict:
+        """Loads the manifest.
+
+        Returns:
+            dict: Manifest's content, with 'current' and 'history' lists.
+        """
+
+        content = load_file_content(self.manifest)
+
+        if not isinstance(content, dict):
+            content = {}
+        content.setdefault("current", [])
+        content.setdefault("history", [])
+        return content
+
+    def poster_path(self, entry: dict) -> Path:
+        """Returns the poster's path of a suggestion.
+
+        Args:
+            entry (dict): Suggestion.
+
+        Returns:
+            Path: Poster's path.
+        """
+
+        return Path(self.folder / entry.get("poster", ""))
+
+    @staticmethod
+    def poster_filename(title: str) -> str:
+        """Generates the poster filename of a suggestion.
+
+        Args:
+            title (str): Movie title.
+
+        Returns:
+            str: Poster filename.
+        """
+
+        return sha1(title.casefold().encode("UTF-8")).hexdigest()[:16] + ".jpg"
+
+    def publish(self, suggestions: list[dict], posters_dir: Path = None) -> None:
+        """Replaces the current suggestions and records them in the history.
+
+        Args:
+            suggestions (list[dict]): New suggestions, each with at least a 'title' and a 'poster' key.
+            posters_dir (Path): Folder containing the new posters, they are moved into the store.
+
+        Returns:
+            None: None.
+        """
+
+        with _publish_lock:
+            self._publish(suggestions, posters_dir)
+
+    def _publish(self, suggestions: list[dict], posters_dir: Path = None) -> None:
+
+        self.folder.mkdir(exist_ok=True, parents=True)
+        content: dict = self.load()
+        now: float = time()
+        current: list[dict] = []
+
+        for suggestion in suggestions:
+            entry: dict = {
+                "title": suggestion["title"],
+                "trailer": suggestion.get("trailer", ""),
+                "poster": suggestion.get("poster") or self.poster_filename(suggestion["title"]),
+                "score": float(suggestion.get("score", 0)),
+                "timestamp": suggestion.get("timestamp", now),
+                "source": suggestion.get("source", "")
+            }
+            if posters_dir is not None and Path(posters_dir / entry["poster"]).exists():
+                Path(posters_dir / entry["poster"]).replace(self.poster_path(entry))
+            current.append(entry)
+
+        new_titles: set[str] = {entry["title"].casefold() for entry in current}
+        history: list[dict] = [
+            entry for entry in content["history"] if entry.get("title", "").casefold() not in new_titles]
+        history += [{key: entry[key] for key in ("title", "score", "timestamp")} for entry in current]
+        content["current"] = current
+        content["history"] = history[-RecommendationStore.history_limit:]
+        self._write(content)
+
+        kept_posters: set[str] = {entry["poster"] for entry in current}
+        for file in self.folder.glob("*.jpg"):
+            if file.name not in kept_posters:
+                file.unlink()  # Removes old recommendations which may have become obsolete.
+
+    def seen_titles(self) -> set[str]:
+        """Returns the casefolded titles of every movie suggested so far.
+
+        Returns:
+            set[str]: Titles.
+        """
+
+        content: dict = self.load()
+        return {entry.get("title", "").casefold() for entry in content["history"] + content["current"]}
+
+    def _write(self, content: dict) -> None:
+        """Atomically writes the manifest.
+
+        Args:
+            content (dict): Manifest's content.
+
+        Returns:
+            None: None.
+        """
+
+        temporary_file: Path = self.manifest.with_suffix(".tmp")
+
+        with open(temporary_file, "w", encoding="UTF-8") as file:
+            json.dump(content, file, indent=4)
+        os.replace(temporary_file, self.manifest)
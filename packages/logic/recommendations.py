@@ -1,44 +1,55 @@
 """
 This module encapsulates the logic for generating new movie recommendations.
 It is designed to operate in the background.
+
+Recommendations are generated as a concurrent pipeline: TasteDive is queried for every
+selected movie at the same time, and as soon as a recommended title is known, its trailer
+lookup and poster download are started. The whole run is bounded by a worker pool and a deadline.
+
+Suggestions are first taken from the offline LocalRecommender, which ranks the user's unrated movies
+against their ratings and is published straight away. TasteDive is then an optional source of candidates,
+ranked by the same model: by their own cached data when there is some, otherwise by the score of the movies
+which recommended them. The best candidates of both sources are published.
+
+Each run owns its state. Posters are downloaded into a private staging folder and only
+published to the RecommendationStore once the run is complete, so several runs
+(or periodic refreshes) never mix their results. Movies suggested in the past are skipped.
 """
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from random import choice
 from pathlib import Path
-import base64
+from shutil import copy, rmtree
+from time import monotonic
+from uuid import uuid4
+import threading
 
 from packages.constants import constants
 from packages.logic.data_import import load_all_movies
 from packages.logic.data_retrieve import MovieScraper
+from packages.logic.local_recommender import LocalRecommender
 from packages.logic.movie import Movie
+from packages.logic.profiling import profile
+from packages.logic.recommendation_store import RecommendationStore
 
 
-SUGGESTED_MOVIES: dict = {
-    "Movie 1": [],
-    "Movie 2": [],
-    "Movie 3": []
-}
-
-
-def update_dict(func):
-    def wrapper(*args, **kwargs):
-        result = func(*args, **kwargs)
-        if not (isinstance(result, tuple) and len(result) == 3):
-            raise ValueError("The returned value cannot be added to the dictionary.")
-        for index, key in enumerate(SUGGESTED_MOVIES):
-            SUGGESTED_MOVIES[key].append(result[index])
-        return result
-    return wrapper
+MAX_SUGGESTIONS: int = 3
+MAX_WORKERS: int = 6
+RUN_DEADLINE: float = 90.0  # Seconds.
+POLL_INTERVAL: float = 0.5  # Seconds, how often a run checks whether it has been cancelled.
 
 
-def check_folder() -> bool:
+def check_folder(folder: Path = None) -> bool:
     """Checks that the recommendations directory exists, if not creates it.
 
+    Args:
+        folder (Path): Directory to check, defaults to the recommendations directory.
+
     Returns:
         bool: True if it exists, False if not.
     """
 
-    folder: Path = constants.PATHS.get("recommendations")
+    folder: Path = constants.PATHS.get("recommendations") if folder is None else folder
     folder.mkdir(exist_ok=True, parents=True)
 
     if folder.exists():
@@ -46,34 +57,18 @@ def check_folder() -> bool:
     return False
 
 
-@update_dict
-def collect_trailer_links(movies: tuple[Movie]) -> tuple:
-    """Gathers the trailer links for the given input movies.
-
-    Args:
-        movies (tuple[Movie]): A tuple containing three Movie objects.
-
-    Returns:
-        tuple: A tuple containing three YouTube links for movie trailers.
-    """
-
-    links: list = []
-    for movie in movies:
-        scraper = MovieScraper(movie)
-        links.append(scraper.get_youtube_link(year=False))
-
-    return tuple(links)
-
-
-def film_picker() -> list[Movie]:
+def film_picker(all_movies: list[Movie] = None) -> list[Movie]:
     """Selects three random movies from the user's personal collection.
     These randomly chosen movies serve as the basis for obtaining recommendations.
 
+    Args:
+        all_movies (list[Movie]): Movies to pick from, defaults to every saved movie.
+
     Returns:
         list[Movie]: A list containing the three selected movies.
     """
 
-    all_movies: list[Movie] = load_all_movies()
+    all_movies: list[Movie] = load_all_movies() if all_movies is None else all_movies
     selected_movies: list[Movie] = []
 
     for _ in range(3):
@@ -85,110 +80,349 @@ def film_picker() -> list[Movie]:
     return selected_movies
 
 
-@update_dict
-def generate_image_filename(dictionary: dict) -> tuple:
-    """Generates the filenames for movie posters.
-    Trailer links and movie title are encoded in the filename using the base64 module for simplification.
+class RecommendationResult:
+    """Outcome of a single recommendation run."""
 
-    Args:
-        dictionary (dict): A dictionary where values are links, and keys associated with these values are Movie objects.
+    def __init__(self, run_id: str):
 
-    Returns:
-        tuple: A tuple containing filenames for the posters of the three recommended movies.
-    """
+        self.run_id: str = run_id
+        self.suggestions: list[dict] = []
+        self.cancelled: bool = False
+        self.timed_out: bool = False
+        self.published: bool = False
 
-    separator: str = ':::'
+    def __repr__(self):
 
-    filenames: list = []
-    for link, movie in dictionary.items():
-        information: str = movie.title + separator + link
-        information_bytes = information.encode('ascii')
-        information_base64 = base64.b64encode(information_bytes)
-        hex_str = information_base64.decode('unicode_escape')
-        filenames.append(hex_str)
+        return f"RecommendationResult -> '{self.run_id}' with {len(self.suggestions)} suggestion(s)"
 
-    return tuple(filenames)
+    def __bool__(self):
 
+        return bool(self.suggestions)
 
-@update_dict
-def generate_recommendations(movies: list[Movie]) -> tuple:
-    """Generates three Movie objects corresponding to film suggestions for the user using the web scraping module.
 
-    Args:
-        movies (list[Movie]): Movies to generate recommendations from.
+class RecommendationRun:
+    """Handle on a recommendation run executing in a background thread."""
 
-    Returns:
-        tuple: A tuple containing three Movie objects representing recommended films or nothing.
-    """
+    def __init__(self, engine: "RecommendationEngine"):
 
-    many_recommendations: set[str] = set()
-    for movie in movies:
-        scraper = MovieScraper(movie)
-        many_recommendations.update(scraper.get_recommendations())
+        self.run_id: str = uuid4().hex
+        self._engine = engine
+        self._cancel_event = threading.Event()
+        self._done_event = threading.Event()
+        self._result: RecommendationResult = RecommendationResult(self.run_id)
+        self._thread = threading.Thread(target=self._target, name=f"recommendations-{self.run_id[:8]}", daemon=True)
+
+    def __repr__(self):
 
-    if len(many_recommendations) < 3:
-        return ()
+        state: str = "done" if self.done() else "cancelling" if self.cancelled() else "running"
+        return f"RecommendationRun -> '{self.run_id}' ({state})"
 
-    while len(many_recommendations) > 3:
-        many_recommendations.pop()
+    def _target(self) -> None:
 
-    dummy_year: int = 2000  # Year is required to create a Movie object.
-    # In this specific case, a wrong year is not problematic.
+        try:
+            self._engine.run(self)
+        finally:
+            self._done_event.set()
 
-    recommended_movies: list = []
-    for recommendation in many_recommendations:
-        movie_object: Movie = Movie(title=recommendation, year=dummy_year)
-        recommended_movies.append(movie_object)
+    def cancel(self) -> None:
+        """Asks the run to stop as soon as possible. Nothing is published by a cancelled run."""
 
-    return tuple(recommended_movies)
+        self._cancel_event.set()
 
+    def cancelled(self) -> bool:
+        """Returns True if cancellation has been requested."""
 
-def retrieve_information_from_files() -> dict:
-    """Retrieves information about recommended movies from file names.
+        return self._cancel_event.is_set()
 
-    Returns:
-        dict: Dictionary containing organized information about the movies.
-    """
+    def done(self) -> bool:
+        """Returns True once the run has finished, whatever its outcome."""
+
+        return self._done_event.is_set()
+
+    def result(self, timeout: float | None = None) -> RecommendationResult:
+        """Waits for the run to finish and returns its result.
+
+        Args:
+            timeout (float | None): Maximum number of seconds to wait, None to wait indefinitely.
+
+        Returns:
+            RecommendationResult: Result of the run (possibly incomplete if the timeout expired).
+        """
+
+        self._done_event.wait(timeout)
+        return self._result
+
+    def start(self) -> "RecommendationRun":
+        """Starts the run in a background thread.
 
-    if not constants.PATHS.get('recommendations').exists():
-        return {}
+        Returns:
+            RecommendationRun: The run itself.
+        """
 
-    files = constants.PATHS.get('recommendations').iterdir()
-    files = [file for file in files if file.suffix == '.jpg']
+        self._thread.start()
+        return self
 
-    if len(files) != 3:
-        return {}
 
-    movies_data: dict = {}
-    for file in files:
-        information = file.stem
-        information_bytes = information.encode('unicode_escape')
-        decoded_bytes = base64.b64decode(information_bytes)
-        decoded_information = decoded_bytes.decode('ascii')
-        data = decoded_information.split(':::')
-        movies_data[str(file.resolve())] = data
+class RecommendationEngine:
+    """Generates recommendations. Every run has its own state; only publication is shared."""
 
-    return movies_data
+    def __init__(self, max_suggestions: int = MAX_SUGGESTIONS, max_workers: int = MAX_WORKERS,
+                 deadline: float = RUN_DEADLINE, store: RecommendationStore = None, online: bool = True):
 
+        self.store: RecommendationStore = RecommendationStore() if store is None else store
+        self.recommender: LocalRecommender | None = None
+        self.online: bool = online
+        self.max_suggestions: int = max_suggestions
+        self.max_workers: int = max_workers
+        self.deadline: float = deadline
+        self._lock = threading.Lock()
+        self._current_run: RecommendationRun | None = None
 
-def main() -> None:
-    directory = check_folder()
-    selected_movies = film_picker()
+    def start(self) -> RecommendationRun:
+        """Starts a new run in the background. A run still in progress is cancelled first.
 
-    if not (directory and selected_movies):
-        return
+        Returns:
+            RecommendationRun: Handle of the new run.
+        """
 
-    for file in constants.PATHS.get('recommendations').iterdir():
-        file.unlink()  # Removes old recommendations which may have become obsolete.
+        with self._lock:
+            if self._current_run is not None and not self._current_run.done():
+                self._current_run.cancel()
+            self._current_run = RecommendationRun(self)
+            return self._current_run.start()
 
-    recommendations: tuple[Movie] = generate_recommendations(selected_movies)
-    links: tuple[str] = collect_trailer_links(recommendations)
-    generate_image_filename(dict(zip(links, recommendations)))
+    def update_movie(self, movie: Movie, removed: bool = False) -> None:
+        """Keeps the local model up to date after a movie was rated, added or removed.
+
+        Args:
+            movie (Movie): Concerned movie.
+            removed (bool): True if the movie was removed from the library.
+
+        Returns:
+            None: None.
+        """
+
+        if self.recommender is None:
+            return  # The model will be built from the saved library on the next run.
+
+        if removed:
+            self.recommender.remove(movie)
+        else:
+            self.recommender.update(movie)
+
+    @profile("recommendations")
+    def run(self, handle: RecommendationRun) -> RecommendationResult:
+        """Executes a run synchronously.
+
+        Args:
+            handle (RecommendationRun): Run to execute, used for cancellation and to store the result.
+
+        Returns:
+            RecommendationResult: Result of the run.
+        """
+
+        result: RecommendationResult = handle._result  # pylint: disable=protected-access
+        all_movies: list[Movie] = load_all_movies()
+        selected_movies: list[Movie] = film_picker(all_movies)
+
+        if not (check_folder(self.store.folder) and selected_movies):
+            return result
+
+        staging: Path = Path(self.store.folder / f".run-{handle.run_id}")
+        staging.mkdir(exist_ok=True, parents=True)
+
+        try:
+            if self.recommender is None:
+                self.recommender = LocalRecommender(all_movies)
+            result.suggestions = self._recommend_locally(staging)
+
+            if result.suggestions and not handle.cancelled():
+                result.published = self._publish(staging, handle, result.suggestions)
+
+            if self.online and not handle.cancelled():
+                online_suggestions: list[dict] = self._collect(selected_movies, staging, handle, result,
+                                                               self.max_suggestions)
+                ranking: list[dict] = self.rank(result.suggestions + online_suggestions)
+
+                if online_suggestions and not handle.cancelled():
+                    result.suggestions = ranking
+                    result.published = self._publish(staging, handle, result.suggestions)
+
+            result.cancelled = handle.cancelled()
+
+        finally:
+            rmtree(staging, ignore_errors=True)
+
+        return result
+
+    def _collect(self, movies: list[Movie], staging: Path, handle: RecommendationRun,
+                 result: RecommendationResult, limit: int) -> list[dict]:
+        """Runs the concurrent TasteDive pipeline and returns the completed suggestions.
+
+        Args:
+            movies (list[Movie]): Movies to generate recommendations from.
+            staging (Path): Private folder where posters are downloaded.
+            handle (RecommendationRun): Run handle, checked for cancellation.
+            result (RecommendationResult): Result object, flagged if the deadline is reached.
+            limit (int): Maximal number of suggestions.
+
+        Returns:
+            list[dict]: Completed suggestions (title, trailer, poster, score, votes), scored by the local model.
+        """
+
+        deadline: float = monotonic() + self.deadline
+        dummy_year: int = 2000  # Year is required to create a Movie object.
+        # In this specific case, a wrong year is not problematic.
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="recommendations")
+        sources: dict = {executor.submit(MovieScraper(movie).get_recommendations): movie for movie in movies}
+        pending: set = set(sources)
+        seen_titles: set[str] = {movie.title.casefold() for movie in movies} | self.store.seen_titles()
+        seen_titles.update(suggestion["title"].casefold() for suggestion in result.suggestions)
+        votes: dict[str, float] = {}
+        affinities: dict[str, float] = {}
+        suggestions: list = []
+
+        try:
+            while pending and len(suggestions) < limit and not handle.cancelled():
+                if monotonic() >= deadline:
+                    result.timed_out = True
+                    break
+
+                finished, pending = wait(pending, timeout=POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                for lookup in finished:
+                    titles: list[str] = lookup.result() if lookup.exception() is None else []
+                    affinity: float = self.recommender.score(sources[lookup])
+
+                    for rank, title in enumerate(titles):
+                        movie: Movie | None = Movie.no_errors(title, dummy_year)
+                        if movie is None:
+                            continue
+                        # A title recommended by several movies, or ranked first, gets more votes;
+                        # one recommended first by a movie close to the user's taste gets a better affinity.
+                        votes[movie.title] = votes.get(movie.title, 0) + 1 / (rank + 1)
+                        affinities[movie.title] = max(affinities.get(movie.title, -1.0), affinity / (rank + 1))
+                        if movie.title.casefold() in seen_titles:
+                            continue
+                        if len(suggestions) >= limit:
+                            break
+                        seen_titles.add(movie.title.casefold())
+                        suggestions.append(executor.submit(self._process, movie, staging, deadline, handle))
+
+            waiting: set = set(suggestions)
+            while waiting and not handle.cancelled():
+                if monotonic() >= deadline:
+                    result.timed_out = True
+                    break
+                _, waiting = wait(waiting, timeout=POLL_INTERVAL)
+
+            # Jobs finishing after the deadline or the cancellation are not used.
+            finished: list = [job for job in suggestions
+                              if job.done() and not job.cancelled() and job.exception() is None]
+        finally:
+            # Running jobs are bounded by the deadline, they are waited for so that none writes in the staging
+            # folder once it is removed.
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        completed: list[dict] = [job.result() for job in finished if job.result()]
+
+        for suggestion in completed:
+            own_score: float = self.recommender.score(Movie(suggestion["title"], dummy_year))
+            suggestion["score"] = round(own_score or affinities.get(suggestion["title"], 0), 3)
+            suggestion["votes"] = round(votes.get(suggestion["title"], 0), 3)
+            suggestion["source"] = "tastedive"
+        return completed
+
+    def rank(self, suggestions: list[dict]) -> list[dict]:
+        """Keeps the best suggestions, by local score then by number of votes of the online source.
+
+        Args:
+            suggestions (list[dict]): Suggestions of every source.
+
+        Returns:
+            list[dict]: At most 'max_suggestions' suggestions, best first.
+        """
+
+        ranking: list[dict] = sorted(suggestions, key=lambda item: (item["score"], item.get("votes", 0)), reverse=True)
+        return ranking[:self.max_suggestions]
+
+    def _recommend_locally(self, staging: Path) -> list[dict]:
+        """Ranks the user's unrated movies with the LocalRecommender. No network access is required.
+
+        Args:
+            staging (Path): Private folder where the cached posters are copied.
+
+        Returns:
+            list[dict]: Suggestions (title, trailer, poster, score).
+        """
+
+        suggestions: list[dict] = []
+
+        for movie, score in self.recommender.recommend(self.max_suggestions, exclude=self.store.seen_titles()):
+            if not movie.thumb.exists():
+                continue
+            filename: str = RecommendationStore.poster_filename(movie.title)
+            copy(movie.thumb, staging / filename)
+            suggestions.append({
+                "title": movie.title,
+                "trailer": movie.load_data_file().get("trailer", ""),
+                "poster": filename,
+                "score": round(score, 3),
+                "source": "local"
+            })
+        return suggestions
+
+    @staticmethod
+    def _process(movie: Movie, staging: Path, deadline: float, handle: RecommendationRun) -> dict:
+        """Retrieves the trailer link and the poster of a recommended movie.
+
+        Args:
+            movie (Movie): Recommended movie.
+            staging (Path): Folder where the poster is downloaded.
+            deadline (float): Value of time.monotonic() after which no more requests should be issued.
+            handle (RecommendationRun): Run handle, checked for cancellation.
+
+        Returns:
+            dict: Suggestion (title, trailer, poster) or an empty dict if the run was interrupted.
+        """
 
-    for movie, _, filename in SUGGESTED_MOVIES.values():
         scraper = MovieScraper(movie)
-        scraper.download_poster(
-            override=True,
-            dir_path=constants.PATHS.get('recommendations'),
-            filename=filename + '.jpg',
-            year=False)
+        link: str = scraper.get_youtube_link(year=False)
+        filename: str = RecommendationStore.poster_filename(movie.title)
+
+        if monotonic() >= deadline or handle.cancelled():
+            return {}
+
+        scraper.download_poster(override=True, dir_path=staging, filename=filename, year=False, deadline=deadline)
+
+        if not Path(staging / filename).exists():
+            return {}
+        return {"title": movie.title, "trailer": link, "poster": filename}
+
+    def _publish(self, staging: Path, handle: RecommendationRun, suggestions: list[dict]) -> bool:
+        """Replaces the published recommendations with the suggestions of a finished run.
+
+        Args:
+            staging (Path): Folder containing the run's posters.
+            handle (RecommendationRun): Run handle; only the most recent run may publish.
+            suggestions (list[dict]): Suggestions to publish.
+
+        Returns:
+            bool: True if the suggestions were published.
+        """
+
+        with self._lock:
+            if handle is not self._current_run and self._current_run is not None:
+                return False
+            self.store.publish(suggestions, posters_dir=staging)
+        return True
+
+
+def main() -> RecommendationResult:
+    """Generates new recommendations and waits for them.
+
+    Returns:
+        RecommendationResult: Result of the run.
+    """
+
+    return RecommendationEngine().start().result()
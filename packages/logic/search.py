@@ -0,0 +1,298 @@
+"""
+This module provides the search indexes used by the search bar.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Callable
+
+
+def movie_fields(movie) -> dict[str, str]:
+    """Returns the searchable fields of a movie, reading its data file once.
+
+    Args:
+        movie (Movie): Movie to describe.
+
+    Returns:
+        dict[str, str]: Field name -> text.
+    """
+
+    content: dict = movie.load_data_file()
+    return {
+        "title": movie.title,
+        "official_title": content.get("title", ""),
+        "actors": " ".join(content.get("actors", [])),
+        "summary": content.get("summary", "")
+    }
+
+
+class PrefixIndex:
+    """Casefolded prefix index over a list of items, kept in a sorted array and queried with bisect.
+
+    Results are returned in the order of the indexed list, not in alphabetical order.
+    """
+
+    def __init__(self, items: list = None, key: Callable[[Any], str] = str):
+
+        self.key: Callable[[Any], str] = key
+        self._entries: list[tuple[str, int]] = []
+        self._items: dict[int, Any] = {}
+        self._positions: dict[int, tuple[str, int]] = {}
+        self._counter: int = 0
+
+        if items:
+            self.rebuild(items)
+
+    def __contains__(self, item):
+
+        return id(item) in self._positions
+
+    def __len__(self):
+
+        return len(self._positions)
+
+    def __repr__(self):
+
+        return f"PrefixIndex -> {len(self)} item{'s' if len(self) > 1 else ''}"
+
+    def add(self, item: Any) -> None:
+        """Adds an item to the index, after every item already indexed.
+
+        Args:
+            item: Item to add.
+
+        Returns:
+            None: None.
+        """
+
+        if item in self:
+            return
+
+        entry: tuple[str, int] = (self.key(item).casefold(), self._counter)
+        self._counter += 1
+        insort(self._entries, entry)
+        self._items[entry[1]] = item
+        self._positions[id(item)] = entry
+
+    def rebuild(self, items: list) -> None:
+        """Indexes a new list of items from scratch.
+
+        Args:
+            items (list): Items to index.
+
+        Returns:
+            None: None.
+        """
+
+        self._items = dict(enumerate(items))
+        self._positions = {id(item): (self.key(item).casefold(), position) for position, item in enumerate(items)}
+        self._entries = sorted(self._positions.values())
+        self._counter = len(items)
+
+    def remove(self, item: Any) -> None:
+        """Removes an item from the index.
+
+        Args:
+            item: Item to remove.
+
+        Returns:
+            None: None.
+        """
+
+        entry: tuple[str, int] | None = self._positions.pop(id(item), None)
+
+        if entry is None:
+            return
+        index: int = bisect_left(self._entries, entry)
+        del self._entries[index]
+        del self._items[entry[1]]
+
+    def search(self, prefix: str) -> list:
+        """Returns the items whose key starts with the given prefix.
+
+        Args:
+            prefix (str): Prefix to look for, casefolded internally.
+
+        Returns:
+            list: Matching items.
+        """
+
+        prefix = prefix.casefold()
+
+        if not prefix:
+            return [self._items[position] for position in sorted(self._items)]
+
+        start: int = bisect_left(self._entries, (prefix, -1))
+        end: int = bisect_right(self._entries, (prefix + chr(0x10FFFF), -1), lo=start)
+        return [self._items[position] for position in sorted(entry[1] for entry in self._entries[start:end])]
+
+    def update(self, item: Any) -> None:
+        """Re-indexes an item whose key has changed (after a rename), keeping its place in the list.
+
+        Args:
+            item: Item to update.
+
+        Returns:
+            None: None.
+        """
+
+        entry: tuple[str, int] | None = self._positions.get(id(item))
+
+        if entry is None:
+            self.add(item)
+            return
+
+        self.remove(item)
+        new_entry: tuple[str, int] = (self.key(item).casefold(), entry[1])
+        insort(self._entries, new_entry)
+        self._items[new_entry[1]] = item
+        self._positions[id(item)] = new_entry
+
+
+class TrigramIndex:
+    """Fuzzy full-text index. Every field of an item is split into trigrams stored in an inverted index.
+
+    The score of an item is, for its best field, the share of the query's trigrams found in that field
+    multiplied by the field's weight. Substrings ("matrix" in "The Matrix") therefore score 1.0, and
+    small typos only lower the score a little.
+    """
+
+    field_weights: dict = {
+        "title": 1.0,
+        "official_title": 1.0,
+        "actors": 0.9,
+        "summary": 0.7
+    }
+    min_score: float = 0.6
+
+    def __init__(self, items: list = None, fields: Callable[[Any], dict[str, str]] = None):
+
+        self.fields: Callable[[Any], dict[str, str]] = fields or (lambda item: {"title": str(item)})
+        self._postings: dict[str, set[tuple[int, str]]] = {}
+        self._documents: dict[int, dict[str, set[str]]] = {}
+        self._items: dict[int, Any] = {}
+
+        for item in items or []:
+            self.add(item)
+
+    def __contains__(self, item):
+
+        return id(item) in self._items
+
+    def __len__(self):
+
+        return len(self._items)
+
+    def __repr__(self):
+
+        return f"TrigramIndex -> {len(self)} item{'s' if len(self) > 1 else ''}, {len(self._postings)} trigrams"
+
+    @staticmethod
+    def trigrams(text: str) -> set[str]:
+        """Splits a text into casefolded trigrams. Words are padded so that word starts weigh more.
+
+        Args:
+            text (str): Text to split.
+
+        Returns:
+            set[str]: Trigrams.
+        """
+
+        words: list[str] = "".join(char if char.isalnum() else " " for char in text.casefold()).split()
+        grams: set[str] = set()
+
+        for word in words:
+            padded: str = f"  {word} "
+            grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+        return grams
+
+    def add(self, item: Any) -> None:
+        """Indexes an item.
+
+        Args:
+            item: Item to index.
+
+        Returns:
+            None: None.
+        """
+
+        if item in self:
+            return
+
+        key: int = id(item)
+        document: dict[str, set[str]] = {
+            field: self.trigrams(text) for field, text in self.fields(item).items()
+            if field in TrigramIndex.field_weights and text
+        }
+        self._items[key] = item
+        self._documents[key] = document
+
+        for field, grams in document.items():
+            for gram in grams:
+                self._postings.setdefault(gram, set()).add((key, field))
+
+    def remove(self, item: Any) -> None:
+        """Removes an item from the index.
+
+        Args:
+            item: Item to remove.
+
+        Returns:
+            None: None.
+        """
+
+        key: int = id(item)
+
+        if key not in self._items:
+            return
+        del self._items[key]
+
+        for field, grams in self._documents.pop(key).items():
+            for gram in grams:
+                postings: set = self._postings.get(gram, set())
+                postings.discard((key, field))
+                if not postings:
+                    self._postings.pop(gram, None)
+
+    def search(self, query: str, limit: int = 200) -> list[tuple[Any, float]]:
+        """Returns the items matching a query, best first.
+
+        Args:
+            query (str): Text to look for.
+            limit (int): Maximal number of results.
+
+        Returns:
+            list[tuple[Any, float]]: (item, score) pairs.
+        """
+
+        query_grams: set[str] = self.trigrams(query)
+
+        if not query_grams:
+            return []
+
+        matches: dict[tuple[int, str], int] = {}
+        for gram in query_grams:
+            for posting in self._postings.get(gram, ()):
+                matches[posting] = matches.get(posting, 0) + 1
+
+        scores: dict[int, float] = {}
+        for (key, field), count in matches.items():
+            score: float = TrigramIndex.field_weights[field] * count / len(query_grams)
+            scores[key] = max(scores.get(key, 0.0), score)
+
+        ranking: list[tuple[Any, float]] = [
+            (self._items[key], round(score, 3)) for key, score in scores.items() if score >= TrigramIndex.min_score]
+        ranking.sort(key=lambda pair: pair[1], reverse=True)
+        return ranking[:limit]
+
+    def update(self, item: Any) -> None:
+        """Re-indexes an item whose fields have changed (renamed or freshly scraped).
+
+        Args:
+            item: Item to update.
+
+        Returns:
+            None: None.
+        """
+
+        self.remove(item)
+        self.add(item)
@@ -0,0 +1,174 @@
+"""
+This module contains the SourceStats class which keeps statistics about the poster sources.
+
+For every source, the number of attempts and successes, the latest latencies and the downloaded bytes are
+stored in a small file. Attempts and successes decay with a half-life, so that old failures weigh less and
+a source that recovers is tried first again. Sources are ordered by their expected time to success: the
+median latency divided by the hit rate.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from statistics import median
+from time import time
+
+from packages.constants import constants
+from packages.logic.data_import import load_file_content
+
+
+class SourceStats:
+
+    half_life: float = 7 * 24 * 60 * 60  # Seconds.
+    latency_window: int = 50
+    default_latency: float = 1.0  # Seconds, for sources never successful.
+
+    def __init__(self, path: Path = None):
+
+        self.path: Path = constants.PATHS["source stats"] if path is None else Path(path)
+        content = load_file_content(self.path)
+        self._sources: dict[str, dict] = content if isinstance(content, dict) else {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+
+        return f"SourceStats -> {len(self._sources)} source(s)"
+
+    def _decayed(self, source: str, now: float) -> dict:
+        """Returns the statistics of a source, with attempts and successes decayed to the present.
+
+        Args:
+            source (str): Source key.
+            now (float): Current timestamp.
+
+        Returns:
+            dict: Statistics.
+        """
+
+        stats: dict = self._sources.setdefault(
+            source, {"attempts": 0.0, "successes": 0.0, "latencies": [], "bytes": 0, "updated": now})
+        factor: float = 0.5 ** (max(0.0, now - stats["updated"]) / SourceStats.half_life)
+        stats["attempts"] *= factor
+        stats["successes"] *= factor
+        stats["updated"] = now
+        return stats
+
+    def expected_time(self, source: str) -> float:
+        """Returns the expected time before a poster is obtained from a source.
+
+        Args:
+            source (str): Source key.
+
+        Returns:
+            float: Duration in seconds.
+        """
+
+        with self._lock:
+            stats: dict = self._decayed(source, time())
+            return self._expected_time(stats)
+
+    @staticmethod
+    def _expected_time(stats: dict) -> float:
+        """Returns the median latency divided by the hit rate, which assumes one success in two for unknown sources.
+
+        Args:
+            stats (dict): Decayed statistics of a source.
+
+        Returns:
+            float: Duration in seconds.
+        """
+
+        hit_rate: float = (stats["successes"] + 1) / (stats["attempts"] + 2)
+        latencies: list[float] = stats["latencies"]
+        return (median(latencies) if latencies else SourceStats.default_latency) / hit_rate
+
+    def order(self, sources: list[str]) -> list[str]:
+        """Sorts sources by expected time to success, fastest first.
+
+        Args:
+            sources (list[str]): Source keys.
+
+        Returns:
+            list[str]: Sorted source keys.
+        """
+
+        return sorted(sources, key=self.expected_time)
+
+    def record(self, source: str, success: bool, latency: float, size: int = 0) -> None:
+        """Records an attempt to get a poster from a source.
+
+        Args:
+            source (str): Source key.
+            success (bool): Whether a poster was obtained.
+            latency (float): Duration of the attempt in seconds.
+            size (int): Downloaded bytes.
+
+        Returns:
+            None: None.
+        """
+
+        with self._lock:
+            stats: dict = self._decayed(source, time())
+            stats["attempts"] += 1
+            stats["bytes"] += size
+
+            if success:
+                stats["successes"] += 1
+                stats["latencies"] = (stats["latencies"] + [round(latency, 3)])[-SourceStats.latency_window:]
+
+    def save(self) -> None:
+        """Atomically writes the statistics.
+
+        Returns:
+            None: None.
+        """
+
+        with self._lock:
+            content: str = json.dumps(self._sources)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_file: Path = self.path.with_suffix(f".{threading.get_ident()}.tmp")
+
+        with open(temporary_file, "w", encoding="UTF-8") as file:
+            file.write(content)
+        os.replace(temporary_file, self.path)
+
+    def snapshot(self) -> dict[str, dict]:
+        """Returns a summary of every source, fastest first.
+
+        Returns:
+            dict[str, dict]: Hit rate, median latency, downloaded bytes and expected time by source.
+        """
+
+        summary: dict = {}
+        with self._lock:
+            now: float = time()
+            for source in list(self._sources):
+                stats: dict = self._decayed(source, now)
+                summary[source] = {
+                    "attempts": round(stats["attempts"], 2),
+                    "hit_rate": round(stats["successes"] / stats["attempts"], 3) if stats["attempts"] else None,
+                    "median_latency": round(median(stats["latencies"]), 3) if stats["latencies"] else None,
+                    "bytes": stats["bytes"],
+                    "expected_time": round(self._expected_time(stats), 3)
+                }
+        return dict(sorted(summary.items(), key=lambda item: item[1]["expected_time"]))
+
+
+_stats: SourceStats | None = None
+_stats_lock = threading.Lock()
+
+
+def source_stats() -> SourceStats:
+    """Returns the statistics shared by every scraper.
+
+    Returns:
+        SourceStats: Statistics.
+    """
+
+    global _stats
+    with _stats_lock:
+        if _stats is None:
+            _stats = SourceStats()
+    return _stats
@@ -0,0 +1,156 @@
+"""
+This module contains the WikipediaClient class which looks up movies on Wikipedia.
+
+A single MediaWiki API query searches the article and returns, at the same time, the plain text
+introduction (used as summary) and the wikitext of the lead section, which holds the infobox the
+actors are parsed from. Results, including misses, are cached on disk. The request is sent by the
+shared HttpClient, like those of the other sources, so it has the same circuit breaker, retries and metrics.
+"""
+
+import json
+import re
+import threading
+from hashlib import sha1
+from pathlib import Path
+from time import time
+
+import requests
+
+from packages.constants import constants
+from packages.logic.data_import import load_file_content
+from packages.logic.network import HttpClient, http_client
+
+
+def parse_starring(wikitext: str) -> list[str]:
+    """Extracts the actors listed in the 'starring' field of an infobox.
+
+    Args:
+        wikitext (str): Wikitext containing the infobox.
+
+    Returns:
+        list[str]: Actors in a list.
+    """
+
+    field = re.search(r"^\s*\|\s*starring\s*=(.*?)(?=^\s*\|\s*\w[\w ]*=|^\s*}}|\Z)", wikitext,
+                      flags=re.IGNORECASE | re.MULTILINE | re.DOTALL)
+
+    if field is None:
+        return []
+    value: str = re.sub(r"<ref[^>]*/>|<ref.*?</ref>|<!--.*?-->", "", field[1], flags=re.DOTALL)
+    value = re.sub(r"\[\[(?:[^|\]]*\|)?([^\]]*)]]", r"\1", value)  # [[Page|Name]] and [[Name]] become Name.
+    value = re.sub(r"{{\s*(?:efn|sfn|refn|citation needed|cn)\b[^{}]*}}", "", value, flags=re.IGNORECASE)
+    value = re.sub(r"{{[^|{}]*\|?", "", value)  # List templates such as {{Plainlist| or {{ubl| are unwrapped.
+    value = re.sub(r"<br\s*/?>|\n|\|", "\n", value.replace("}}", ""))
+
+    actors: list[str] = []
+    for line in value.split("\n"):
+        actor: str = re.sub(r"<[^>]+>|'{2,}", "", line).strip(" *•\t")
+        if actor and actor not in actors:
+            actors.append(actor)
+    return actors
+
+
+class WikipediaClient:
+
+    api_url: str = "https://en.wikipedia.org/w/api.php"
+    headers: dict = {"User-Agent": "Pymoman (https://github.com/Tony-TRT/Pymoman)"}
+    time_to_live: float = 30 * 24 * 60 * 60  # Seconds.
+    summary_sentences: int = 3
+
+    def __init__(self, folder: Path = None, client: HttpClient = None):
+
+        self.folder: Path = constants.PATHS["wikipedia"] if folder is None else Path(folder)
+        self.client: HttpClient = http_client() if client is None else client
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+
+        return f"WikipediaClient -> '{self.api_url}'"
+
+    def cache_path(self, query: str) -> Path:
+        """Returns the cache file's path of a query.
+
+        Args:
+            query (str): Search query.
+
+        Returns:
+            Path: Cache file's path.
+        """
+
+        return Path(self.folder / (sha1(query.casefold().encode("UTF-8")).hexdigest()[:16] + ".json"))
+
+    def lookup(self, query: str) -> dict | None:
+        """Returns the best matching article, from the cache if possible.
+
+        Args:
+            query (str): Search query.
+
+        Returns:
+            dict | None: Article title, summary and actors, None if nothing was found.
+        """
+
+        cached = load_file_content(self.cache_path(query))
+
+        if cached and time() - cached.get("timestamp", 0) < WikipediaClient.time_to_live:
+            return cached.get("page")
+
+        try:
+            page: dict | None = self.query(query)
+        except (requests.RequestException, ValueError):
+            return None  # Network errors are not cached, the next lookup tries again.
+
+        with self._lock:
+            self.folder.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_path(query), "w", encoding="UTF-8") as file:
+                json.dump({"timestamp": time(), "page": page}, file)
+        return page
+
+    def query(self, query: str) -> dict | None:
+        """Searches the article and fetches its introduction and lead section in a single request.
+
+        Args:
+            query (str): Search query.
+
+        Returns:
+            dict | None: Article title, summary and actors, None if nothing was found.
+        """
+
+        parameters: dict = {
+            "action": "query", "format": "json", "formatversion": 2, "redirects": 1,
+            "generator": "search", "gsrsearch": query, "gsrlimit": 1,
+            "prop": "extracts|revisions|pageprops",
+            "exintro": 1, "explaintext": 1, "exsentences": WikipediaClient.summary_sentences,
+            "rvprop": "content", "rvslots": "main", "rvsection": 0,
+            "ppprop": "disambiguation"
+        }
+        response: requests.Response | None = self.client.fetch(self.api_url, params=parameters,
+                                                               headers=WikipediaClient.headers)
+        if response is None:
+            raise requests.ConnectionError(f"No response from {self.api_url}")
+        response.raise_for_status()
+        pages: list[dict] = response.json().get("query", {}).get("pages", [])
+
+        if not pages or "disambiguation" in pages[0].get("pageprops", {}):
+            return None
+        page: dict = pages[0]
+        revisions: list[dict] = page.get("revisions") or [{}]
+        wikitext: str = revisions[0].get("slots", {}).get("main", {}).get("content", "")
+        return {"title": page.get("title", ""), "summary": page.get("extract", ""), "actors": parse_starring(wikitext)}
+
+
+_client: WikipediaClient | None = None
+_client_lock = threading.Lock()
+
+
+def wikipedia_client() -> WikipediaClient:
+    """Returns the client shared by every scraper, so that cached results are written by a single client.
+
+    Returns:
+        WikipediaClient: Client.
+    """
+
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = WikipediaClient()
+    return _client
@@ -0,0 +1,199 @@
+"""
+This module contains the models displayed by the main list view.
+
+The CatalogModel exposes the in-memory collections or movies without creating any widget per item,
+so the view only renders the visible rows. The CatalogProxyModel filters and sorts on top of it.
+The optional "GO BACK" row is represented by None.
+"""
+
+from typing import Any, Callable
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QSortFilterProxyModel, Qt
+from PySide6.QtGui import QIcon
+
+from packages.logic.collection import Collection
+from packages.logic.movie import Movie
+
+
+class CatalogModel(QAbstractListModel):
+
+    ItemRole: int = Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.icons: dict[str, QIcon] = {}
+        self._items: list[Collection | Movie | None] = []
+        self._rows: dict[int, int] = {}
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+
+        if not index.isValid() or not 0 <= index.row() < len(self._items):
+            return None
+        item = self._items[index.row()]
+
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return "GO BACK" if item is None else item.name if isinstance(item, Collection) else item.title
+
+        elif role == Qt.DecorationRole:
+            if item is None:
+                return self.icons.get("previous")
+            elif isinstance(item, Movie):
+                return self.icons.get("movie")
+            return self.icons.get("collection") if item.path.exists() else None
+
+        elif role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+
+        elif role == CatalogModel.ItemRole:
+            return item
+        return None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+
+        return 0 if parent.isValid() else len(self._items)
+
+    @property
+    def items(self) -> list[Collection | Movie]:
+        """Returns the displayed items, without the "GO BACK" row.
+
+        Returns:
+            list[Collection | Movie]: Items.
+        """
+
+        return [item for item in self._items if item is not None]
+
+    def insert_item(self, item: Collection | Movie) -> None:
+        """Appends an item to the displayed list.
+
+        Args:
+            item: Collection or Movie object.
+
+        Returns:
+            None: None.
+        """
+
+        if id(item) in self._rows:
+            return
+
+        row: int = len(self._items)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._items.append(item)
+        self._rows[id(item)] = row
+        self.endInsertRows()
+
+    def refresh_item(self, item: Collection | Movie) -> None:
+        """Notifies the view that an item's text or icon has changed.
+
+        Args:
+            item: Collection or Movie object.
+
+        Returns:
+            None: None.
+        """
+
+        row: int | None = self._rows.get(id(item))
+
+        if row is not None:
+            index: QModelIndex = self.index(row)
+            self.dataChanged.emit(index, index)
+
+    def refresh_items(self) -> None:
+        """Notifies the view that every displayed item may have changed.
+
+        Returns:
+            None: None.
+        """
+
+        if self._items:
+            self.dataChanged.emit(self.index(0), self.index(len(self._items) - 1))
+
+    def remove_item(self, item: Collection | Movie) -> None:
+        """Removes an item from the displayed list.
+
+        Args:
+            item: Collection or Movie object.
+
+        Returns:
+            None: None.
+        """
+
+        row: int | None = self._rows.get(id(item))
+
+        if row is None:
+            return
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._items[row]
+        del self._rows[id(item)]
+
+        for element in self._items[row:]:
+            if element is not None:
+                self._rows[id(element)] -= 1
+        self.endRemoveRows()
+
+    def row_of(self, item: Collection | Movie) -> int | None:
+        """Returns the row of an item.
+
+        Args:
+            item: Collection or Movie object.
+
+        Returns:
+            int | None: Row, None if the item is not displayed.
+        """
+
+        return self._rows.get(id(item))
+
+    def set_items(self, items: list[Collection] | list[Movie], go_back: bool = False) -> None:
+        """Replaces the displayed list in a single model reset.
+
+        Args:
+            items: List of Collection objects or Movie objects.
+            go_back (bool): True to display a "GO BACK" row first.
+
+        Returns:
+            None: None.
+        """
+
+        self.beginResetModel()
+        self._items = ([None] if go_back else []) + list(items)
+        self._rows = {id(item): row for row, item in enumerate(self._items) if item is not None}
+        self.endResetModel()
+
+
+class CatalogProxyModel(QSortFilterProxyModel):
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._predicate: Callable[[Any], bool] | None = None
+        self.setDynamicSortFilter(False)
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+
+        if self._predicate is None:
+            return True
+
+        item = self.sourceModel().index(source_row, 0, source_parent).data(CatalogModel.ItemRole)
+        return item is None or self._predicate(item)
+
+    def lessThan(self, source_left: QModelIndex, source_right: QModelIndex) -> bool:
+
+        left, right = source_left.data(CatalogModel.ItemRole), source_right.data(CatalogModel.ItemRole)
+
+        if left is None or right is None:
+            return left is None and right is not None  # "GO BACK" always stays first.
+        return str(left).casefold() < str(right).casefold()
+
+    def set_predicate(self, predicate: Callable[[Any], bool] | None) -> None:
+        """Filters the displayed items.
+
+        Args:
+            predicate: Function returning True for the items to keep, None to display everything.
+
+        Returns:
+            None: None.
+        """
+
+        self._predicate = predicate
+        self.invalidateFilter()
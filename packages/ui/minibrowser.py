@@ -4,10 +4,11 @@ This module loads a link in a small browser.
 
 from PySide6.QtWidgets import QGridLayout
 from PySide6.QtCore import QUrl, Qt
-from PySide6.QtWebEngineWidgets import QWebEngineView
+from PySide6.QtGui import QCloseEvent
 
 from packages.logic.movie import Movie
 from packages.ui.aesthetic import AestheticWindow
+from packages.ui.webviewpool import pool
 
 
 class MiniBrowser(AestheticWindow):
@@ -23,7 +24,7 @@ class MiniBrowser(AestheticWindow):
         if one_url:
             url = one_url
         elif movie and movie.data_file.exists():
-            url = QUrl(movie.load_data_file().get(content))
+            url = QUrl(movie.load_data_file(record=True).get(content))
 
         self.url = url if url else None
 
@@ -37,7 +38,8 @@ class MiniBrowser(AestheticWindow):
         # Widgets.
         ##################################################
 
-        self.browser = QWebEngineView()
+        # The view is borrowed from the shared pool and given back when the window is closed.
+        self.browser = pool().acquire()
 
         if self.url is not None:
             self.browser.load(self.url)
@@ -46,3 +48,19 @@ class MiniBrowser(AestheticWindow):
 
         self.main_layout.addWidget(self.browser, 0, 0, 1, 1)
         self.ui_manage_icons()
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        """Gives the web view back to the pool before the window is deleted.
+
+        Args:
+            event (QCloseEvent): Close event.
+
+        Returns:
+            None: None.
+        """
+
+        if self.browser is not None:
+            self.main_layout.removeWidget(self.browser)
+            pool().release(self.browser)
+            self.browser = None
+        super().closeEvent(event)
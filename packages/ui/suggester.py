@@ -2,26 +2,36 @@
 This module contains code for the window that displays movie recommendations at startup.
 """
 
-import threading
 from functools import partial
 
 from PySide6 import QtWidgets
-from PySide6.QtCore import Qt, QUrl
+from PySide6.QtCore import QEvent, Qt, QTimer, QUrl
 from PySide6.QtGui import QPixmap
 
-from packages.logic import recommendations
+from packages.logic.lazy import lazy_import
+from packages.logic.recommendation_store import RecommendationStore
 from packages.ui.aesthetic import AestheticWindow
-from packages.ui.minibrowser import MiniBrowser
+
+# The scraping stack and QtWebEngine are only loaded once recommendations are refreshed or a trailer is opened.
+recommendations = lazy_import("packages.logic.recommendations")
+minibrowser = lazy_import("packages.ui.minibrowser")
+webviewpool = lazy_import("packages.ui.webviewpool")
 
 
 class RecPanel(AestheticWindow):
 
+    refresh_interval: int = 4 * 60 * 60 * 1000  # Milliseconds.
+    startup_delay: int = 3000  # Milliseconds.
+
     def __init__(self):
         super().__init__()
 
         self.setWindowTitle("Python Movie Manager - Movie Suggestions")
         self.setFixedSize(900, 420)
-        self.recommendations: dict = recommendations.retrieve_information_from_files()
+        self.store = RecommendationStore()
+        self.recommendations: list[dict] = self.store.current()
+        self._engine = None
+        self.refresh_timer = QTimer(self)
 
         ##################################################
         # Layouts.
@@ -43,18 +53,18 @@ class RecPanel(AestheticWindow):
         self.images: dict = {}
         self.buttons: dict = {}
 
-        for index, (path, (title, url)) in enumerate(self.recommendations.items()):
+        for index, entry in enumerate(self.recommendations):
 
             # Movie posters
-            image = QPixmap(path)
+            image = QPixmap(str(self.store.poster_path(entry)))
             image_label = QtWidgets.QLabel()
             image_label.setPixmap(image)
-            image_label.setToolTip(title)
+            image_label.setToolTip(entry.get("title"))
             image_label.setAlignment(Qt.AlignCenter)
 
             # Buttons
             button = QtWidgets.QPushButton("Watch Trailer")
-            button.link = QUrl(url)
+            button.link = QUrl(entry.get("trailer"))
 
             key: str = "Movie {}".format(index + 1)
             self.images[key] = image_label
@@ -70,7 +80,24 @@ class RecPanel(AestheticWindow):
             self.show()
 
         # Whether the window is displayed or hidden, we must refresh recommendations.
-        threading.Thread(target=recommendations.main, daemon=True).start()
+        # In a long-running session they are refreshed periodically, each run replacing the previous one.
+        # The first run is delayed so that it does not slow down the start-up.
+        self.refresh_timer.timeout.connect(self.logic_refresh_recommendations)
+        self.refresh_timer.start(RecPanel.refresh_interval)
+        QTimer.singleShot(RecPanel.startup_delay, self.logic_refresh_recommendations)
+
+    @property
+    def engine(self):
+        """Returns the recommendation engine, creating it on first use.
+
+        Returns:
+            RecommendationEngine: Engine.
+        """
+
+        if self._engine is None:
+            self._engine = recommendations.RecommendationEngine(
+                store=self.store, online=self.settings.get("online_recommendations", True))
+        return self._engine
 
     def logic_connect_widgets(self) -> None:
         """Connections are managed here.
@@ -81,6 +108,7 @@ class RecPanel(AestheticWindow):
 
         for button in self.buttons.values():
             button.clicked.connect(partial(self.logic_mini_browser, button.link))
+            button.installEventFilter(self)
 
     def logic_mini_browser(self, url: QUrl) -> None:
         """Instantiates a small browser that loads a link.
@@ -92,9 +120,18 @@ class RecPanel(AestheticWindow):
             None: None.
         """
 
-        self.mini_browser = MiniBrowser(one_url=url)
+        self.mini_browser = minibrowser.MiniBrowser(one_url=url)
         self.mini_browser.show()
 
+    def logic_refresh_recommendations(self) -> None:
+        """Starts a new recommendation run in the background.
+
+        Returns:
+            None: None.
+        """
+
+        self.engine.start()
+
     def ui_manage_icons(self) -> None:
         """Icons are managed here.
 
@@ -136,6 +173,13 @@ class RecPanel(AestheticWindow):
         self.main_label.setAlignment(Qt.AlignCenter)
 
         self.header_layout.addWidget(self.main_label)
-        for i in range(1, 4):
-            self.posters_layout.addWidget(self.images.get(f'Movie {i}'))
-            self.buttons_layout.addWidget(self.buttons.get(f'Movie {i}'))
+        for key, image_label in self.images.items():
+            self.posters_layout.addWidget(image_label)
+            self.buttons_layout.addWidget(self.buttons.get(key))
+
+    def eventFilter(self, watched, event: QEvent) -> bool:
+
+        # Web views are only pre-warmed once a trailer button is hovered, QtWebEngine being slow to load.
+        if event.type() == QEvent.Enter and watched in self.buttons.values():
+            webviewpool.pool().warm()
+        return super().eventFilter(watched, event)
@@ -0,0 +1,126 @@
+"""
+This module keeps a small pool of pre-warmed web views that share a persistent profile,
+so that opening a trailer or an IMDb page does not start a new renderer every time.
+"""
+
+from PySide6.QtCore import QUrl, QTimer
+from PySide6.QtWidgets import QApplication
+from PySide6.QtWebEngineCore import QWebEnginePage, QWebEngineProfile
+from PySide6.QtWebEngineWidgets import QWebEngineView
+
+from packages.constants import constants
+
+
+class WebViewPool:
+    profile_name: str = "pymoman"
+    http_cache_size: int = 100 * 1024 * 1024  # Bytes.
+    warm_interval: int = 250  # Milliseconds between two pre-warmed views.
+
+    def __init__(self, size: int = 2):
+
+        self.size: int = size
+        self._idle: list[QWebEngineView] = []
+        self._profile: QWebEngineProfile | None = None
+
+        application = QApplication.instance()
+        if application is not None:
+            application.aboutToQuit.connect(self.clear)
+
+    def __repr__(self):
+        return f"WebViewPool -> {len(self._idle)}/{self.size} idle view(s)"
+
+    @property
+    def profile(self) -> QWebEngineProfile:
+        """Returns the profile shared by all the views, with a persistent disk HTTP cache.
+
+        Returns:
+            QWebEngineProfile: Profile.
+        """
+
+        if self._profile is None:
+            storage = constants.PATHS["web engine"]
+            storage.mkdir(parents=True, exist_ok=True)
+            self._profile = QWebEngineProfile(WebViewPool.profile_name)
+            self._profile.setPersistentStoragePath(str(storage / "storage"))
+            self._profile.setCachePath(str(storage / "cache"))
+            self._profile.setHttpCacheType(QWebEngineProfile.DiskHttpCache)
+            self._profile.setHttpCacheMaximumSize(WebViewPool.http_cache_size)
+        return self._profile
+
+    def acquire(self) -> QWebEngineView:
+        """Returns an idle view, or a new one if the pool is empty.
+
+        Returns:
+            QWebEngineView: View.
+        """
+
+        view: QWebEngineView = self._idle.pop() if self._idle else self._create()
+        QTimer.singleShot(WebViewPool.warm_interval, self.warm)
+        return view
+
+    def clear(self) -> None:
+        """Deletes the idle views, which must be gone before their profile.
+
+        Returns:
+            None: None.
+        """
+
+        while self._idle:
+            self._idle.pop().deleteLater()
+
+    def release(self, view: QWebEngineView) -> None:
+        """Stops the view and puts it back in the pool, or deletes it if the pool is full.
+
+        Args:
+            view (QWebEngineView): View given by acquire().
+
+        Returns:
+            None: None.
+        """
+
+        view.stop()
+        view.setParent(None)
+        if len(self._idle) < self.size:
+            view.setUrl(QUrl("about:blank"))
+            self._idle.append(view)
+        else:
+            view.deleteLater()
+
+    def warm(self) -> None:
+        """Creates idle views one at a time, from the event loop, until the pool is full.
+
+        Returns:
+            None: None.
+        """
+
+        if len(self._idle) < self.size:
+            self._idle.append(self._create())
+            QTimer.singleShot(WebViewPool.warm_interval, self.warm)
+
+    def _create(self) -> QWebEngineView:
+        """Creates a view using the shared profile; loading a blank page starts its renderer.
+
+        Returns:
+            QWebEngineView: View.
+        """
+
+        view = QWebEngineView()
+        view.setPage(QWebEnginePage(self.profile, view))
+        view.setUrl(QUrl("about:blank"))
+        return view
+
+
+_pool: WebViewPool | None = None
+
+
+def pool() -> WebViewPool:
+    """Returns the pool shared by every browser window.
+
+    Returns:
+        WebViewPool: Pool.
+    """
+
+    global _pool
+    if _pool is None:
+        _pool = WebViewPool()
+    return _pool
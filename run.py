@@ -1,32 +1,46 @@
 """Main application file."""
 
 from functools import partial
+from operator import attrgetter
 from pathlib import Path
-from time import sleep
 
 from PySide6 import QtWidgets
 from PySide6.QtWidgets import QSizePolicy
 from PySide6.QtGui import QPixmap, QAction
-from PySide6.QtCore import Qt, QEvent
+from PySide6.QtCore import Qt, QEvent, QPropertyAnimation, QTimer
 
 from packages.constants import constants
-from packages.logic import data_import, data_process, data_retrieve
+from packages.logic import data_import, data_process
+from packages.logic.cache_manager import cache_manager, start_maintenance
 from packages.logic.collection import Collection
+from packages.logic.lazy import lazy_import
+from packages.logic.metrics import metrics
 from packages.logic.movie import Movie
+from packages.logic.profiling import profile
+from packages.logic.negative_cache import negative_cache
 from packages.logic.qthread import ScraperThread
+from packages.logic.search import PrefixIndex, TrigramIndex, movie_fields
+from packages.logic.source_stats import source_stats
 from packages.ui.aesthetic import AestheticWindow
+from packages.ui.catalogmodel import CatalogModel, CatalogProxyModel
 from packages.ui.custom_qmenu import CustomQMenu
 from packages.ui.dirimporter import DirectoryImporter
 from packages.ui.displaypanel import DisplayPanel
-from packages.ui.minibrowser import MiniBrowser
 from packages.ui.movieappender import MovieAppender
 from packages.ui.ratingadjuster import RatingAdjuster
 from packages.ui.suggester import RecPanel
 
+# Heavy modules (requests, BeautifulSoup, QtWebEngine) are only loaded on first use.
+data_retrieve = lazy_import("packages.logic.data_retrieve")
+minibrowser = lazy_import("packages.ui.minibrowser")
+webviewpool = lazy_import("packages.ui.webviewpool")
+
 
 class MainWindow(AestheticWindow):
     all_collections: list[Collection] = Collection.retrieve_collections()
     last_collection_opened = last_movie_displayed = None
+    search_delay: int = 200  # Milliseconds.
+    progress_hold: int = 300  # Milliseconds.
 
     def __init__(self):
         super().__init__()
@@ -40,8 +54,19 @@ class MainWindow(AestheticWindow):
             "/set_cyber_theme": partial(self.ui_apply_style, "cyber"),
             "/set_default_font": partial(self.ui_apply_font, "default"),
             "/set_cyber_font": partial(self.ui_apply_font, "cyber"),
-            "/sort_collection": self.logic_sort_collection
+            "/sort_collection": self.logic_sort_collection,
+            "/cache_stats": self.logic_cache_stats,
+            "/source_stats": self.logic_source_stats,
+            "/stats": self.logic_stats
         }
+        self.search_timer = QTimer(self)
+        self.progress_timer = QTimer(self)
+        self.progress_animation: QPropertyAnimation | None = None
+        self.search_index: PrefixIndex | None = None
+        self.search_box: list | None = None
+        self.global_index: TrigramIndex | None = None
+        self.displayed_box: list = []
+        self.scraped_movie: Movie | None = None
 
         ##################################################
         # Frames and layouts.
@@ -61,7 +86,7 @@ class MainWindow(AestheticWindow):
         self.btn_cr_cl = self.btn_sv_cl = self.btn_sc_dr = self.btn_ad_mv = self.btn_rm_mv = None
         self.lbl_fl_tx = self.cbb_ls_gn = self.cbb_ls_ac = self.prg_br_wg = self.lne_sr_cm = None
         self.lsw_mn_wg = self.mov_ap_wn = self.dsp_pn_wn = self.dir_im_wn = self.rtg_st_wn = None
-        self.min_br_wn = self.rec_pn_wn = None
+        self.min_br_wn = self.rec_pn_wn = self.cmp_sr_cm = self.lst_md_ct = self.prx_md_ct = None
 
         self.ui_manage_widgets()
 
@@ -114,7 +139,7 @@ class MainWindow(AestheticWindow):
             top_right_text: str = f"{len(item.movies)} movie{'s' if len(item.movies) > 1 else ''}."
 
         else:
-            content = item.load_data_file()
+            content = item.load_data_file(record=True)
             title = content.get("title", f"{item.title.title()} ({item.year})")
             summary = content.get("summary", "Summary is being retrieved...")
             top_right_text = item.aesthetic_rating
@@ -123,10 +148,23 @@ class MainWindow(AestheticWindow):
         self.dsp_pn_wn.lbl_title.setText(title)
         self.dsp_pn_wn.te_summary.setText(summary)
 
+    def ui_apply_style(self, style: str) -> None:
+        """Loads application style.
+
+        Args:
+            style (str): Application style (default or cyber).
+        """
+
+        super().ui_apply_style(style)
+
+        if getattr(self, "cmp_sr_cm", None):
+            self.ui_style_completer()
+
     def ui_manage_icons(self) -> None:
         """Icons are managed here."""
 
         super().ui_manage_icons()
+        self.lst_md_ct.icons = self.icons
         self.lne_sr_cm.addAction(self.icons["search"], self.lne_sr_cm.ActionPosition.LeadingPosition)
         self.btn_cr_cl.setIcon(self.icons["note"])
         self.btn_sv_cl.setIcon(self.icons["save"])
@@ -169,7 +207,10 @@ class MainWindow(AestheticWindow):
         self.cbb_ls_ac = QtWidgets.QComboBox()
         self.prg_br_wg = QtWidgets.QProgressBar()
         self.lne_sr_cm = QtWidgets.QLineEdit()
-        self.lsw_mn_wg = QtWidgets.QListWidget()
+        self.lsw_mn_wg = QtWidgets.QListView()
+        self.lst_md_ct = CatalogModel(self)
+        self.prx_md_ct = CatalogProxyModel(self)
+        self.cmp_sr_cm = QtWidgets.QCompleter(list(self.commands), self)
         self.mov_ap_wn = MovieAppender()
         self.rtg_st_wn = RatingAdjuster()
         self.dsp_pn_wn = DisplayPanel()
@@ -183,15 +224,27 @@ class MainWindow(AestheticWindow):
         self.cbb_ls_ac.setMaxVisibleItems(5)
         self.clr_reload_cbb_actors()
         self.prg_br_wg.setTextVisible(False)
+        self.progress_animation = QPropertyAnimation(self.prg_br_wg, b"value", self)
+        self.progress_animation.setDuration(MainWindow.progress_hold)
+        self.progress_timer.setSingleShot(True)
+        self.progress_timer.setInterval(MainWindow.progress_hold)
         self.prg_br_wg.setFixedHeight(5)
         self.prg_br_wg.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Fixed)
         self.lne_sr_cm.setClearButtonEnabled(True)
         self.lne_sr_cm.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Fixed)
-        self.lne_sr_cm.setPlaceholderText("Search  or  run  '/'  commands.")
+        self.lne_sr_cm.setPlaceholderText("Search,  '?'  everywhere  or  run  '/'  commands.")
+        self.lne_sr_cm.setCompleter(self.cmp_sr_cm)
+        self.ui_style_completer()
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(MainWindow.search_delay)
+        self.prx_md_ct.setSourceModel(self.lst_md_ct)
+        self.lsw_mn_wg.setObjectName("catalog")
+        self.lsw_mn_wg.setModel(self.prx_md_ct)
+        self.lsw_mn_wg.setUniformItemSizes(True)
+        self.lsw_mn_wg.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.lsw_mn_wg.installEventFilter(self)
         self.lsw_mn_wg.setAlternatingRowColors(True)
         self.lsw_mn_wg.setFocusPolicy(Qt.NoFocus)
-        self.lsw_mn_wg.setWordWrap(True)
         self.lsw_mn_wg.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Expanding)
 
         self.hdr_layout.addWidget(self.btn_cr_cl)
@@ -208,26 +261,51 @@ class MainWindow(AestheticWindow):
         self.frm_layout.addWidget(self.dsp_pn_wn)
 
     def ui_progress_bar_animation(self, flag: bool = None) -> None:
-        """Creates a small animation for the progress bar."""
+        """Creates a small animation for the progress bar. Nothing here blocks the GUI thread:
+        the bar is animated and reset by timers.
 
-        if flag is None:
+        Args:
+            flag (bool): None for an action done instantly, True when a job succeeded, False when it failed.
+        """
 
-            for i in range(1, 101):              # The interface freezes for
-                self.prg_br_wg.setValue(i)       # such a short time that using a
-                sleep(0.003)                     # thread here seems unnecessary.
+        self.progress_animation.stop()
 
-            sleep(0.3)
-            self.prg_br_wg.reset()
+        if flag is None:
+            self.prg_br_wg.setRange(0, 100)
+            self.progress_animation.setStartValue(0)
+            self.progress_animation.setEndValue(100)
+            self.progress_animation.start()
+            self.progress_timer.start(2 * MainWindow.progress_hold)
 
         elif flag:
-
-            self.prg_br_wg.setValue(100)
-            sleep(0.3)
-            self.prg_br_wg.reset()
+            self.prg_br_wg.setValue(self.prg_br_wg.maximum())
+            self.progress_timer.start()
 
         else:
+            self.progress_timer.start()
 
-            ...
+    def ui_progress_update(self, done: int, total: int, received: int) -> None:
+        """Displays the progress reported by a worker.
+
+        Args:
+            done (int): Items done.
+            total (int): Items to process.
+            received (int): Bytes downloaded so far.
+        """
+
+        self.progress_timer.stop()
+        self.progress_animation.stop()
+        self.prg_br_wg.setRange(0, max(total, 1))
+        self.prg_br_wg.setValue(done)
+        self.prg_br_wg.setToolTip(f"{done}/{total} task{'s' if total > 1 else ''}, {received / 1024:.0f} kB")
+
+    def ui_style_completer(self) -> None:
+        """Applies the current theme to the commands completer."""
+
+        default: bool = self.settings.get("theme") == "default"
+        color: str = "color: #FFA500;" if default else "color: #EF745C;"
+        background: str = "background: #3F3F3F" if default else "background: #531942"
+        self.cmp_sr_cm.popup().setStyleSheet(color + background)
 
     def logic_add_movie(self) -> None:
         """Opens the window which allows to add a movie."""
@@ -248,7 +326,13 @@ class MainWindow(AestheticWindow):
 
         if collection:
             collection.add_movie(movie)
-            self.logic_list_display(collection.movies)
+
+            if self.displayed_box is not collection.movies:
+                self.logic_list_display(collection.movies)
+
+            if collection.movies[-1] is movie:
+                self.logic_item_changed(collection.movies, movie)
+                self.rec_pn_wn.engine.update_movie(movie)
         self.mov_ap_wn.close()
 
     def logic_add_to_wishlist(self, movie: Movie) -> None:
@@ -263,9 +347,46 @@ class MainWindow(AestheticWindow):
         if wishlist is None:
             wishlist = Collection(name="My Wishlist")
             MainWindow.all_collections.append(wishlist)
+            self.logic_item_changed(MainWindow.all_collections, wishlist)
         wishlist.add_movie(movie)
+
+        if wishlist.movies[-1] is movie:
+            self.logic_item_changed(wishlist.movies, movie)
         self.ui_progress_bar_animation()
 
+    def logic_cache_stats(self) -> None:
+        """Displays the cache statistics."""
+
+        stats: dict = cache_manager().stats()
+        QtWidgets.QMessageBox.about(self, "Cache", (
+            f"Entries: {stats['entries']}\n"
+            f"Size: {stats['bytes'] / 1024 ** 2:.1f} MB / {stats['budget'] / 1024 ** 2:.0f} MB\n"
+            f"Hit rate: {stats['hit_rate']:.1%} ({stats['hits']} hits, {stats['misses']} misses)\n"
+            f"Known misses: {len(negative_cache())}"))
+
+    def logic_source_stats(self) -> None:
+        """Displays the statistics of the poster sources, in the order they are tried."""
+
+        names: dict = {"SA": "IMP Awards", "SB": "MoviePosterDB", "SC": "CineMaterial"}
+        lines: list[str] = []
+        for source, stats in source_stats().snapshot().items():
+            hit_rate: str = f"{stats['hit_rate']:.0%}" if stats["hit_rate"] is not None else "-"
+            latency: str = f"{stats['median_latency']:.2f} s" if stats["median_latency"] is not None else "-"
+            size: str = f"{stats['bytes'] / 1024 ** 2:.1f} MB"
+            lines.append(f"{names.get(source, source)}: {hit_rate} hits, {latency}, {size}")
+        QtWidgets.QMessageBox.about(self, "Poster sources", "\n".join(lines) or "No poster downloaded yet.")
+
+    def logic_stats(self) -> None:
+        """Displays the latency histograms, counters and gauges, and dumps every metric as JSON."""
+
+        snapshot: dict = metrics().snapshot()
+        lines: list[str] = [
+            f"{key}: {values['count']} calls, p50 {values['p50'] * 1000:.1f} ms, p90 {values['p90'] * 1000:.1f} ms, "
+            f"max {values['max'] * 1000:.1f} ms" for key, values in snapshot["histograms"].items()]
+        lines += [f"{key}: {value:g}" for key, value in {**snapshot["counters"], **snapshot["gauges"]}.items()]
+        path: Path = metrics().dump()
+        QtWidgets.QMessageBox.about(self, "Statistics", "\n".join(lines + [f"\nSaved to {path}"]))
+
     def logic_commands(self) -> None:
         """Search bar commands logic is managed here."""
 
@@ -286,16 +407,20 @@ class MainWindow(AestheticWindow):
         self.btn_rm_mv.clicked.connect(self.logic_remove_movie)
         self.cbb_ls_gn.currentTextChanged.connect(self.logic_filter)
         self.cbb_ls_ac.currentTextChanged.connect(self.logic_filter)
-        self.lne_sr_cm.textChanged.connect(self.logic_search_bar)
+        self.lne_sr_cm.textChanged.connect(lambda: self.search_timer.start())
+        self.search_timer.timeout.connect(self.logic_search_bar)
         self.lne_sr_cm.returnPressed.connect(self.logic_commands)
-        self.lsw_mn_wg.itemClicked.connect(self.logic_single_click)
+        self.lsw_mn_wg.clicked.connect(self.logic_single_click)
         self.rtg_st_wn.cbb_movie_rating.currentTextChanged.connect(self.logic_edit_movie_rating)
+        self.progress_timer.timeout.connect(self.prg_br_wg.reset)
+        self.thread.progress_changed.connect(self.ui_progress_update)
         self.thread.thread_finished.connect(partial(self.ui_progress_bar_animation, True))
+        self.thread.thread_finished.connect(self.logic_update_scraped_movie)
         self.thread.thread_failed.connect(partial(self.ui_progress_bar_animation, False))
 
     def logic_create_collection_menu(self, position, item: Collection) -> None:
         """This method generates a context menu with specific actions for collections
-        within the QListWidget. It is triggered by a right-click event at the given
+        within the list view. It is triggered by a right-click event at the given
         position 'position' within the list widget.
 
         Args:
@@ -314,7 +439,7 @@ class MainWindow(AestheticWindow):
 
     def logic_create_movie_menu(self, position, item: Movie) -> None:
         """This method generates a context menu with specific actions for movies
-        within the QListWidget. It is triggered by a right-click event at the given
+        within the list view. It is triggered by a right-click event at the given
         position 'position' within the list widget.
 
         Args:
@@ -340,6 +465,9 @@ class MainWindow(AestheticWindow):
         menu.menu_actions["wl"].triggered.connect(partial(self.logic_add_to_wishlist, item))
         menu.menu_actions["wt"].triggered.connect(partial(self.logic_mini_browser, item, "trailer"))
         menu.menu_actions["im"].triggered.connect(partial(self.logic_mini_browser, item, "imdb"))
+        # Web views are only pre-warmed once the user shows interest in them, QtWebEngine being slow to load.
+        menu.menu_actions["wt"].hovered.connect(self.logic_warm_web_views)
+        menu.menu_actions["im"].hovered.connect(self.logic_warm_web_views)
         menu.menu_actions["dl"].triggered.connect(item.remove_cache)
         menu.exec(position)
         menu.deleteLater()
@@ -353,15 +481,16 @@ class MainWindow(AestheticWindow):
 
         if collection.remove():
             MainWindow.all_collections.remove(collection)
-            self.logic_list_display(MainWindow.all_collections)
+            self.logic_item_changed(MainWindow.all_collections, collection, removed=True)
 
     def logic_edit_movie_rating(self) -> None:
         """Lets the user change their rating of the selected movie."""
 
-        selected = self.lsw_mn_wg.selectedItems()[0].attr if self.lsw_mn_wg.selectedItems() else None
+        selected: Collection | Movie | None = self.logic_selected_item()
 
         if isinstance(selected, Movie):
             selected.rating = self.rtg_st_wn.cbb_movie_rating.currentText()
+            self.rec_pn_wn.engine.update_movie(selected)
             self.ui_information_panel(selected)
 
     def logic_export_collection(self, collection: Collection) -> None:
@@ -380,33 +509,11 @@ class MainWindow(AestheticWindow):
 
         movies: list[Movie] = [movie for collection in MainWindow.all_collections for movie in collection.movies]
         qg, qa = self.cbb_ls_gn.currentText(), self.cbb_ls_ac.currentText()
-        results: dict = {
-            qg == "Genre" and qa != "Actors": [m for m in movies if qa in m.actors],
-            qg != "Genre" and qa == "Actors": [m for m in movies if qg in m.genre],
-            qg != "Genre" and qa != "Actors": [m for m in movies if (qg in m.genre) and (qa in m.actors)]
-        }
-        self.logic_list_display(results.get(True, movies))
-
-    def logic_generate_list_item(self, item: Collection | Movie) -> QtWidgets.QListWidgetItem:
-        """Generates a QListWidgetItem from the received object.
-
-        Args:
-            item: Collection or Movie object.
+        self.logic_list_display(movies)
 
-        Returns:
-            QtWidgets.QListWidgetItem: Item ready for display.
-        """
-
-        lw_item = QtWidgets.QListWidgetItem(item.name if isinstance(item, Collection) else item.title)
-        lw_item.setTextAlignment(Qt.AlignCenter)
-        lw_item.attr = item
-
-        if isinstance(item, Collection) and item.path.exists():
-            lw_item.setIcon(self.icons["collection"])
-
-        elif isinstance(item, Movie):
-            lw_item.setIcon(self.icons["movie"])
-        return lw_item
+        if qg != "Genre" or qa != "Actors":
+            self.prx_md_ct.set_predicate(
+                lambda m: (qg == "Genre" or qg in m.genre) and (qa == "Actors" or qa in m.actors))
 
     def logic_handle_collection(self, collection: Collection = None) -> None:
         """Creates or renames a collection.
@@ -422,10 +529,14 @@ class MainWindow(AestheticWindow):
 
         if name and name not in taken_names and value and not collection:
             MainWindow.all_collections.append(Collection(name=name))
+            self.logic_item_changed(MainWindow.all_collections, MainWindow.all_collections[-1])
 
         elif name and name not in taken_names and value and collection:
             collection.rename(name)
-        self.logic_list_display(MainWindow.all_collections)
+            self.logic_item_changed(MainWindow.all_collections, collection)
+
+        if self.displayed_box is not MainWindow.all_collections:
+            self.logic_list_display(MainWindow.all_collections)
 
     def logic_import_directory(self) -> None:
         """Retrieves scanned movies from a folder and add them to a collection."""
@@ -437,33 +548,70 @@ class MainWindow(AestheticWindow):
             movie: Movie | None = Movie.no_errors(item.title, item.year, item.text(), item.rating)
             collection.add_movie(movie)
 
+            if movie and collection.movies[-1] is movie:
+                self.logic_item_changed(collection.movies, movie)
+                self.rec_pn_wn.engine.update_movie(movie)
+
         if collection not in MainWindow.all_collections:
             MainWindow.all_collections.append(collection)
+            self.logic_item_changed(MainWindow.all_collections, collection)
         self.logic_list_display(collection.movies)
         self.dir_im_wn.close()
 
-    def logic_list_display(self, items: list[Collection] | list[Movie]) -> None:
-        """All display logic for the list widget is managed here.
+    def logic_item_changed(self, box: list, item: Collection | Movie, removed: bool = False) -> None:
+        """Keeps the list view and the search indexes up to date after an item was added, renamed or removed.
 
         Args:
-            items: List of Collection objects or Movie objects.
+            box (list): List the item belongs to.
+            item: Concerned Collection or Movie object.
+            removed (bool): True if the item was removed from the list.
         """
 
-        self.lsw_mn_wg.clear()
-        processed_list: list[QtWidgets.QListWidgetItem] = [self.logic_generate_list_item(item) for item in items]
+        # A removed item may be shown by a search or a filter over its box, remove_item() ignores the others.
+        if removed:
+            self.lst_md_ct.remove_item(item)
+
+        elif box is self.displayed_box and self.lst_md_ct.row_of(item) is None:
+            self.lst_md_ct.insert_item(item)
+
+        else:
+            self.lst_md_ct.refresh_item(item)
+
+        movies: list[Movie] = item.movies if isinstance(item, Collection) else [item]
+
+        for movie in movies if self.global_index is not None else []:
+            if removed:
+                self.global_index.remove(movie)
+            else:
+                self.global_index.update(movie)
 
-        if (not items and MainWindow.all_collections) or (items and all(isinstance(item, Movie) for item in items)):
-            previous_item = QtWidgets.QListWidgetItem("GO BACK")
-            previous_item.setTextAlignment(Qt.AlignCenter)
-            previous_item.attr = None
-            previous_item.setIcon(self.icons["previous"])
-            processed_list.insert(0, previous_item)
+        if self.search_index is None or box is not self.search_box:
+            return  # The index will be built the next time this list is searched.
 
+        if removed:
+            self.search_index.remove(item)
         else:
+            self.search_index.update(item)
+
+    def logic_list_display(self, items: list[Collection] | list[Movie]) -> None:
+        """All display logic for the list view is managed here.
+        The model is reset once; the view only renders the visible rows.
+
+        Args:
+            items: List of Collection objects or Movie objects.
+        """
+
+        go_back: bool = bool((not items and MainWindow.all_collections) or (items and isinstance(items[0], Movie)))
+
+        if not go_back:
             MainWindow.last_collection_opened = None
 
-        for item in processed_list:
-            self.lsw_mn_wg.addItem(item)
+        with metrics().timer("ui.list_display"):
+            self.prx_md_ct.set_predicate(None)
+            self.prx_md_ct.sort(-1)
+            self.lst_md_ct.set_items(items, go_back=go_back)
+        metrics().set_gauge("ui.list_items", len(items))
+        self.displayed_box = items
 
     def logic_mini_browser(self, movie: Movie, content: str) -> None:
         """Instantiates a small browser that loads a link.
@@ -473,9 +621,19 @@ class MainWindow(AestheticWindow):
             content (str): The link that should be loaded; 'trailer' or 'imdb'.
         """
 
-        self.min_br_wn = MiniBrowser(movie=movie, content=content)
+        self.min_br_wn = minibrowser.MiniBrowser(movie=movie, content=content)
         self.min_br_wn.show()
 
+    @staticmethod
+    def logic_warm_web_views() -> None:
+        """Creates the idle web views used by the small browsers, when a link to open one is hovered.
+
+        Returns:
+            None: None.
+        """
+
+        webviewpool.pool().warm()
+
     def logic_modify_poster(self, movie: Movie, default=False) -> None:
         """Allows the user to display a new image for the movie,
         (for example if they don't like the current image.)
@@ -491,7 +649,6 @@ class MainWindow(AestheticWindow):
         else:
             self.thread.define_thread_settings(data_retrieve.MovieScraper(movie), ("download_poster", True))
             self.thread.start()
-            self.ui_progress_bar_animation()
         self.ui_information_panel(movie)
 
     def logic_open_collection(self, collection: Collection) -> None:
@@ -510,13 +667,14 @@ class MainWindow(AestheticWindow):
         """Removes a selected movie."""
 
         collection: Collection | None = MainWindow.last_collection_opened
-        movie: Movie | None = self.lsw_mn_wg.selectedItems()[0].attr if self.lsw_mn_wg.selectedItems() else None
+        movie: Collection | Movie | None = self.logic_selected_item()
 
-        if collection and movie:
+        if collection and isinstance(movie, Movie):
             collection.remove_movie(movie)
+            self.logic_item_changed(collection.movies, movie, removed=True)
             collection.save()
             movie.remove_cache()
-            self.logic_list_display(collection.movies)
+            self.rec_pn_wn.engine.update_movie(movie, removed=True)
 
     def logic_rename_movie(self, movie: Movie, flag: bool) -> None:
         """Renames a movie.
@@ -535,6 +693,9 @@ class MainWindow(AestheticWindow):
 
         if not success:
             QtWidgets.QMessageBox.about(self, "Warning", constants.CACHE_WARNING)
+
+        if MainWindow.last_collection_opened:
+            self.logic_item_changed(MainWindow.last_collection_opened.movies, movie)
         self.logic_update_list_widget()
 
     def logic_save_collection(self, collection: Collection) -> None:
@@ -572,22 +733,60 @@ class MainWindow(AestheticWindow):
             self.dir_im_wn.btn_validate.clicked.connect(self.logic_import_directory)
             self.dir_im_wn.show()
 
+    def logic_global_index(self) -> TrigramIndex:
+        """Returns the fuzzy index of every movie of every collection, building it if needed.
+
+        Returns:
+            TrigramIndex: Index over titles, official titles, actors and summaries.
+        """
+
+        if self.global_index is None:
+            movies: list[Movie] = [movie for collection in MainWindow.all_collections for movie in collection.movies]
+            self.global_index = TrigramIndex(movies, fields=movie_fields)
+        return self.global_index
+
     def logic_search_bar(self) -> None:
-        """Search bar logic is managed here."""
-
-        completer = QtWidgets.QCompleter(self.commands, self)
-        theme: dict = data_import.load_file_content(constants.PATHS["settings"])
-        color: str = "color: #FFA500;" if theme["theme"] == "default" else "color: #EF745C;"
-        background: str = "background: #3F3F3F" if theme["theme"] == "default" else "background: #531942"
-        completer.popup().setStyleSheet(color + background)
-        self.lne_sr_cm.setCompleter(completer)
+        """Search bar logic is managed here. It runs once typing has paused for 'search_delay' milliseconds.
+        Queries starting with '?' search every collection, fuzzily.
+        """
+
         query: str = self.lne_sr_cm.text().strip().casefold()
 
-        if not query.startswith("/"):
-            box: list = self.last_collection_opened.movies if self.last_collection_opened else self.all_collections
+        if query.startswith("?"):
+            # The results come from every collection, so none of them is the opened one anymore.
+            MainWindow.last_collection_opened = None
+            self.btn_ad_mv.setEnabled(False)
+            self.btn_rm_mv.setEnabled(False)
+            results: list[tuple[Movie, float]] = self.logic_global_index().search(query[1:]) if query[1:] else []
+            self.logic_list_display([movie for movie, _ in results])
+
+        elif not query.startswith("/"):
+            self.logic_list_display(self.logic_search_index().search(query))
+
+    def logic_search_index(self) -> PrefixIndex:
+        """Returns the search index of the currently displayed box, building it if needed.
+
+        Returns:
+            PrefixIndex: Index of the opened collection's movies, or of all collections.
+        """
+
+        box: list = self.last_collection_opened.movies if self.last_collection_opened else self.all_collections
+
+        if self.search_index is None or self.search_box is not box:
             attribute: str = "title" if self.last_collection_opened else "name"
-            items: list = [x for x in box if getattr(x, attribute).casefold().startswith(query)]
-            self.logic_list_display(items)
+            self.search_index = PrefixIndex(box, key=attrgetter(attribute))
+            self.search_box = box
+        return self.search_index
+
+    def logic_selected_item(self) -> Collection | Movie | None:
+        """Returns the item selected in the list view.
+
+        Returns:
+            Collection | Movie | None: Selected item, None if nothing (or "GO BACK") is selected.
+        """
+
+        selected: list = self.lsw_mn_wg.selectionModel().selectedIndexes()
+        return selected[0].data(CatalogModel.ItemRole) if selected else None
 
     def logic_show_rating_modifier(self) -> None:
         """Shows rating modification dialog."""
@@ -595,21 +794,24 @@ class MainWindow(AestheticWindow):
         self.rtg_st_wn.cbb_movie_rating.setCurrentIndex(0)
         self.rtg_st_wn.show()
 
-    def logic_single_click(self, clicked_item) -> None:
-        """Handle a single click on items in the QListWidget."""
+    def logic_single_click(self, index) -> None:
+        """Handle a single click on items in the list view."""
+
+        item: Collection | Movie | None = index.data(CatalogModel.ItemRole)
 
-        if clicked_item.attr is None:
+        if item is None:
             self.logic_list_display(MainWindow.all_collections)
             self.btn_ad_mv.setEnabled(False)
             self.btn_rm_mv.setEnabled(False)
             return
 
-        elif isinstance(clicked_item.attr, Movie):
+        elif isinstance(item, Movie):
             self.clr_reload_cbb_actors()
-            scraper: data_retrieve.MovieScraper = data_retrieve.MovieScraper(clicked_item.attr)
+            scraper: data_retrieve.MovieScraper = data_retrieve.MovieScraper(item)
+            self.scraped_movie = item
             self.thread.define_thread_settings(scraper, ("download_poster", None), ("download_info", None))
             self.thread.start()
-        self.ui_information_panel(clicked_item.attr)
+        self.ui_information_panel(item)
 
     def logic_sort_collection(self) -> None:
         """Sorts a collection alphabetically."""
@@ -617,17 +819,23 @@ class MainWindow(AestheticWindow):
         if MainWindow.last_collection_opened:
             movies: list[Movie] = MainWindow.last_collection_opened.movies
             movies.sort()
-            self.logic_list_display(movies)
+            self.search_index = None
 
-    def logic_update_list_widget(self) -> None:
-        """Refreshes the current items in the list widget."""
+            if self.displayed_box is movies:
+                self.prx_md_ct.sort(0)
+            else:
+                self.logic_list_display(movies)
+
+    def logic_update_scraped_movie(self) -> None:
+        """Re-indexes the last scraped movie once its information has been downloaded."""
 
-        selected_item_row: int = self.lsw_mn_wg.row(self.lsw_mn_wg.currentItem())
-        items = [self.lsw_mn_wg.item(i).attr for i in range(self.lsw_mn_wg.count()) if self.lsw_mn_wg.item(i).attr]
-        self.logic_list_display(items)
+        if self.global_index is not None and self.scraped_movie in self.global_index:
+            self.global_index.update(self.scraped_movie)
+
+    def logic_update_list_widget(self) -> None:
+        """Refreshes the current items in the list view, keeping the selection and scroll position."""
 
-        if selected_item_row:
-            self.lsw_mn_wg.scrollToItem(self.lsw_mn_wg.item(selected_item_row))
+        self.lst_md_ct.refresh_items()
 
     def clr_reload_cbb_actors(self) -> None:
         """Reloads a list of all actors in the combobox."""
@@ -639,18 +847,21 @@ class MainWindow(AestheticWindow):
 
     def closeEvent(self, event):
 
-        data_process.clear_cache()
+        data_process.clear_cache(budget=data_process.CACHE_GC_BUDGET)  # Skipped if the maintenance is cleaning.
+        cache_manager().save()
+        negative_cache().save()
+        metrics().dump()
 
     def eventFilter(self, watched, event: QEvent) -> bool:
 
         if event.type() == QEvent.ContextMenu and watched is self.lsw_mn_wg:
-            list_item = watched.itemAt(event.pos())
+            list_item = watched.indexAt(event.pos()).data(CatalogModel.ItemRole)
 
-            if list_item and isinstance(list_item.attr, Collection):
-                self.logic_create_collection_menu(event.globalPos(), list_item.attr)
+            if isinstance(list_item, Collection):
+                self.logic_create_collection_menu(event.globalPos(), list_item)
 
-            elif list_item and isinstance(list_item.attr, Movie):
-                self.logic_create_movie_menu(event.globalPos(), list_item.attr)
+            elif isinstance(list_item, Movie):
+                self.logic_create_movie_menu(event.globalPos(), list_item)
 
             else:
                 return False
@@ -658,9 +869,11 @@ class MainWindow(AestheticWindow):
 
 
 if __name__ == '__main__':
-    constants.APP_HIDDEN_FOLDER.mkdir(exist_ok=True)
-    data_process.clear_cache()
+    constants.APP_HIDDEN_FOLDER.mkdir(parents=True, exist_ok=True)
+    start_maintenance()
+    QtWidgets.QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)  # Required by the lazily imported QtWebEngine.
     root = QtWidgets.QApplication()
-    application = MainWindow()
+    with profile("window"):
+        application = MainWindow()
     application.show()
     root.exec()
@@ -0,0 +1,33 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from packages.constants import constants
+from packages.logic import cache_manager, negative_cache, network, source_stats, wikipedia_client
+
+
+def reset_shared_objects():
+    """Forgets the shared objects of the logic modules, which keep the paths of the user's folder they were
+    created with, so that the next ones are created in the current user's folder."""
+
+    cache_manager._manager = None
+    negative_cache._cache = None
+    network._client = None
+    source_stats._stats = None
+    wikipedia_client._client = None
+
+
+class UserFolderTestCase(unittest.TestCase):
+    """Runs every test against an empty temporary user's folder, so that ~/.pymoman is never touched."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.directory.name)
+        self.original_root = constants.APP_HIDDEN_FOLDER
+        constants.set_root(self.root)
+        reset_shared_objects()
+
+    def tearDown(self):
+        reset_shared_objects()
+        constants.set_root(self.original_root)
+        self.directory.cleanup()
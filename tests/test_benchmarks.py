@@ -0,0 +1,47 @@
+import unittest
+from unittest.mock import patch
+
+from benchmarks import import_time, logic
+from packages.constants import constants
+
+
+class RegressionGateChecker(unittest.TestCase):
+
+    baseline = {"sizes": {"1000": {"Movie": 20.0, "load_all_movies": 0.5}}}
+
+    def test_slowdown_beyond_the_threshold_fails(self):
+        report = {"sizes": {"1000": {"Movie": 26.0, "load_all_movies": 0.5}}}
+        self.assertEqual(len(logic.regressions(self.baseline, report, threshold=0.25)), 1)
+
+    def test_slowdown_within_the_threshold_or_the_noise_passes(self):
+        report = {"sizes": {"1000": {"Movie": 24.0, "load_all_movies": 1.2}, "10000": {"Movie": 500.0}}}
+        self.assertListEqual(logic.regressions(self.baseline, report, threshold=0.25), [])
+
+
+class SuiteChecker(unittest.TestCase):
+
+    def test_every_hot_path_runs_on_a_small_library(self):
+        paths = dict(constants.PATHS)
+        with patch.object(logic, "POSTERS", 1):
+            timings = logic.measure(size=30, repeat=1)
+        self.assertDictEqual(constants.PATHS, paths)
+        self.assertEqual(len(timings), 10)
+        self.assertTrue(all(duration > 0 for duration in timings.values()))
+
+
+class ImportTimeChecker(unittest.TestCase):
+
+    report = ("import time: self [us] | cumulative | imported package\n"
+              "import time:        50 |         50 |   codecs\n"
+              "import time:       100 |        150 | encodings\n"
+              "import time:       200 |        200 |   requests\n"
+              "import time:      1000 |       1200 | run\n")
+
+    def test_only_top_level_imports_are_totalled(self):
+        timings = import_time.parse(self.report)
+        self.assertListEqual([(name, depth) for name, depth, _, _ in timings],
+                             [("codecs", 1), ("encodings", 0), ("requests", 1), ("run", 0)])
+        report = import_time.summarize(timings, top=2)
+        self.assertEqual(report["total_ms"], 1.4)
+        self.assertListEqual(report["heavy_modules_at_startup"], ["requests"])
+        self.assertListEqual([entry["module"] for entry in report["slowest"]], ["run", "requests"])
@@ -0,0 +1,103 @@
+import json
+import os
+import time
+
+from packages.constants import constants
+from packages.logic import data_process
+from packages.logic.cache_manager import CacheManager, cache_manager, start_maintenance
+from packages.logic.movie import Movie
+from tests import UserFolderTestCase, reset_shared_objects
+
+
+class CacheManagerChecker(UserFolderTestCase):
+
+    def setUp(self):
+        super().setUp()
+        constants.PATHS["collections"].mkdir()
+
+        with open(constants.PATHS["collections"] / "Saved.json", "w", encoding="UTF-8") as file:
+            json.dump([{"title": "Heat", "year": 1995, "path": "", "rating": "-"}], file)
+        self.cache = constants.PATHS["cache"]
+        self.manager = CacheManager(budget=100)
+
+        for age, name in enumerate(("heat", "ronin", "collateral", "thief")):
+            self.folder(name, 40, 400 - 100 * age)
+
+    def folder(self, name, size, age):
+        folder = self.cache / name
+        folder.mkdir(parents=True)
+        (folder / "data.json").write_bytes(b"x" * size)
+        past = time.time() - age
+        os.utime(folder, (past, past))
+
+    def test_least_recently_used_unsaved_entries_are_evicted(self):
+        self.manager.record(self.cache / "ronin", hit=True)
+        report = self.manager.enforce()
+        self.assertEqual(report, {"evicted": 2, "reclaimed": 80})
+        self.assertListEqual(sorted(path.name for path in self.cache.iterdir()), ["heat", "ronin"])
+
+    def test_saved_entries_are_never_evicted(self):
+        self.manager.budget = 0
+        self.manager.enforce()
+        self.assertListEqual([path.name for path in self.cache.iterdir()], ["heat"])
+
+    def test_stats_survive_a_restart(self):
+        self.manager.record(self.cache / "heat", hit=True)
+        self.manager.record(self.cache / "unknown", hit=False)
+        self.manager.enforce()
+        self.manager.save()
+        stats = CacheManager(folder=self.cache, index=self.manager.index_path, budget=100).stats()
+        self.assertEqual(stats["hit_rate"], 0.5)
+        self.assertEqual(stats["bytes"], 80)
+
+
+class AccessRecordChecker(UserFolderTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.movie = Movie("Heat", 1995)
+        self.movie.storage.mkdir(parents=True)
+        self.movie.data_file.write_text(json.dumps({"genre": ["Crime"], "actors": ["Al Pacino"]}), encoding="UTF-8")
+
+    def test_internal_reads_are_not_recorded(self):
+        self.assertListEqual(self.movie.genre, ["Crime"])
+        self.assertListEqual(self.movie.actors, ["Al Pacino"])
+        self.assertEqual(cache_manager().stats()["hits"], 0)
+
+    def test_displayed_data_is_recorded(self):
+        self.movie.load_data_file(record=True)
+        Movie("Ronin", 1998).load_data_file(record=True)
+        stats = cache_manager().stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+
+
+class MaintenanceChecker(UserFolderTestCase):
+
+    folder = CacheManagerChecker.folder
+
+    def setUp(self):
+        super().setUp()
+        constants.PATHS["collections"].mkdir()
+
+        with open(constants.PATHS["collections"] / "Saved.json", "w", encoding="UTF-8") as file:
+            json.dump([{"title": "Heat", "year": 1995, "path": "", "rating": "-"}], file)
+        self.cache = constants.PATHS["cache"]
+
+        for name, age in (("heat", 400), ("ronin", 300), ("collateral", 200), ("thief", 100),
+                          ("memento", data_process.ORPHAN_TIME_TO_LIVE + 60)):
+            self.folder(name, 40, age)
+
+    def maintain(self, budget):
+        constants.PATHS["settings"].write_text(json.dumps({"cache_budget_mb": budget / 1024 / 1024}), encoding="UTF-8")
+        reset_shared_objects()
+        start_maintenance().join(5)
+        return sorted(path.name for path in self.cache.iterdir() if path.is_dir())
+
+    def test_unsaved_folders_survive_under_budget(self):
+        self.assertListEqual(self.maintain(budget=200), ["collateral", "heat", "ronin", "thief"])
+        self.assertTrue(constants.PATHS["cache index"].exists())
+
+    def test_unsaved_folders_are_evicted_by_lru_over_budget(self):
+        self.assertListEqual(self.maintain(budget=100), ["heat", "thief"])
+        self.assertListEqual(self.maintain(budget=40), ["heat"])
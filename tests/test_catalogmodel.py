@@ -0,0 +1,88 @@
+import unittest
+
+from PySide6.QtCore import QCoreApplication, Qt
+
+from packages.logic.collection import Collection
+from packages.logic.movie import Movie
+from packages.ui.catalogmodel import CatalogModel, CatalogProxyModel
+from tests import UserFolderTestCase
+
+application = QCoreApplication.instance() or QCoreApplication()
+
+
+class CatalogModelChecker(UserFolderTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.movies = [Movie("Heat", 1995), Movie("Alien", 1979), Movie("Ronin", 1998)]
+        self.model = CatalogModel()
+        self.model.set_items(self.movies, go_back=True)
+
+    def texts(self, model):
+        return [model.index(row, 0).data() for row in range(model.rowCount())]
+
+    def test_go_back_row_comes_first(self):
+        self.assertListEqual(self.texts(self.model), ["GO BACK", "Heat", "Alien", "Ronin"])
+        self.assertIsNone(self.model.index(0, 0).data(CatalogModel.ItemRole))
+        self.assertListEqual(self.model.items, self.movies)
+        self.assertEqual(self.model.row_of(self.movies[0]), 1)
+
+    def test_insert_item(self):
+        movie = Movie("Thief", 1981)
+        self.model.insert_item(movie)
+        self.model.insert_item(movie)
+        self.assertListEqual(self.texts(self.model), ["GO BACK", "Heat", "Alien", "Ronin", "Thief"])
+        self.assertIs(self.model.index(4, 0).data(CatalogModel.ItemRole), movie)
+        self.assertEqual(self.model.row_of(movie), 4)
+
+    def test_rows_are_shifted_after_a_removal(self):
+        self.model.remove_item(self.movies[0])
+        self.assertListEqual(self.texts(self.model), ["GO BACK", "Alien", "Ronin"])
+        self.assertIsNone(self.model.row_of(self.movies[0]))
+        self.assertEqual(self.model.row_of(self.movies[1]), 1)
+        self.assertEqual(self.model.row_of(self.movies[2]), 2)
+
+        self.model.remove_item(self.movies[2])
+        self.model.insert_item(self.movies[0])
+        self.assertListEqual(self.texts(self.model), ["GO BACK", "Alien", "Heat"])
+        self.assertEqual(self.model.row_of(self.movies[0]), 2)
+
+    def test_hidden_item_is_ignored(self):
+        equal = Movie("Heat", 1995)
+        self.model.remove_item(equal)
+        self.assertListEqual(self.texts(self.model), ["GO BACK", "Heat", "Alien", "Ronin"])
+
+    def test_collections_are_shown_by_name(self):
+        collections = [Collection("Favourites"), Collection("Wishlist")]
+        self.model.set_items(collections)
+        self.assertListEqual(self.texts(self.model), ["Favourites", "Wishlist"])
+        self.assertEqual(self.model.row_of(collections[1]), 1)
+
+
+class CatalogProxyModelChecker(UserFolderTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.model = CatalogModel()
+        self.model.set_items([Movie("Heat", 1995), Movie("Alien", 1979), Movie("Ronin", 1998)], go_back=True)
+        self.proxy = CatalogProxyModel()
+        self.proxy.setSourceModel(self.model)
+
+    def texts(self):
+        return [self.proxy.index(row, 0).data(Qt.DisplayRole) for row in range(self.proxy.rowCount())]
+
+    def test_predicate_keeps_the_go_back_row(self):
+        self.proxy.set_predicate(lambda movie: movie.year < 1990)
+        self.assertListEqual(self.texts(), ["GO BACK", "Alien"])
+        self.proxy.set_predicate(None)
+        self.assertListEqual(self.texts(), ["GO BACK", "Heat", "Alien", "Ronin"])
+
+    def test_sorting_keeps_the_go_back_row_first(self):
+        self.proxy.sort(0)
+        self.assertListEqual(self.texts(), ["GO BACK", "Alien", "Heat", "Ronin"])
+        self.proxy.sort(-1)
+        self.assertListEqual(self.texts(), ["GO BACK", "Heat", "Alien", "Ronin"])
+
+
+if __name__ == '__main__':
+    unittest.main()
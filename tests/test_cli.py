@@ -0,0 +1,77 @@
+import io
+import json
+import subprocess
+import sys
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+import cli
+from packages.constants import constants
+from packages.logic.collection import Collection
+from packages.logic.movie import Movie
+from tests import UserFolderTestCase
+
+
+class HeadlessChecker(unittest.TestCase):
+
+    def test_no_qt_module_is_imported(self):
+        code = "import sys, cli; cli.build_parser(); print(any(name.startswith('PySide6') for name in sys.modules))"
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                                cwd=Path(__file__).resolve().parent.parent)
+        self.assertEqual(output.stdout.strip(), "False")
+
+
+class CliTestCase(UserFolderTestCase):
+
+    def setUp(self):
+        super().setUp()
+        constants.set_root(self.root / ".pymoman")  # Created by the commands.
+
+    def run_cli(self, *arguments):
+        stdout = io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+            code = cli.main(list(arguments))
+        return code, stdout.getvalue()
+
+
+class ExitCodeChecker(CliTestCase):
+
+    def test_unknown_command(self):
+        code, _ = self.run_cli("unknown")
+        self.assertEqual(code, cli.EXIT_USAGE)
+
+    def test_missing_collection(self):
+        code, output = self.run_cli("export", "--collection", "Does not exist 42", "--output", "out.txt")
+        self.assertEqual(code, cli.EXIT_NOT_FOUND)
+        self.assertIn('"event": "error"', output)
+
+    def test_missing_directory(self):
+        code, _ = self.run_cli("import", "/does/not/exist", "--collection", "Imported")
+        self.assertEqual(code, cli.EXIT_NOT_FOUND)
+
+    def test_real_user_folder_is_not_used(self):
+        self.run_cli("export", "--collection", "Does not exist 42", "--output", "out.txt")
+        self.assertTrue(constants.APP_HIDDEN_FOLDER.is_relative_to(self.root))
+        self.assertTrue(constants.APP_HIDDEN_FOLDER.exists())
+
+
+class ExportChecker(CliTestCase):
+
+    def test_json_export_keeps_the_library_titles(self):
+        movie = Movie("Heat", 1995, rating="5")
+        movie.storage.mkdir(parents=True)
+        movie.data_file.write_text(json.dumps({"title": "Heat (1995)", "genre": ["Crime"]}), encoding="UTF-8")
+        Collection("My movies", [movie]).save()
+
+        output = self.root / "movies.json"
+        code, _ = self.run_cli("export", "--collection", "My movies", "--output", str(output), "--format", "json")
+        exported = json.loads(output.read_text(encoding="UTF-8"))
+        self.assertEqual(code, cli.EXIT_OK)
+        self.assertEqual(exported[0]["title"], "Heat")
+        self.assertEqual(exported[0]["rating"], "5")
+        self.assertEqual(exported[0]["data"]["title"], "Heat (1995)")
+
+
+if __name__ == '__main__':
+    unittest.main()
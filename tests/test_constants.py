@@ -0,0 +1,33 @@
+import unittest
+from pathlib import Path
+
+from packages.constants import constants
+
+
+class LazyIconsChecker(unittest.TestCase):
+
+    def setUp(self):
+        self.built = {name: vars(constants).pop(name) for name in ("ICONS", "STR_ICONS") if name in vars(constants)}
+
+    def tearDown(self):
+        vars(constants).update(self.built)
+
+    def test_icons_are_built_on_first_access(self):
+        self.assertNotIn("ICONS", vars(constants))
+        icons = constants.ICONS
+        self.assertIs(vars(constants)["ICONS"], icons)
+        self.assertTrue(icons)
+        self.assertTrue(all(isinstance(path, Path) and path.parent == constants.PATHS["icons"]
+                            for path in icons.values()))
+
+    def test_str_icons_follow_icons(self):
+        self.assertDictEqual(constants.STR_ICONS, {key: str(path) for key, path in constants.ICONS.items()})
+        self.assertIn("STR_ICONS", vars(constants))
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            constants.MISSING
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from packages.logic import data_import
+
+
+class JsonArrayChecker(unittest.TestCase):
+
+    def test_elements_split_across_chunks(self):
+        content = [{"title": "Alien", "year": 1979}, -1500.25, "a ] b", None, [1, {"x": 2}]]
+        text = json.dumps(content, indent=4)
+        for chunk_size in (1, 3, 64):
+            elements = list(data_import.iter_json_array(io.StringIO(text), chunk_size=chunk_size))
+            self.assertListEqual([value for _, value in elements], content)
+            self.assertListEqual([json.JSONDecoder().raw_decode(text, offset)[0] for offset, _ in elements], content)
+
+    def test_malformed_elements_are_reported_and_skipped(self):
+        errors = []
+        text = '[2x, {"title": "Alien", "year": }, {"title": "Heat", "year": 1995}'
+        values = [value for _, value in data_import.iter_json_array(io.StringIO(text), errors, chunk_size=8)]
+        self.assertListEqual(values, [{"title": "Heat", "year": 1995}])
+        self.assertListEqual([error["offset"] for error in errors], [1, 5, len(text)])
+
+    def test_not_an_array(self):
+        errors = []
+        self.assertListEqual(list(data_import.iter_json_array(io.StringIO('{"title": "Alien"}'), errors)), [])
+        self.assertEqual(errors[0]["offset"], 0)
+
+
+class CollectionMoviesChecker(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "My_collection.json"
+        self.path.write_text(json.dumps([
+            {"title": "Alien", "year": 1979, "path": None, "rating": "5"},
+            {"title": "Heat"},
+            "Fargo",
+            {"title": "Brazil", "year": 1850},
+            {"title": "Ran", "year": 1985}
+        ]), encoding="UTF-8")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_valid_movies_are_yielded_lazily(self):
+        movies = data_import.iter_collection_movies(self.path)
+        self.assertEqual(next(movies).title, "Alien")
+        self.assertListEqual([movie.title for movie in movies], ["Ran"])
+
+    def test_malformed_entries_are_reported_with_their_offsets(self):
+        errors = []
+        movies = data_import.load_collection_movies(self.path, errors)
+        text = self.path.read_text(encoding="UTF-8")
+        self.assertEqual(len(movies), 2)
+        self.assertListEqual([text[error["offset"]:].split(",")[0] for error in errors],
+                             ['{"title": "Heat"}', '"Fargo"', '{"title": "Brazil"'])
+        self.assertTrue(all(error["file"] == str(self.path) for error in errors))
+
+    def test_missing_file(self):
+        errors = []
+        self.assertListEqual(data_import.load_collection_movies(self.path.with_name("None.json"), errors), [])
+        self.assertListEqual(errors, [])
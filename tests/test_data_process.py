@@ -0,0 +1,92 @@
+import itertools
+import json
+import os
+import time
+from unittest.mock import patch
+
+from packages.constants import constants
+from packages.logic import data_import, data_process
+from tests import UserFolderTestCase
+
+
+class ClearCacheChecker(UserFolderTestCase):
+
+    def setUp(self):
+        super().setUp()
+        constants.PATHS["collections"].mkdir()
+
+        # The video file of the saved movie is missing: its cache must be kept anyway.
+        with open(constants.PATHS["collections"] / "Saved.json", "w", encoding="UTF-8") as file:
+            json.dump([{"title": "The Matrix", "year": 1999, "path": "/missing.mkv", "rating": "-"}], file)
+        self.saved = self.folder("matrix", 10)
+        self.unused = self.folder("heat", 25)
+
+    @staticmethod
+    def folder(name, size, age=data_process.ORPHAN_TIME_TO_LIVE + 60):
+        folder = constants.PATHS["cache"] / name
+        folder.mkdir(parents=True)
+        (folder / "data.json").write_bytes(b"x" * size)
+        past = time.time() - age
+        os.utime(folder, (past, past))
+        return folder
+
+    def test_unused_folders_are_removed(self):
+        report = data_process.clear_cache()
+        self.assertTrue(self.saved.exists())
+        self.assertFalse(self.unused.exists())
+        self.assertEqual(report["removed"], 1)
+        self.assertEqual(report["reclaimed"], 25)
+        self.assertTrue(report["complete"])
+
+    def test_second_run_is_skipped(self):
+        data_process.clear_cache()
+        self.assertTrue(data_process.clear_cache()["skipped"])
+
+    def test_new_folder_after_last_run_is_removed(self):
+        data_process.clear_cache()
+        unused = self.folder("ronin", 5)
+        self.assertFalse(data_process.clear_cache()["skipped"])
+        self.assertFalse(unused.exists())
+
+    def test_recently_used_folders_are_kept_until_they_expire(self):
+        recent = self.folder("ronin", 5, age=60)
+        accessed = self.folder("thief", 5)
+        constants.PATHS["cache index"].write_text(json.dumps({"entries": {"thief": [time.time() - 60, 5]}}),
+                                                  encoding="UTF-8")
+        self.assertEqual(data_process.clear_cache()["removed"], 1)
+        self.assertTrue(recent.exists() and accessed.exists())
+        self.assertTrue(data_process.clear_cache()["skipped"])
+
+        marker = data_import.load_file_content(constants.PATHS["cache marker"])
+        self.assertAlmostEqual(marker["expires"], time.time() - 60 + data_process.ORPHAN_TIME_TO_LIVE, delta=5)
+        self.assertEqual(data_process.clear_cache(force=True, time_to_live=30)["removed"], 2)
+
+    def test_exhausted_budget_leaves_work_for_next_run(self):
+        report = data_process.clear_cache(budget=-1)
+        self.assertFalse(report["complete"])
+        self.assertTrue(self.unused.exists())
+        self.assertEqual(data_process.clear_cache()["removed"], 1)
+
+    def test_interrupted_run_goes_on_after_the_last_checked_folder(self):
+        first, last = self.folder("alien", 5), self.folder("zodiac", 5)
+        clock = itertools.count()
+        with patch.object(data_process.time, "monotonic", lambda: next(clock)):
+            self.assertEqual(data_process.clear_cache(budget=3.5)["removed"], 2)  # alien, heat, then matrix.
+            self.assertEqual(data_import.load_file_content(constants.PATHS["cache marker"])["cursor"], "matrix")
+
+            other = self.folder("aaa", 5)
+            report = data_process.clear_cache(budget=1.5)
+        self.assertFalse(report["complete"])
+        self.assertFalse(first.exists() or last.exists())
+        self.assertTrue(other.exists())
+
+        self.assertTrue(data_process.clear_cache()["complete"])
+        self.assertFalse(other.exists())
+        self.assertNotIn("cursor", data_import.load_file_content(constants.PATHS["cache marker"]))
+
+    def test_concurrent_run_is_skipped(self):
+        with data_process._cleaning_lock:
+            report = data_process.clear_cache()
+        self.assertTrue(report["skipped"])
+        self.assertFalse(report["complete"])
+        self.assertTrue(self.unused.exists())
@@ -0,0 +1,28 @@
+import unittest
+
+from packages.logic import html_parsing
+
+
+class ExtractionChecker(unittest.TestCase):
+
+    def test_cinematerial_result_link(self):
+        markup = ('<div class="menu"><a href="/nope">x</a></div><div class="table-responsive"><table><tr>'
+                  '<td><img src="a.jpg"></td><td><a href="/movies/heat-1995">Heat</a></td></tr></table></div>')
+        self.assertEqual(html_parsing.cinematerial_result_link(markup), "/movies/heat-1995")
+
+    def test_cinematerial_result_link_without_results(self):
+        self.assertEqual(html_parsing.cinematerial_result_link("<div class='table-responsive'></div>"), "")
+
+    def test_cinematerial_poster(self):
+        markup = '<img src="logo.png"><img class="lazy" data-src="https://example.com/heat.jpg">'
+        self.assertEqual(html_parsing.cinematerial_poster(markup), "https://example.com/heat.jpg")
+
+    def test_imp_imdb_identifier(self):
+        markup = ('<div class="rightsidesmallbordered"><a href="/1995/heat_ver2.html">Next</a></div>'
+                  '<div class="rightsidesmallbordered"><a href="https://www.imdb.com/title/tt0113277">IMDb</a></div>')
+        self.assertEqual(html_parsing.imp_imdb_identifier(markup), "tt0113277")
+
+    def test_movieposterdb_poster(self):
+        markup = ('<img class="lazyload" data-src="wrong.jpg">'
+                  '<img class="vertical-image img-responsive poster_img lazyload" data-src="heat.jpg">')
+        self.assertEqual(html_parsing.movieposterdb_poster(markup), "heat.jpg")
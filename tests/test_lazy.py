@@ -0,0 +1,42 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from packages.logic.lazy import lazy_import
+
+
+class LazyImportChecker(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.folder = Path(self.directory.name)
+        # The module leaves a file behind when it is executed.
+        (self.folder / "lazy_probe.py").write_text(
+            "from pathlib import Path\nPath(__file__).with_suffix('.ran').touch()\nANSWER = 42\n", encoding="UTF-8")
+        sys.path.insert(0, str(self.folder))
+
+    def tearDown(self):
+        sys.path.remove(str(self.folder))
+        sys.modules.pop("lazy_probe", None)
+        self.directory.cleanup()
+
+    def test_module_is_executed_on_first_attribute_access(self):
+        module = lazy_import("lazy_probe")
+        self.assertIs(sys.modules["lazy_probe"], module)
+        self.assertFalse((self.folder / "lazy_probe.ran").exists())
+        self.assertEqual(module.ANSWER, 42)
+        self.assertTrue((self.folder / "lazy_probe.ran").exists())
+
+    def test_imported_module_is_returned_as_is(self):
+        self.assertIs(lazy_import("json"), sys.modules["json"])
+
+    def test_missing_module(self):
+        with self.assertRaises(ModuleNotFoundError) as context:
+            lazy_import("lazy_missing_module")
+        self.assertEqual(context.exception.name, "lazy_missing_module")
+        self.assertNotIn("lazy_missing_module", sys.modules)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import json
+import unittest
+
+from packages.logic.local_recommender import LocalRecommender
+from packages.logic.movie import Movie
+from tests import UserFolderTestCase
+
+
+class RecommendChecker(UserFolderTestCase):
+
+    def setUp(self):
+        super().setUp()
+
+        self.liked = self.movie("Alien", 1979, "5", ["Science Fiction", "Horror"], ["Sigourney Weaver"])
+        self.disliked = self.movie("Notting Hill", 1999, "1", ["Romance", "Comedy"], ["Hugh Grant"])
+        self.space = self.movie("Aliens", 1986, "-", ["Science Fiction", "Action"], ["Sigourney Weaver"])
+        self.romance = self.movie("Love Actually", 2003, "-", ["Romance", "Comedy"], ["Hugh Grant"])
+        self.movies = [self.liked, self.disliked, self.space, self.romance]
+
+    @staticmethod
+    def movie(title, year, rating, genre, actors):
+        movie = Movie(title=title, year=year, rating=rating)
+        movie.storage.mkdir(parents=True)
+        with open(movie.data_file, "w", encoding="UTF-8") as file:
+            json.dump({"title": title, "genre": genre, "actors": actors}, file)
+        return movie
+
+    def test_empty_model(self):
+        self.assertListEqual(LocalRecommender().recommend(), [])
+
+    def test_similar_unrated_movie_is_suggested(self):
+        suggestions = LocalRecommender(self.movies).recommend()
+        self.assertListEqual([movie for movie, _ in suggestions], [self.space])
+
+    def test_rated_movies_are_not_suggested(self):
+        suggestions = LocalRecommender(self.movies).recommend(limit=10)
+        self.assertNotIn(self.liked, [movie for movie, _ in suggestions])
+
+    def test_excluded_titles(self):
+        suggestions = LocalRecommender(self.movies).recommend(exclude={"aliens"})
+        self.assertListEqual(suggestions, [])
+
+    def test_movie_outside_the_library_is_scored(self):
+        recommender = LocalRecommender(self.movies)
+        candidate = self.movie("Prometheus", 2012, "-", ["Science Fiction", "Horror"], ["Michael Fassbender"])
+        self.assertGreater(recommender.score(candidate), 0)
+        self.assertLess(recommender.score(self.romance), 0)
+        self.assertEqual(recommender.score(Movie("Unknown", 2000)), 0)
+
+    def test_incremental_update_matches_fit(self):
+        recommender = LocalRecommender(self.movies)
+        self.disliked.rating = "5"
+        self.liked.rating = "1"
+        recommender.update(self.disliked)
+        recommender.update(self.liked)
+        self.assertListEqual(recommender.recommend(), LocalRecommender(self.movies).recommend())
+        self.assertEqual(recommender.recommend()[0][0], self.romance)
+
+    def test_remove_movie(self):
+        recommender = LocalRecommender(self.movies)
+        recommender.remove(self.liked)
+        self.assertEqual(len(recommender), 3)
+        self.assertListEqual(recommender.recommend(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from packages.logic.metrics import Histogram, MetricsRegistry, metric_key
+
+
+class HistogramChecker(unittest.TestCase):
+
+    def test_quantiles_are_interpolated_within_buckets(self):
+        histogram = Histogram()
+        for value in [0.002] * 9 + [0.3]:
+            histogram.observe(value)
+        self.assertAlmostEqual(histogram.quantile(0.5), 0.002 + 0.0005 * 5 / 9)
+        self.assertAlmostEqual(histogram.quantile(0.99), 0.25 + 0.05 * 0.9)
+        self.assertEqual(histogram.snapshot()["count"], 10)
+
+    def test_median_is_not_the_maximum(self):
+        histogram = Histogram()
+        for milliseconds in range(1, 101):
+            histogram.observe(milliseconds / 1000)
+        self.assertAlmostEqual(histogram.quantile(0.5), 0.05)
+        self.assertAlmostEqual(histogram.quantile(0.9), 0.09)
+        self.assertAlmostEqual(histogram.quantile(1), 0.1)
+        self.assertAlmostEqual(histogram.quantile(0), 0.001)
+
+    def test_long_values_go_to_the_last_bucket(self):
+        histogram = Histogram()
+        histogram.observe(60)
+        self.assertEqual(histogram.buckets[-1], 1)
+        self.assertEqual(histogram.quantile(0.5), 60)
+
+
+class MetricsRegistryChecker(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_labels_are_part_of_the_key(self):
+        self.assertEqual(metric_key("http.requests", {"status": 200, "host": "a"}), "http.requests{host=a,status=200}")
+        self.registry.increment("http.requests", host="a")
+        self.registry.increment("http.requests", host="a")
+        self.registry.increment("http.requests", host="b")
+        self.assertDictEqual(self.registry.snapshot()["counters"],
+                             {"http.requests{host=a}": 2, "http.requests{host=b}": 1})
+
+    def test_timer_records_even_on_error(self):
+        with self.assertRaises(ValueError), self.registry.timer("job"):
+            raise ValueError
+        self.assertEqual(self.registry.snapshot()["histograms"]["job"]["count"], 1)
+
+    def test_dump_is_json(self):
+        self.registry.set_gauge("jobs.queued", 3)
+        with tempfile.TemporaryDirectory() as folder:
+            path = self.registry.dump(Path(folder) / "metrics.json")
+            self.assertEqual(json.loads(path.read_text(encoding="UTF-8"))["gauges"], {"jobs.queued": 3})
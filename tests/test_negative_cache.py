@@ -0,0 +1,76 @@
+import tempfile
+import threading
+import unittest
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from packages.logic import data_retrieve
+from packages.logic.movie import Movie
+from packages.logic.negative_cache import NegativeCache, negative_cache, normalize_url
+from packages.logic.network import HttpClient
+from tests import UserFolderTestCase
+from tests.test_network import StatusHandler
+
+
+class NormalizeUrlChecker(unittest.TestCase):
+
+    def test_equivalent_urls_share_a_key(self):
+        self.assertEqual(normalize_url("HTTPS://Example.com/search/?q=Alien&imdb=0#top"),
+                         normalize_url("https://example.com/search?imdb=0&q=alien"))
+
+    def test_paths_stay_case_sensitive(self):
+        self.assertNotEqual(normalize_url("http://example.com/Alien.jpg"),
+                            normalize_url("http://example.com/alien.jpg"))
+
+
+class NegativeCacheChecker(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "negative_cache.json"
+        self.cache = NegativeCache(self.path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_entries_expire(self):
+        with patch("packages.logic.negative_cache.time", return_value=0):
+            self.cache.add("http://example.com/a", time_to_live=10)
+            self.assertIn("http://example.com/a", self.cache)
+        with patch("packages.logic.negative_cache.time", return_value=11):
+            self.assertNotIn("http://example.com/a", self.cache)
+
+    def test_entries_are_persistent(self):
+        self.cache.add("http://example.com/a")
+        self.cache.save()
+        self.assertIn("http://EXAMPLE.com/a", NegativeCache(self.path))
+
+    def test_client_skips_known_misses(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), StatusHandler)
+        server.hits = 0
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/404"
+        try:
+            client = HttpClient(negative_cache=self.cache)
+            self.assertEqual(client.fetch(url).status_code, 404)
+            self.assertIsNone(client.fetch(url))
+            self.assertEqual(server.hits, 1)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class SoftMissChecker(UserFolderTestCase):
+
+    def test_page_without_the_expected_content_is_a_short_lived_miss(self):
+        consent_page = Mock(status_code=200, text="<html>Before you continue to YouTube</html>")
+        with patch.object(data_retrieve, "fetch", return_value=consent_page), \
+                patch("packages.logic.negative_cache.time", return_value=0):
+            self.assertEqual(data_retrieve.MovieScraper(Movie("Heat", 1995)).get_youtube_link(), "")
+
+        url = "https://www.youtube.com/results?search_query=Heat+1995+trailer"
+        with patch("packages.logic.negative_cache.time", return_value=NegativeCache.soft_time_to_live - 1):
+            self.assertIn(url, negative_cache())
+        with patch("packages.logic.negative_cache.time", return_value=NegativeCache.soft_time_to_live + 1):
+            self.assertNotIn(url, negative_cache())
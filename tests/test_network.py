@@ -0,0 +1,89 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from packages.logic.network import CircuitBreaker, HttpClient
+
+
+class StatusHandler(BaseHTTPRequestHandler):
+    """Answers with the status found in the path, e.g. /503."""
+
+    def do_GET(self):
+        self.server.hits += 1
+        self.send_response(int(self.path.strip("/")))
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def log_message(self, *_):
+        pass
+
+
+class CircuitBreakerChecker(unittest.TestCase):
+
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=2, cool_down=60)
+        breaker.record_failure()
+        self.assertTrue(breaker.allow())
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.open)
+        self.assertFalse(breaker.allow())
+
+    def test_success_resets_the_failures(self):
+        breaker = CircuitBreaker(failure_threshold=2, cool_down=60)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.closed)
+
+    def test_single_probe_when_half_open(self):
+        breaker = CircuitBreaker(failure_threshold=1, cool_down=0)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.half_open)
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.closed)
+
+
+class FetchChecker(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StatusHandler)
+        self.server.hits = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}/"
+        self.original_backoff = HttpClient.backoff_base
+        HttpClient.backoff_base = 0.001
+
+    def tearDown(self):
+        HttpClient.backoff_base = self.original_backoff
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_not_found_is_not_retried(self):
+        client = HttpClient()
+        self.assertEqual(client.fetch(self.base_url + "404").status_code, 404)
+        self.assertEqual(self.server.hits, 1)
+
+    def test_retryable_error_is_retried(self):
+        client = HttpClient(failure_threshold=10)
+        self.assertEqual(client.fetch(self.base_url + "503", retries=2).status_code, 503)
+        self.assertEqual(self.server.hits, 3)
+
+    def test_open_circuit_skips_the_host(self):
+        client = HttpClient(failure_threshold=2, cool_down=60)
+        client.fetch(self.base_url + "403")
+        client.fetch(self.base_url + "403")
+        self.assertIsNone(client.fetch(self.base_url + "200"))
+        self.assertEqual(self.server.hits, 2)
+        self.assertDictEqual(client.states(), {self.base_url[7:-1]: CircuitBreaker.open})
+
+    def test_probe_returns_the_first_existing_url(self):
+        client = HttpClient(failure_threshold=10)
+        self.assertEqual(client.probe([self.base_url + status for status in ("404", "503", "204", "200")]),
+                         self.base_url + "204")
+        self.assertEqual(client.probe([self.base_url + "405"]), self.base_url + "405")
+        self.assertIsNone(client.probe([self.base_url + "404", self.base_url + "410"]))
@@ -0,0 +1,56 @@
+import pstats
+import time
+from unittest.mock import patch
+
+from packages.constants import constants
+from packages.logic import profiling
+from tests import UserFolderTestCase
+
+
+def busy_function():
+    end = time.perf_counter() + 0.05
+    while time.perf_counter() < end:
+        pass
+
+
+class ProfilingChecker(UserFolderTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.folder = constants.PATHS["profiles"]
+        self.modes = profiling.enabled()
+
+    def tearDown(self):
+        profiling._modes = self.modes
+        super().tearDown()
+
+    def test_nothing_is_written_when_off(self):
+        profiling.enable(None)
+        with profiling.profile("job"):
+            busy_function()
+        self.assertFalse(self.folder.exists())
+
+    def test_unknown_modes_are_ignored(self):
+        self.assertEqual(profiling.enable("cProfile, flame"), frozenset({"cprofile"}))
+
+    def test_both_profiles_are_written(self):
+        profiling.enable("cprofile,sample")
+        profiling.profile("job")(busy_function)()
+        pstats_file = next(self.folder.glob("job-*.pstats"))
+        self.assertTrue(any(function[2] == "busy_function" for function in pstats.Stats(str(pstats_file)).stats))
+        self.assertIn("test_profiling:busy_function", next(self.folder.glob("job-*.collapsed")).read_text())
+
+    def test_nested_blocks_are_part_of_the_outer_profile(self):
+        profiling.enable("cprofile")
+        with profiling.profile("outer"), profiling.profile("inner"):
+            busy_function()
+        self.assertListEqual([file.name.split("-")[0] for file in self.folder.iterdir()], ["outer"])
+
+    def test_old_profiles_are_rotated(self):
+        profiling.enable("cprofile")
+        with patch("packages.logic.profiling.MAX_PROFILES", 2):
+            for _ in range(4):
+                with profiling.profile("job"):
+                    pass
+                time.sleep(0.01)
+        self.assertEqual(len(list(self.folder.iterdir())), 2)
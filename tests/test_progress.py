@@ -0,0 +1,85 @@
+import threading
+import unittest
+
+from PySide6.QtCore import QCoreApplication
+
+from packages.logic import data_retrieve
+from packages.logic.movie import Movie
+from packages.logic.progress import ProgressReporter
+from packages.logic.qthread import ScraperThread
+from tests import UserFolderTestCase
+
+application = QCoreApplication.instance() or QCoreApplication()
+
+
+class ProgressReporterChecker(unittest.TestCase):
+
+    def setUp(self):
+        self.updates = []
+        self.progress = ProgressReporter(4, listener=lambda progress: self.updates.append(
+            (progress.done, progress.total, progress.bytes)))
+
+    def test_every_update_calls_the_listener(self):
+        self.progress.advance()
+        self.progress.add_bytes(1024)
+        self.progress.advance(2)
+        self.progress.set_total(5)
+        self.assertListEqual(self.updates, [(1, 4, 0), (1, 4, 1024), (3, 4, 1024), (3, 5, 1024)])
+
+    def test_fraction(self):
+        self.assertEqual(self.progress.fraction, 0.0)
+        self.progress.advance(3)
+        self.assertEqual(self.progress.fraction, 0.75)
+        self.progress.advance(3)
+        self.assertEqual(self.progress.fraction, 1.0)
+        self.assertEqual(ProgressReporter().fraction, 0.0)
+
+    def test_updates_from_several_threads(self):
+        progress = ProgressReporter(400)
+        workers = [threading.Thread(target=lambda: [(progress.advance(), progress.add_bytes(10)) for _ in range(100)])
+                   for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        self.assertEqual((progress.done, progress.bytes), (400, 4000))
+
+
+class FakeScraper(data_retrieve.MovieScraper):
+    """Reports a downloaded poster without any request, fails on demand."""
+
+    def download_poster(self, *_):
+        self.progress.add_bytes(2048)
+
+    def download_info(self):
+        pass
+
+    def get_youtube_link(self):
+        raise ConnectionError("Offline")
+
+
+class ScraperThreadChecker(UserFolderTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.thread = ScraperThread()
+        self.signals = []
+        self.thread.progress_changed.connect(lambda *values: self.signals.append(values))
+        self.thread.thread_finished.connect(lambda: self.signals.append("finished"))
+        self.thread.thread_failed.connect(lambda error: self.signals.append(error))
+
+    def test_progress_is_signalled(self):
+        self.thread.define_thread_settings(FakeScraper(Movie("Heat", 1995)), ("download_poster", None),
+                                           ("download_info", None))
+        self.thread.run()
+        self.assertListEqual(self.signals, [(0, 2, 2048), (1, 2, 2048), (2, 2, 2048), "finished"])
+
+    def test_failure_stops_the_progress(self):
+        self.thread.define_thread_settings(FakeScraper(Movie("Heat", 1995)), ("get_youtube_link", None),
+                                           ("download_poster", None))
+        self.thread.run()
+        self.assertListEqual(self.signals, ["Offline"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from packages.logic.recommendation_store import RecommendationStore
+
+
+class PublishChecker(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = RecommendationStore(folder=Path(self.directory.name) / "recommendations")
+        self.posters = Path(self.directory.name) / "staging"
+        self.posters.mkdir()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def publish(self, *titles):
+        suggestions = []
+        for index, title in enumerate(titles):
+            poster = RecommendationStore.poster_filename(title)
+            (self.posters / poster).write_bytes(b"poster")
+            suggestions.append({"title": title, "trailer": f"https://example.com/{index}", "poster": poster,
+                                "score": index})
+        self.store.publish(suggestions, posters_dir=self.posters)
+
+    def test_empty_store(self):
+        self.assertListEqual(self.store.current(), [])
+        self.assertSetEqual(self.store.seen_titles(), set())
+
+    def test_more_than_three_suggestions(self):
+        self.publish("Movie A", "Movie B", "Movie C", "Movie D", "Movie E")
+        self.assertEqual(len(self.store.current()), 5)
+
+    def test_current_sorted_by_score(self):
+        self.publish("Movie A", "Movie B", "Movie C")
+        self.assertListEqual([entry["title"] for entry in self.store.current()], ["Movie C", "Movie B", "Movie A"])
+
+    def test_non_ascii_title(self):
+        self.publish("Amélie", "Léon", "千と千尋の神隠し")
+        self.assertEqual(len(self.store.current()), 3)
+
+    def test_old_posters_are_removed(self):
+        self.publish("Movie A", "Movie B")
+        self.publish("Movie C")
+        self.assertEqual(len(list(self.store.folder.glob("*.jpg"))), 1)
+
+    def test_history_is_kept_for_dedup(self):
+        self.publish("Movie A", "Movie B")
+        self.publish("Movie C")
+        self.assertSetEqual(self.store.seen_titles(), {"movie a", "movie b", "movie c"})
+
+    def test_history_is_bounded(self):
+        for i in range(RecommendationStore.history_limit + 10):
+            self.store.publish([{"title": f"Movie {i}"}])
+        self.assertEqual(len(self.store.load()["history"]), RecommendationStore.history_limit)
+
+
+if __name__ == '__main__':
+    unittest.main()
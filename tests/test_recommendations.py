@@ -0,0 +1,143 @@
+import json
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from packages.logic import recommendations
+from packages.logic.movie import Movie
+from packages.logic.recommendation_store import RecommendationStore
+from tests import UserFolderTestCase
+
+
+class FakeScraper:
+    """Stands for MovieScraper: recommends numbered titles after a delay and writes a dummy poster."""
+
+    delay: float = 0.0
+    poster_delay: float = 0.0
+    release: threading.Event | None = None  # If set, lookups block until it is set.
+    prefix: str = "Suggestion"
+    titles: list | None = None  # If set, recommended instead of the numbered titles.
+    writes_after_removal: list = []
+
+    def __init__(self, movie: Movie):
+
+        self.movie = movie
+
+    def get_recommendations(self) -> list[str]:
+
+        if FakeScraper.release is not None:
+            FakeScraper.release.wait(5)
+        time.sleep(FakeScraper.delay)
+        if FakeScraper.titles is not None:
+            return list(FakeScraper.titles)
+        return [f"{FakeScraper.prefix} {self.movie.title} {rank}" for rank in range(3)]
+
+    def get_youtube_link(self, year: bool = True) -> str:
+
+        return "https://www.youtube.com/embed/trailer"
+
+    def download_poster(self, override=False, dir_path=None, filename="thumb.jpg", year=True, deadline=None):
+
+        time.sleep(FakeScraper.poster_delay)
+        if not dir_path.exists():
+            FakeScraper.writes_after_removal.append(filename)
+            return
+        (dir_path / filename).write_bytes(b"poster")
+
+
+class RecommendationEngineChecker(UserFolderTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.store = RecommendationStore()
+        self.movies = [Movie(f"Movie {index}", 2000) for index in range(3)]
+        FakeScraper.delay, FakeScraper.poster_delay, FakeScraper.release = 0.0, 0.0, None
+        FakeScraper.prefix, FakeScraper.titles = "Suggestion", None
+        FakeScraper.writes_after_removal = []
+        self.patches = [patch.object(recommendations, "MovieScraper", FakeScraper),
+                        patch.object(recommendations, "load_all_movies", lambda: list(self.movies)),
+                        patch.object(recommendations, "POLL_INTERVAL", 0.02)]
+        for patcher in self.patches:
+            patcher.start()
+
+    def tearDown(self):
+        if FakeScraper.release is not None:
+            FakeScraper.release.set()
+        for patcher in self.patches:
+            patcher.stop()
+        super().tearDown()
+
+    def staging_folders(self):
+        return list(Path(self.store.folder).glob(".run-*"))
+
+    def test_slow_scraper_publishes_within_the_deadline(self):
+        FakeScraper.delay = FakeScraper.poster_delay = 0.2
+        result = recommendations.RecommendationEngine(store=self.store, deadline=5).start().result(10)
+        self.assertEqual(len(result.suggestions), recommendations.MAX_SUGGESTIONS)
+        self.assertTrue(result.published)
+        self.assertFalse(result.timed_out)
+        self.assertEqual(len(self.store.current()), recommendations.MAX_SUGGESTIONS)
+        self.assertListEqual(self.staging_folders(), [])
+
+    def test_cancelled_run_publishes_nothing(self):
+        FakeScraper.release = threading.Event()
+        run = recommendations.RecommendationEngine(store=self.store).start()
+        run.cancel()
+        FakeScraper.release.set()
+        result = run.result(10)
+        self.assertTrue(run.done())
+        self.assertTrue(result.cancelled)
+        self.assertFalse(result.published)
+        self.assertListEqual(self.store.current(), [])
+        self.assertListEqual(self.staging_folders(), [])
+
+    def test_run_missing_its_deadline(self):
+        FakeScraper.poster_delay = 0.5
+        result = recommendations.RecommendationEngine(store=self.store, deadline=0.2).start().result(10)
+        self.assertTrue(result.timed_out)
+        self.assertFalse(result.published)
+        self.assertListEqual(self.store.current(), [])
+        self.assertListEqual(self.staging_folders(), [])
+        time.sleep(FakeScraper.poster_delay)
+        self.assertListEqual(FakeScraper.writes_after_removal, [])
+
+    def test_only_the_newer_of_overlapping_runs_publishes(self):
+        engine = recommendations.RecommendationEngine(store=self.store, deadline=5)
+        FakeScraper.release = threading.Event()
+        FakeScraper.prefix = "Older"
+        older = engine.start()
+        time.sleep(0.05)
+
+        FakeScraper.prefix = "Newer"
+        newer = engine.start()
+        FakeScraper.release.set()
+        self.assertTrue(older.cancelled())
+        self.assertFalse(older.result(10).published)
+        self.assertTrue(newer.result(10).published)
+        self.assertTrue(all(entry["title"].startswith("Newer") for entry in self.store.current()))
+
+    def test_online_candidates_are_ranked_by_the_local_model(self):
+        def cached_movie(title, rating, genre):
+            movie = Movie(title, 2000, rating=rating)
+            movie.storage.mkdir(parents=True, exist_ok=True)
+            movie.data_file.write_text(json.dumps({"genre": genre, "actors": ["Sigourney Weaver"]}), encoding="UTF-8")
+            movie.thumb.write_bytes(b"poster")
+            return movie
+
+        self.movies = [cached_movie("Alien", "5", ["Science Fiction", "Horror"]),
+                       cached_movie("Aliens", "-", ["Science Fiction", "Action"])]
+        cached_movie("Prometheus", "-", ["Science Fiction", "Horror"]).thumb.unlink()
+        FakeScraper.titles = ["Prometheus", "Paddington"]
+
+        result = recommendations.RecommendationEngine(store=self.store, deadline=5).start().result(10)
+        self.assertTrue(result.published)
+        self.assertListEqual([entry["title"] for entry in self.store.current()], ["Prometheus", "Aliens", "Paddington"])
+        self.assertListEqual([entry["source"] for entry in self.store.current()], ["tastedive", "local", "tastedive"])
+
+    def test_stale_run_cannot_publish(self):
+        engine = recommendations.RecommendationEngine(store=self.store)
+        stale = recommendations.RecommendationRun(engine)
+        engine._current_run = recommendations.RecommendationRun(engine)
+        self.assertFalse(engine._publish(self.root, stale, [{"title": "Stale", "poster": "x.jpg"}]))
+        self.assertListEqual(self.store.load()["current"], [])
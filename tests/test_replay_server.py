@@ -0,0 +1,53 @@
+import json
+import unittest
+import urllib.error
+import urllib.request
+
+from benchmarks.fixtures import build_fixtures
+from benchmarks.replay_server import ReplayServer
+
+
+def status(url: str, method: str = "GET") -> int:
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, method=method), timeout=5) as response:
+            return response.status
+    except urllib.error.HTTPError as error:
+        return error.code
+
+
+class ReplayServerChecker(unittest.TestCase):
+
+    def test_fixture_is_served_with_rewritten_links(self):
+        with ReplayServer() as server:
+            with urllib.request.urlopen(server.sources["SC"] + "movies/the-matrix-1999", timeout=5) as response:
+                self.assertEqual(response.headers["Content-Type"], "text/html")
+                content = response.read().decode("UTF-8")
+            with urllib.request.urlopen(server.wikipedia_api + "?action=query", timeout=5) as response:
+                pages = json.load(response)["query"]["pages"]
+
+        self.assertIn(f'data-src="{server.sources["SC"]}media/posters/md/matrix.jpg"', content)
+        self.assertNotIn("https://www.cinematerial.com/", content)
+        self.assertEqual(pages[0]["title"], "The Matrix")
+
+    def test_unknown_path_is_not_found(self):
+        with ReplayServer() as server:
+            self.assertEqual(status(server.base_url + "SC/unknown"), 404)
+
+    def test_errors_are_injected_at_the_configured_rate(self):
+        with ReplayServer(error_rate=0.25, seed=1) as server:
+            statuses = [status(server.sources["SD"] + "results?search_query=matrix", "HEAD") for _ in range(200)]
+        self.assertEqual(server.requests, 200)
+        self.assertEqual(set(statuses), {200, 503})
+        self.assertAlmostEqual(statuses.count(503) / 200, 0.25, delta=0.1)
+
+
+class BuildFixturesChecker(unittest.TestCase):
+
+    def test_fixtures_are_up_to_date(self):
+        for filename, build in build_fixtures.PAGES.items():
+            with self.subTest(filename=filename):
+                self.assertEqual(build(), (build_fixtures.FIXTURES / filename).read_text(encoding="UTF-8"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+
+from packages.logic.collection import Collection
+from packages.logic.movie import Movie
+from packages.logic.search import PrefixIndex, TrigramIndex
+
+
+class PrefixIndexChecker(unittest.TestCase):
+
+    def setUp(self):
+        self.movies = [Movie(title=title, year=2000) for title in ("Matrix", "Alien", "Aliens", "alien nation")]
+        self.index = PrefixIndex(self.movies, key=lambda movie: movie.title)
+
+    def test_empty_query_returns_everything_in_order(self):
+        self.assertListEqual(self.index.search(""), self.movies)
+
+    def test_prefix_is_case_insensitive(self):
+        self.assertListEqual(self.index.search("ALIEN"), self.movies[1:])
+
+    def test_results_keep_list_order(self):
+        self.assertListEqual([movie.title for movie in self.index.search("a")], ["Alien", "Aliens", "alien nation"])
+
+    def test_no_match(self):
+        self.assertListEqual(self.index.search("zzz"), [])
+
+    def test_add_and_remove(self):
+        movie = Movie(title="Apocalypse Now", year=1979)
+        self.index.add(movie)
+        self.assertListEqual(self.index.search("apo"), [movie])
+        self.index.remove(movie)
+        self.assertListEqual(self.index.search("apo"), [])
+        self.assertEqual(len(self.index), 4)
+
+    def test_update_after_rename(self):
+        self.movies[0].rename("Reloaded")
+        self.index.update(self.movies[0])
+        self.assertListEqual(self.index.search("mat"), [])
+        self.assertListEqual(self.index.search("rel"), [self.movies[0]])
+        self.assertListEqual(self.index.search(""), self.movies)
+
+    def test_collection_names(self):
+        collections = [Collection(name="Horror"), Collection(name="My Wishlist")]
+        index = PrefixIndex(collections, key=lambda collection: collection.name)
+        self.assertListEqual(index.search("my"), collections[1:])
+
+
+class TrigramIndexChecker(unittest.TestCase):
+
+    def setUp(self):
+        self.fields = {
+            "The Matrix": {"title": "The Matrix", "actors": "Keanu Reeves Carrie-Anne Moss"},
+            "Speed": {"title": "Speed", "actors": "Keanu Reeves Sandra Bullock"},
+            "Alien": {"title": "Alien", "summary": "The crew of a spaceship meets a deadly creature."}
+        }
+        self.index = TrigramIndex(list(self.fields), fields=self.fields.get)
+
+    def titles(self, query):
+        return [item for item, _ in self.index.search(query)]
+
+    def test_substring_match(self):
+        self.assertListEqual(self.titles("matrix"), ["The Matrix"])
+
+    def test_typo_tolerance(self):
+        self.assertListEqual(self.titles("matrx"), ["The Matrix"])
+
+    def test_actor_match(self):
+        self.assertListEqual(sorted(self.titles("keanu")), ["Speed", "The Matrix"])
+
+    def test_summary_match(self):
+        self.assertListEqual(self.titles("spaceship"), ["Alien"])
+
+    def test_title_ranks_before_summary(self):
+        self.fields["Spaceship"] = {"title": "Spaceship"}
+        self.index.add("Spaceship")
+        self.assertListEqual(self.titles("spaceship"), ["Spaceship", "Alien"])
+
+    def test_unrelated_query(self):
+        self.assertListEqual(self.titles("zebra"), [])
+
+    def test_update_and_remove(self):
+        self.fields["Speed"] = {"title": "Speed", "actors": "Dennis Hopper"}
+        self.index.update("Speed")
+        self.assertListEqual(self.titles("keanu"), ["The Matrix"])
+        self.index.remove("The Matrix")
+        self.assertListEqual(self.titles("keanu"), [])
+        self.assertEqual(len(self.index), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
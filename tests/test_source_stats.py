@@ -0,0 +1,42 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from packages.logic.source_stats import SourceStats
+
+
+class SourceStatsChecker(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "source_stats.json"
+        self.stats = SourceStats(self.path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_unknown_sources_keep_their_order(self):
+        self.assertListEqual(self.stats.order(["SC", "SB", "SA"]), ["SC", "SB", "SA"])
+
+    def test_failing_source_is_tried_last(self):
+        for _ in range(5):
+            self.stats.record("SC", False, 2.0)
+            self.stats.record("SB", True, 0.5, 1000)
+        self.assertListEqual(self.stats.order(["SC", "SB", "SA"]), ["SB", "SA", "SC"])
+
+    def test_old_failures_decay(self):
+        with patch("packages.logic.source_stats.time", return_value=0):
+            for _ in range(10):
+                self.stats.record("SC", False, 2.0)
+        with patch("packages.logic.source_stats.time", return_value=10 * SourceStats.half_life):
+            self.assertLessEqual(self.stats.snapshot()["SC"]["attempts"], 0.01)
+            self.assertAlmostEqual(self.stats.expected_time("SC"), 2 * SourceStats.default_latency, places=1)
+
+    def test_statistics_are_persistent(self):
+        self.stats.record("SB", True, 0.5, 1000)
+        self.stats.save()
+        snapshot = SourceStats(self.path).snapshot()["SB"]
+        self.assertEqual(snapshot["hit_rate"], 1.0)
+        self.assertEqual(snapshot["median_latency"], 0.5)
+        self.assertEqual(snapshot["bytes"], 1000)
@@ -0,0 +1,34 @@
+import json
+
+from benchmarks.synthetic_library import generate_library
+from packages.constants import constants
+from packages.logic import data_import
+from packages.logic.collection import Collection
+from tests import UserFolderTestCase
+
+
+class SyntheticLibraryChecker(UserFolderTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.summary = generate_library(self.root, collections=3, movies=5, orphans=0.2, video_size=1024)
+
+    def test_paths_point_to_the_library(self):
+        self.assertEqual(constants.PATHS["collections"], self.root / "collections")
+        self.assertEqual(constants.STR_PATHS["cache"], str(self.root / "cache"))
+        self.assertEqual(constants.PATHS["icons"].name, "icons")
+
+    def test_library_is_read_by_the_application(self):
+        collections = Collection.retrieve_collections()
+        self.assertListEqual([len(collection.movies) for collection in collections], [5, 5, 5])
+        self.assertEqual(len(data_import.find_movie_files(self.summary["videos"])), 15)
+        self.assertEqual(len(list(constants.PATHS["cache"].glob("*/thumb.jpg"))), 18)
+        self.assertTrue(data_import.load_all_actors())
+
+    def test_same_seed_gives_the_same_library(self):
+        other = self.root / "other"
+        generate_library(other, collections=3, movies=5, orphans=0.2, video_size=1024)
+        for file in (self.root / "collections").glob("*.json"):
+            first = json.loads(file.read_text(encoding="UTF-8"))
+            second = json.loads((other / "collections" / file.name).read_text(encoding="UTF-8"))
+            self.assertListEqual([movie["title"] for movie in first], [movie["title"] for movie in second])
@@ -0,0 +1,87 @@
+import tempfile
+import unittest
+
+from packages.logic.wikipedia_client import WikipediaClient, parse_starring
+
+WIKITEXT = """{{Infobox film
+| name           = The Matrix
+| starring       = {{Plainlist|
+* [[Keanu Reeves]]
+* [[Laurence Fishburne]]
+* [[Carrie-Anne Moss]]<ref>Credits.</ref>
+}}
+| music          = [[Don Davis (composer)|Don Davis]]
+}}
+'''''The Matrix''''' is a 1999 science fiction action film."""
+
+
+class FakeResponse:
+
+    def __init__(self, content):
+        self.content = content
+
+    def json(self):
+        return self.content
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeHttpClient:
+
+    def __init__(self, pages, available=True):
+        self.pages = pages
+        self.available = available
+        self.requests = 0
+
+    def fetch(self, _url, params, headers):
+        self.requests += 1
+        return FakeResponse({"query": {"pages": self.pages}}) if self.available else None
+
+
+class ParseStarringChecker(unittest.TestCase):
+
+    def test_plain_list(self):
+        self.assertListEqual(parse_starring(WIKITEXT), ["Keanu Reeves", "Laurence Fishburne", "Carrie-Anne Moss"])
+
+    def test_inline_list_with_piped_links(self):
+        wikitext = "{{Infobox film\n| starring = {{ubl|[[Al Pacino]]|[[Robert De Niro|De Niro]]}}\n}}"
+        self.assertListEqual(parse_starring(wikitext), ["Al Pacino", "De Niro"])
+
+    def test_missing_field(self):
+        self.assertListEqual(parse_starring("{{Infobox film\n| name = Heat\n}}"), [])
+
+
+class LookupChecker(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_single_request_and_cached_result(self):
+        page = {"title": "The Matrix", "extract": "The Matrix is a 1999 science fiction action film.",
+                "revisions": [{"slots": {"main": {"content": WIKITEXT}}}]}
+        http = FakeHttpClient([page])
+        client = WikipediaClient(folder=self.directory.name, client=http)
+
+        for _ in range(2):
+            result = client.lookup("The Matrix 1999 film")
+            self.assertEqual(result["title"], "The Matrix")
+            self.assertEqual(len(result["actors"]), 3)
+        self.assertEqual(http.requests, 1)
+
+    def test_disambiguation_page_is_a_miss(self):
+        http = FakeHttpClient([{"title": "Heat", "pageprops": {"disambiguation": ""}}])
+        client = WikipediaClient(folder=self.directory.name, client=http)
+        self.assertIsNone(client.lookup("Heat"))
+        self.assertIsNone(client.lookup("Heat"))
+        self.assertEqual(http.requests, 1)
+
+    def test_unavailable_host_is_not_cached(self):
+        http = FakeHttpClient([], available=False)
+        client = WikipediaClient(folder=self.directory.name, client=http)
+        self.assertIsNone(client.lookup("Heat"))
+        self.assertIsNone(client.lookup("Heat"))
+        self.assertEqual(http.requests, 2)